@@ -111,6 +111,10 @@ public class EventLog extends Keyed<EventLog> {
             : Stream.of(_events.clone())
                     .filter(predicate)
                     .toArray(EventLogEntry[]::new);
+    return eventsToTwoDimTable(tableHeader, events);
+  }
+
+  public static TwoDimTable eventsToTwoDimTable(String tableHeader, EventLogEntry[] events) {
     TwoDimTable table = EventLogEntry.makeTwoDimTable(tableHeader, events.length);
     for (int i = 0; i < events.length; i++)
       events[i].addTwoDimTableRow(table, i);
@@ -18,6 +18,10 @@ public class RegisterRestApi extends AbstractRegister {
             "GET /99/AutoML/{automl_id}", AutoMLHandler.class, "fetch",
             "Fetch the specified AutoML object.");
 
+    context.registerEndpoint("automl_events",
+            "GET /99/AutoML/{automl_id}/events", AutoMLHandler.class, "events",
+            "Return the progress of the specified AutoML run and the events logged after the given offset.");
+
     context.registerEndpoint("leaderboards",
             "GET /99/Leaderboards", LeaderboardsHandler.class, "list",
             "Return all the AutoML leaderboards.");
@@ -3,6 +3,7 @@ package water.automl.api;
 import ai.h2o.automl.AutoML;
 import water.*;
 import water.api.Handler;
+import water.automl.api.schemas3.AutoMLEventsV99;
 import water.automl.api.schemas3.AutoMLV99;
 import water.exceptions.H2OKeyNotFoundArgumentException;
 
@@ -13,14 +14,27 @@ public class AutoMLHandler extends Handler {
   @SuppressWarnings("unused") // called through reflection by RequestServer
   /** Return an AutoML object by ID. */
   public AutoMLV99 fetch(int version, AutoMLV99 autoMLV99) {
-    AutoML autoML = DKV.getGet(autoMLV99.automl_id.name);
+    return autoMLV99.fillFromImpl(getAutoML(autoMLV99.automl_id.name));
+  }
+
+  @SuppressWarnings("unused") // called through reflection by RequestServer
+  /** Return the progress of an AutoML run and the events logged after the given offset. */
+  public AutoMLEventsV99 events(int version, AutoMLEventsV99 autoMLEventsV99) {
+    AutoML autoML = getAutoML(autoMLEventsV99.automl_id.name);
+    if (autoML == null)
+      throw new H2OKeyNotFoundArgumentException(autoMLEventsV99.automl_id.name);
+    return autoMLEventsV99.fillFromImpl(autoML);
+  }
+
+  private static AutoML getAutoML(final String automl_id) {
+    AutoML autoML = DKV.getGet(automl_id);
     if (autoML == null) {
-      AutoML[] amls = fetchAllForProject(autoMLV99.automl_id.name);
+      AutoML[] amls = fetchAllForProject(automl_id);
       if (amls.length > 0) {
         autoML = Stream.of(amls).max(AutoML.byStartTime).get();
       }
     }
-    return autoMLV99.fillFromImpl(autoML);
+    return autoML;
   }
 
   private static AutoML[] fetchAllForProject(final String project_name) {
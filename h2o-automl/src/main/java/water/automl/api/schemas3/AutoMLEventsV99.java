@@ -0,0 +1,68 @@
+package water.automl.api.schemas3;
+
+import ai.h2o.automl.AutoML;
+import ai.h2o.automl.events.EventLog;
+import ai.h2o.automl.events.EventLogEntry;
+import water.Job;
+import water.api.API;
+import water.api.schemas3.SchemaV3;
+import water.api.schemas3.TwoDimTableV3;
+import water.logging.LoggingLevel;
+
+import java.util.Arrays;
+import java.util.function.Predicate;
+import java.util.stream.Stream;
+
+/**
+ * Lightweight view of a running AutoML: its progress and the events logged after a given offset,
+ * so that clients polling the run don't have to fetch the full event log and leaderboard each time.
+ */
+public class AutoMLEventsV99 extends SchemaV3<AutoML, AutoMLEventsV99> {
+
+  @API(help="AutoML run ID", direction=API.Direction.INPUT)
+  public AutoMLV99.AutoMLKeyV3 automl_id;
+
+  @API(help="Verbosity level of the returned events", direction=API.Direction.INOUT,
+          valuesProvider= EventLogEntryV99.LevelProvider.class)
+  public LoggingLevel verbosity;
+
+  @API(help="Number of events (matching the verbosity) to skip, usually the events_count returned by the previous request",
+          direction=API.Direction.INOUT)
+  public int events_offset;
+
+  @API(help="Total number of events matching the verbosity, to be used as the offset of the next request", direction=API.Direction.OUTPUT)
+  public int events_count;
+
+  @API(help="Progress of the AutoML run, between 0 and 1", direction=API.Direction.OUTPUT)
+  public float progress;
+
+  @API(help="Whether the AutoML run is still running", direction=API.Direction.OUTPUT)
+  public boolean running;
+
+  @API(help="The events logged after the given offset, for easy rendering", direction=API.Direction.OUTPUT)
+  public TwoDimTableV3 event_log_table;
+
+  @Override public AutoMLEventsV99 fillFromImpl(AutoML autoML) {
+    super.fillFromImpl(autoML, new String[] { "verbosity", "events_offset", "events_count", "progress", "running", "event_log_table" });
+
+    automl_id = new AutoMLV99.AutoMLKeyV3(autoML._key);
+
+    Job<AutoML> job = autoML.job();
+    progress = job == null ? 1 : job.progress();
+    running = job != null && job.isRunning();
+
+    EventLog eventLog = autoML.eventLog();
+    if (null == eventLog) {
+      eventLog = new EventLog(autoML._key);
+    }
+    Predicate<EventLogEntry> predicate = (e) -> verbosity == null || e.getLevel().ordinal() >= verbosity.ordinal();
+    // a single snapshot of the events, so that the count is consistent with the returned events
+    EventLogEntry[] events = Stream.of(eventLog._events.clone())
+            .filter(predicate)
+            .toArray(EventLogEntry[]::new);
+    events_count = events.length;
+    EventLogEntry[] newEvents = Arrays.copyOfRange(events, Math.min(Math.max(events_offset, 0), events_count), events_count);
+    event_log_table = new TwoDimTableV3().fillFromImpl(EventLog.eventsToTwoDimTable("Event Log for:" + autoML._key, newEvents));
+    return this;
+  }
+}
@@ -16,8 +16,11 @@ __no_export = set(dir())  # variables defined above this are not exported
 
 from h2o.h2o import (connect, init, api, connection, resume,
                      lazy_import, upload_file, import_file, import_sql_table, import_sql_select, import_hive_table,
-                     parse_setup, parse_raw, assign, deep_copy, models, get_model, get_grid, get_frame,
+                     parse_setup, parse_raw, assign, deep_copy, models, get_model, get_models, get_grid, get_frame,
                      show_progress, no_progress, enable_expr_optimizations, is_expr_optimizations_enabled,
+                     enable_deferred_tmp_removal, flush_tmp_removals, batch,
+                     enable_scalar_result_cache, scalar_result_cache_stats,
+                     enable_model_cache, model_cache_stats, clear_model_cache,
                      log_and_echo, remove, remove_all, rapids,
                      ls, frame, frames, create_frame, load_frame,
                      download_pojo, download_csv, download_all_logs, save_model, download_model, upload_model, load_model,
@@ -78,6 +81,12 @@ try:
 except ImportError:
     pass
 
+try:
+    # The asyncio interface relies on the async/await syntax (Py 3.5+)
+    from h2o import aio
+except SyntaxError:
+    pass
+
 
 __all__ = [s for s in dir()
            if not s.startswith('_') 
@@ -0,0 +1,121 @@
+# -*- encoding: utf-8 -*-
+"""
+Asynchronous (asyncio) interface to the H2O server.
+
+The coroutines of this module are the non-blocking counterparts of the usual client calls::
+
+    res = await h2o.aio.api("GET /3/Frames")
+    await job.wait()                       # instead of job.poll()
+    await estimator.train_async(x, y, training_frame=train)
+    await frame.refresh_async()
+
+They are built on top of the regular :class:`H2OConnection` (requests are sent and responses processed exactly as
+for :func:`h2o.api`), but the blocking REST calls are delegated to the event loop's executor, and waiting for
+jobs is done with ``asyncio.sleep`` instead of blocking the thread. A single event loop can therefore keep many
+model builds and predictions in flight, e.g. using ``asyncio.gather``.
+
+The connection used is the one returned by :func:`h2o.connection` in the context of the calling coroutine, so
+a task may use its own connection thanks to :func:`h2o.utils.threading.local_context`.
+
+This module requires Python 3.5+.
+
+:copyright: (c) 2016 H2O.ai
+:license:   Apache License Version 2.0 (see LICENSE for details)
+"""
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import asyncio
+import functools as ft
+
+try:
+    from contextvars import copy_context  # Py 3.7+
+except ImportError:
+    copy_context = None
+
+import h2o
+
+__all__ = ("api", "wait", "train", "refresh")
+
+# Job polling intervals (in seconds): polling starts fast, then slows down progressively for long-running jobs.
+_MIN_POLL_INTERVAL = 0.2
+_MAX_POLL_INTERVAL = 2.0
+_POLL_BACKOFF = 1.5
+
+
+async def api(endpoint, data=None, json=None, filename=None, save_to=None):
+    """
+    Perform a REST API request to a previously connected server, without blocking the event loop.
+
+    This is the asyncio counterpart of :func:`h2o.api`, and it has the same parameters.
+
+    :returns: a coroutine resolving to the server's response.
+
+    :examples:
+
+    >>> res = await h2o.aio.api("GET /3/NetworkTest")
+    >>> res["table"].show()
+    """
+    return await _run_sync(h2o.api, endpoint, data=data, json=json, filename=filename, save_to=save_to)
+
+
+async def wait(job):
+    """
+    Wait until the given job finishes, without blocking the event loop.
+
+    If the awaiting task is cancelled, then the job is cancelled on the server as well.
+
+    :param H2OJob job: the job to wait for.
+    :returns: the job itself once it is done.
+    :raises H2OJobCancelled: if the job was cancelled.
+    :raises EnvironmentError: if the job failed.
+    """
+    interval = _MIN_POLL_INTERVAL
+    try:
+        status = await _run_sync(job._refresh_job_status_quietly)
+        while status in job._RUNNING_STATES:
+            await asyncio.sleep(interval)
+            interval = min(interval * _POLL_BACKOFF, _MAX_POLL_INTERVAL)
+            status = await _run_sync(job._refresh_job_status_quietly)
+    except asyncio.CancelledError:
+        await _run_sync(job.cancel)
+        raise
+    return job._finish()
+
+
+async def train(estimator, x=None, y=None, training_frame=None, **params):
+    """
+    Train the given estimator, without blocking the event loop.
+
+    :param H2OEstimator estimator: the estimator to train.
+    :param params: the same parameters as for :meth:`H2OEstimator.train`.
+    :returns: the trained estimator.
+    """
+    await _run_sync(estimator.start, x, y=y, training_frame=training_frame, **params)
+    job = estimator._job
+    try:
+        await wait(job)
+    finally:
+        estimator._future = False
+        estimator._job = None
+    model_json = (await api("GET /%d/Models/%s" % (estimator._rest_version, job.dest_key)))["models"][0]
+    estimator._resolve_model(job.dest_key, model_json)
+    return estimator
+
+
+async def refresh(frame):
+    """
+    Reload the frame information from the server, without blocking the event loop.
+
+    :param H2OFrame frame: the frame to refresh.
+    :returns: the refreshed frame.
+    """
+    await _run_sync(frame.refresh)
+    return frame
+
+
+async def _run_sync(fn, *args, **kwargs):
+    """Run a blocking function in the executor of the current event loop, in the context of the caller."""
+    call = ft.partial(fn, *args, **kwargs)
+    if copy_context is not None:
+        call = ft.partial(copy_context().run, call)
+    return await asyncio.get_event_loop().run_in_executor(None, call)
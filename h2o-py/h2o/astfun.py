@@ -8,11 +8,16 @@ Disassembly support.
 from __future__ import absolute_import, division, print_function, unicode_literals
 from h2o.utils.compatibility import *
 
+from collections import OrderedDict, deque
 import dis
 import inspect
+import threading
+import weakref
 
 from . import h2o
 from .expr import ExprNode, ASTId
+from .utils.shared_utils import _is_fr
+from .utils.threading import local_context, local_env
 
 #
 # List of supported bytecode instructions: cf. https://docs.python.org/3/library/dis.html#python-bytecode-instructions
@@ -190,10 +195,137 @@ def _get_instr(ops, idx=0, argpos=0):
     return instr, args[argpos] if args else None
 
 
+#
+# Cache of the translated lambdas (LRU): disassembled bytecode by code object, and Rapids ASTs
+# by code object and identity of the values of the outer variables (free and global variables).
+# The captured frames are only weakly referenced by the cache, so that the frames dropped by the user are collected
+# (and their temporary frames removed from the backend): the entry of a lambda is dropped once one of its captured
+# frames is collected.
+#
+LAMBDA_CACHE_SIZE = 128
+_disassembled_lambdas = OrderedDict()  # code -> (disassembled code, names of the outer variables)
+_translated_lambdas = OrderedDict()  # (code, identities of the outer variables) -> (outer variables, AST template)
+_collected_lambdas = deque()  # keys of the translated lambdas whose captured frames were collected
+_lambda_cache_lock = threading.Lock()
+
+
 def lambda_to_expr(fun):
+    """
+    Translate a lambda into a Rapids function.
+
+    Translations are cached, so applying the same lambda again doesn't disassemble and translate its bytecode again.
+    A cached translation is used only if the outer variables of the lambda still refer to the same objects: it is
+    thus never used after a captured variable is reassigned. The captured frames are replaced by their current
+    expressions in each use of a cached translation.
+
+    :param fun: the lambda to translate.
+    :returns: the Rapids function, as a list of AST nodes.
+    """
     code = fun.__code__
-    lambda_dis = _disassemble_lambda(code)
-    return _lambda_bytecode_to_ast(code, lambda_dis)
+    disassembled = _lru_get(_disassembled_lambdas, code)
+    if disassembled is None:
+        lambda_dis = _disassemble_lambda(code)
+        outer_names = [args[0] for instr, args in lambda_dis
+                       if is_load_outer_scope(instr) and args[0] not in ("True", "False")]
+        disassembled = _lru_put(_disassembled_lambdas, code, (lambda_dis, tuple(OrderedDict.fromkeys(outer_names))))
+    lambda_dis, outer_names = disassembled
+    scope = _OuterScope(fun, outer_names)
+    values = tuple(scope.values.get(name) for name in outer_names)
+    key = (code,) + tuple(id(v) for v in values)
+    translated = _lru_get(_translated_lambdas, key)
+    if translated is not None and not all(_referent(ref) is v for ref, v in zip(translated[0], values)):
+        translated = None  # a captured frame was collected, and its id reused
+    if translated is None:
+        with local_context(lambda_outer_scope=scope):
+            ast = _lambda_bytecode_to_ast(code, lambda_dis)
+        if scope.from_stack:  # the translation depends on the calling frames, it cannot be reused
+            return ast
+        captured = {}
+        for i, v in enumerate(values):
+            if _is_fr(v):
+                captured[id(v)] = _CapturedFrame(i, expr=False)
+                captured[id(v._ex)] = _CapturedFrame(i, expr=True)
+        template = [_to_template(node, captured) for node in ast]
+        on_collected = lambda _, key=key: _collected_lambdas.append(key)  # no lock: called by the garbage collector
+        refs = tuple(weakref.ref(v, on_collected) if _is_fr(v) else v for v in values)
+        _forget_collected()
+        translated = _lru_put(_translated_lambdas, key, (refs, template))
+    # the cached AST is never used directly, as its nodes would then be shared (and modified) by several expressions
+    shared = {id(v) for v in values if not _is_fr(v)}
+    return [_copy_lambda_body(node, values, shared) for node in translated[1]]
+
+
+def _lru_get(cache, key):
+    with _lambda_cache_lock:
+        value = cache.pop(key, None)
+        if value is not None:
+            cache[key] = value  # most recently used
+        return value
+
+
+def _lru_put(cache, key, value):
+    with _lambda_cache_lock:
+        cache[key] = value
+        while len(cache) > LAMBDA_CACHE_SIZE:
+            cache.popitem(last=False)
+        return value
+
+
+def _forget_collected():
+    """Drop the translations of the lambdas whose captured frames were collected."""
+    with _lambda_cache_lock:
+        while True:
+            try:
+                key = _collected_lambdas.popleft()
+            except IndexError:
+                break
+            _translated_lambdas.pop(key, None)
+
+
+def _referent(ref):
+    return ref() if isinstance(ref, weakref.ref) else ref
+
+
+class _CapturedFrame(object):
+    """Placeholder of a frame captured by a lambda (or of its expression) in a cached translation."""
+
+    def __init__(self, index, expr):
+        self.index = index  # index of the frame in the outer variables of the lambda
+        self.expr = expr  # whether the placeholder stands for the expression of the frame
+
+
+def _to_template(expr, captured):
+    if id(expr) in captured:
+        return captured[id(expr)]
+    if not isinstance(expr, ExprNode) or expr._children is None:
+        return expr
+    return expr._copy(*[_to_template(arg, captured) for arg in expr._children])
+
+
+def _copy_lambda_body(expr, values, shared):
+    if isinstance(expr, _CapturedFrame):
+        frame = values[expr.index]
+        return frame._ex if expr.expr else frame
+    if not isinstance(expr, ExprNode) or id(expr) in shared or expr._children is None:
+        return expr
+    return expr._copy(*[_copy_lambda_body(arg, values, shared) for arg in expr._children])
+
+
+class _OuterScope(object):
+    """The values of the outer variables of a lambda: its free variables, and the global variables it refers to."""
+
+    def __init__(self, fun, names):
+        self.values = {}
+        self.from_stack = False  # whether some values had to be looked up in the calling frames
+        closure = dict(zip(fun.__code__.co_freevars, fun.__closure__ or ()))
+        for name in names:
+            if name in closure:
+                try:
+                    self.values[name] = closure[name].cell_contents
+                except ValueError:  # the variable is not assigned yet
+                    pass
+            elif name in fun.__globals__:
+                self.values[name] = fun.__globals__[name]
 
 
 def _lambda_bytecode_to_ast(co, ops):
@@ -446,6 +578,11 @@ def _load_outer_scope(x):
         return True
     elif x == 'False':
         return False
+    scope = local_env('lambda_outer_scope')
+    if scope is not None:
+        if x in scope.values:
+            return scope.values[x]
+        scope.from_stack = True
     stack = inspect.stack()
     for rec in stack:
         frame = rec[0]
@@ -1,12 +1,17 @@
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+import tabulate
+
 import h2o
 from h2o.base import Keyed
+from h2o.display import H2OTableDisplay, repr_def
 from h2o.exceptions import H2OValueError
+from h2o.frame import H2OFrame
 from h2o.job import H2OJob
 from h2o.model import ModelBase
 from h2o.utils.compatibility import *  # NOQA
-from h2o.utils.typechecks import assert_is_type, is_type
+from h2o.utils.threading import local_env
+from h2o.utils.typechecks import assert_is_type, is_type, numeric
 
 
 class H2OAutoMLBaseMixin:
@@ -100,7 +105,8 @@ class H2OAutoMLBaseMixin:
         Retrieve the leaderboard from an H2OAutoML object
 
         :return: an H2OFrame with model ids in the first column and evaluation metric in the second column sorted
-                 by the evaluation metric
+                 by the evaluation metric. The leaderboard is kept locally (e.g. for ``as_data_frame()``, or for
+                 selections like ``leaderboard[0, "model_id"]``), and uploaded to the backend only when needed there.
 
         :examples:
         
@@ -133,7 +139,8 @@ class H2OAutoMLBaseMixin:
         """
         Retrieve the backend event log from an H2OAutoML object
 
-        :return: an H2OFrame with detailed events occurred during the AutoML training.
+        :return: an H2OFrame with detailed events occurred during the AutoML training. As the leaderboard, it is
+                 kept locally until needed on the backend.
         """
         pass
     
@@ -187,10 +194,6 @@ class H2OAutoMLBaseMixin:
         >>> gbm = aml.get_best_model("gbm")
         """
         from h2o.exceptions import H2OValueError
-        
-        def _get_models(leaderboard):
-            return [m[0] for m in
-                    leaderboard["model_id"].as_data_frame(use_pandas=False, header=False)]
 
         higher_is_better = ["auc", "aucpr"]
 
@@ -213,24 +216,28 @@ class H2OAutoMLBaseMixin:
         if criterion in ("training_time_ms", "predict_time_per_row_ms"):
             extra_cols.append(criterion)
 
+        # the leaderboard is kept local: the selection is done on its rows instead of on the backend
         leaderboard = h2o.automl.get_leaderboard(self, extra_columns=extra_cols)
-        leaderboard = leaderboard if algorithm is None else (
-            leaderboard[leaderboard["algo"].tolower() == algorithm, :] if algorithm != "basemodel"
-            else leaderboard[leaderboard["algo"].tolower() != "stackedensemble", :])
+        columns = leaderboard.columns
+        model_idx, algo_idx = columns.index("model_id"), columns.index("algo")
+        rows = leaderboard._rows if algorithm is None else (
+            [r for r in leaderboard._rows if r[algo_idx].lower() == algorithm] if algorithm != "basemodel"
+            else [r for r in leaderboard._rows if r[algo_idx].lower() != "stackedensemble"])
 
-        if leaderboard.nrow == 0:
+        if len(rows) == 0:
             return None
 
         if criterion is None:
-            return h2o.get_model(leaderboard[0, "model_id"])
+            return h2o.get_model(rows[0][model_idx])
 
-        if criterion not in leaderboard.columns:
+        if criterion not in columns:
             raise H2OValueError("Criterion \"{}\" is not present in the leaderboard!".format(criterion))
 
-        models_in_default_order = _get_models(leaderboard)
-        sorted_lb = leaderboard.sort(by=criterion, ascending=criterion not in higher_is_better)
-        selected_models = _get_models(sorted_lb[sorted_lb[criterion] == sorted_lb[0, criterion]])
-        picked_model = [model for model in models_in_default_order if model in selected_models][0]
+        criterion_idx = columns.index(criterion)
+        values = [r[criterion_idx] for r in rows if _is_number(r[criterion_idx])]
+        best = (max if criterion in higher_is_better else min)(values) if values else None
+        # ties are resolved by the default order of the leaderboard
+        picked_model = next((r[model_idx] for r in rows if best is None or r[criterion_idx] == best))
 
         return h2o.get_model(picked_model)
 
@@ -318,16 +325,184 @@ def _fetch_leaderboard(aml_id, extensions=None):
 
 
 def _fetch_table(table, key=None, progress_bar=True):
-    try:
-        # Intentionally mask the progress bar here since showing multiple progress bars is confusing to users.
-        # If any failure happens, revert back to user's original setting for progress and display the error message.
-        ori_progress_state = H2OJob.__PROGRESS_BAR__
-        H2OJob.__PROGRESS_BAR__ = progress_bar
-        # Parse leaderboard H2OTwoDimTable & return as an H2OFrame
-        fr = h2o.H2OFrame(table.cell_values, destination_frame=key, column_names=table.col_header, column_types=table.col_types)
-        return h2o.assign(fr[1:], key) # removing index and reassign id to ensure persistence on backend
-    finally:
-        H2OJob.__PROGRESS_BAR__ = ori_progress_state
+    # the first column of the table is the index
+    return _TableFrame(table.col_header[1:], table.col_types[1:], [row[1:] for row in table.cell_values],
+                       key=key, progress_bar=progress_bar)
+
+
+def _remove_table(frame):
+    if isinstance(frame, _TableFrame) and frame._is_local():
+        return  # never uploaded to the backend
+    h2o.remove(frame)
+
+
+def _is_number(value):
+    """True if the value is numeric and not NaN."""
+    return is_type(value, numeric) and value == value
+
+
+def _training_info(event_log):
+    names = event_log.columns
+    name_idx, value_idx = names.index('name'), names.index('value')
+    return {r[name_idx]: r[value_idx] for r in event_log._rows if r[name_idx]}
+
+
+class _TableFrame(H2OFrame):
+    """
+    H2OFrame of a table received from the backend (leaderboard, event log), kept locally until needed on the backend.
+
+    The names, dimensions and data of the frame (e.g. ``as_data_frame()``, or column and row selections with
+    ``fr["model_id"]``, ``fr[:5, ["model_id", "auc"]]``, ``fr[0, "model_id"]``) are obtained from the local table,
+    and the frame is only uploaded to the backend when any other operation needs it there.
+    """
+
+    def __init__(self, names, types, rows, key=None, progress_bar=False):
+        # the expression of the frame (`_ex`) is created when uploading it, see `_ex` below
+        self._is_frame = True
+        self._names = list(names)
+        self._types = list(types)
+        int_cols = [j for j, t in enumerate(self._types) if t in ("int", "integer", "long")]
+        self._rows = [list(row) for row in rows]
+        for row in self._rows:
+            for j in int_cols:
+                if isinstance(row[j], float) and row[j].is_integer():
+                    row[j] = int(row[j])
+        self._key = key
+        self._progress_bar = progress_bar
+
+    def _is_local(self):
+        return "_ex" not in self.__dict__
+
+    def _get_ex(self):
+        if self._is_local():
+            self._upload()
+        return H2OFrame._ex.fget(self)
+
+    _ex = property(_get_ex, H2OFrame._ex.fset)
+
+    def _upload(self):
+        try:
+            # Intentionally mask the progress bar here since showing multiple progress bars is confusing to users.
+            # If any failure happens, revert back to user's original setting for progress and display the error message.
+            ori_progress_state = H2OJob.__PROGRESS_BAR__
+            H2OJob.__PROGRESS_BAR__ = self._progress_bar
+            fr = H2OFrame(self._rows, destination_frame=self._key, column_names=self._names,
+                          column_types=self._types)
+        finally:
+            H2OJob.__PROGRESS_BAR__ = ori_progress_state
+        self._ex = fr._ex
+
+    def _subset(self, rows, cols):
+        return _TableFrame([self._names[j] for j in cols], [self._types[j] for j in cols],
+                           [[self._rows[i][j] for j in cols] for i in rows], progress_bar=self._progress_bar)
+
+    def _col_indices(self, item):
+        if is_type(item, str):
+            item = [item]
+        elif isinstance(item, slice):
+            return list(range(*item.indices(len(self._names))))
+        if not is_type(item, [str]) or any(name not in self._names for name in item):
+            return None
+        return [self._names.index(name) for name in item]
+
+    @property
+    def names(self):
+        if self._is_local():
+            return list(self._names)
+        return H2OFrame.names.fget(self)
+
+    @names.setter
+    def names(self, value):
+        self.set_names(value)
+
+    @property
+    def columns(self):
+        return self.names
+
+    @columns.setter
+    def columns(self, value):
+        self.set_names(value)
+
+    @property
+    def col_names(self):
+        return self.names
+
+    @col_names.setter
+    def col_names(self, value):
+        self.set_names(value)
+
+    @property
+    def nrows(self):
+        return len(self._rows) if self._is_local() else H2OFrame.nrows.fget(self)
+
+    @property
+    def ncols(self):
+        return len(self._names) if self._is_local() else H2OFrame.ncols.fget(self)
+
+    def get_frame_data(self):
+        if not self._is_local():
+            return H2OFrame.get_frame_data(self)
+
+        def to_csv(value):
+            if value is None or value == "" or (is_type(value, numeric) and not _is_number(value)):  # None, NaN
+                return ""
+            if is_type(value, numeric):
+                return repr(value)
+            return '"%s"' % str(value).replace('"', '""')
+
+        return "".join(",".join(to_csv(v) for v in row) + "\n" for row in [self._names] + self._rows)
+
+    def __getitem__(self, item):
+        if self._is_local():
+            rows, cols = (item if isinstance(item, tuple) and len(item) == 2 else (slice(None), item))
+            col_indices = self._col_indices(cols)
+            if col_indices is not None:
+                if is_type(rows, int) and is_type(cols, str):
+                    return self._rows[rows][col_indices[0]]
+                if isinstance(rows, slice):
+                    return self._subset(range(*rows.indices(len(self._rows))), col_indices)
+        return H2OFrame.__getitem__(self, item)
+
+    def head(self, rows=10, cols=200):
+        if self._is_local():
+            return self._subset(range(min(rows, len(self._rows))), range(min(cols, len(self._names))))
+        return H2OFrame.head(self, rows, cols)
+
+    def _has_content(self):
+        return True if self._is_local() else H2OFrame._has_content(self)
+
+    def _repr_(self):
+        if self._is_local():
+            return repr_def(self, attributes=['_key', '_names'])
+        return H2OFrame._repr_(self)
+
+    def _to_str(self, fmt=None, verbosity=None):
+        if not self._is_local():
+            return H2OFrame._to_str(self, fmt=fmt, verbosity=verbosity)
+        if not self._rows:
+            return "H2OFrame is empty."
+        head = self.head(rows=local_env('rows', 10), cols=local_env('cols', 200))
+        use_pandas = local_env('pandas', H2OTableDisplay.use_pandas(), use_default_if_none=True)
+        if use_pandas:
+            df = head.as_data_frame(use_pandas=True)
+            table = df.to_html() if fmt == 'html' else df.to_string()
+        else:
+            tablefmt = dict(plain='plain', pretty='simple', html='html').get(fmt or 'plain')
+            table = tabulate.tabulate(head._rows, headers=head._names, tablefmt=tablefmt)
+            table = H2OTableDisplay.fixup_table_repr(table, fmt=fmt)
+        return table+H2OTableDisplay.table_footer(self, fmt=fmt)
+
+
+def _fetch_events(aml_id, offset=0, verbosity=None):
+    """
+    Fetch the progress of an AutoML run and only the events logged after the given offset.
+
+    :param aml_id: the id of the AutoML run.
+    :param offset: the number of events to skip, usually the ``events_count`` returned by the previous call.
+    :param verbosity: the verbosity level of the events.
+    :returns: the JSON returned by ``GET /99/AutoML/<aml_id>/events``.
+    """
+    return h2o.api("GET /99/AutoML/%s/events" % aml_id, data=dict(events_offset=offset, verbosity=verbosity))
 
 
 def _fetch_state(aml_id, properties=None, verbosity=None):
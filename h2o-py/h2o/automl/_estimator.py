@@ -14,7 +14,7 @@ from h2o.job import H2OJob
 from h2o.utils.compatibility import *  # NOQA
 from h2o.utils.shared_utils import check_id
 from h2o.utils.typechecks import assert_is_type, is_type, numeric
-from ._base import H2OAutoMLBaseMixin, _fetch_state
+from ._base import H2OAutoMLBaseMixin, _fetch_events, _fetch_state, _remove_table, _training_info
 
 
 _params_doc_ = dict()  # holds the doc per param extracted from H2OAutoML constructor
@@ -701,8 +701,8 @@ class H2OAutoML(H2OAutoMLBaseMixin, Keyed):
     def detach(self):
         self.__frozen = False
         self.project_name = None
-        h2o.remove(self.leaderboard)
-        h2o.remove(self.event_log)
+        _remove_table(self.leaderboard)
+        _remove_table(self.event_log)
 
     #-------------------------------------------------------------------------------------------------------------------
     # Private
@@ -712,11 +712,8 @@ class H2OAutoML(H2OAutoMLBaseMixin, Keyed):
         state = _fetch_state(self.key)
         self._leader_id = state['leader_id']
         self._leaderboard = state['leaderboard']
-        self._event_log = el = state['event_log']
-        self._training_info = { r[0]: r[1]
-                                for r in el[el['name'] != '', ['name', 'value']]
-                                    .as_data_frame(use_pandas=False, header=False)
-                                }
+        self._event_log = state['event_log']
+        self._training_info = _training_info(self._event_log)
         self._state_json = state['json']
         return self._leader_id is not None
 
@@ -729,15 +726,16 @@ class H2OAutoML(H2OAutoMLBaseMixin, Keyed):
             return
         try:
             if job.progress > state.get('last_job_progress', 0):
-                events_table = _fetch_state(job.dest_key, properties=[], verbosity=verbosity)['json']['event_log_table']
-                last_nrows = state.get('last_events_nrows', 0)
-                if len(events_table.cell_values) > last_nrows:
-                    events = zip(*events_table[last_nrows:][['timestamp', 'message']])
+                # only the events logged since the previous poll are fetched
+                events_json = _fetch_events(job.dest_key, offset=state.get('events_offset', 0), verbosity=verbosity)
+                events_table = events_json['event_log_table']
+                if len(events_table.cell_values) > 0:
+                    events = zip(*events_table[['timestamp', 'message']])
                     print('')
                     for r in events:
                         print("{}: {}".format(r[0], r[1]))
                     print('')
-                    state['last_events_nrows'] = len(events_table.cell_values)
+                state['events_offset'] = events_json['events_count']
             state['last_job_progress'] = job.progress
         except Exception as e:
             print("Failed polling AutoML progress log: {}".format(e))
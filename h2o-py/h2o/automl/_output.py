@@ -1,6 +1,5 @@
-import h2o
 from h2o.base import Keyed
-from ._base import H2OAutoMLBaseMixin
+from ._base import H2OAutoMLBaseMixin, _remove_table, _training_info
 
 
 class H2OAutoMLOutput(H2OAutoMLBaseMixin, Keyed):
@@ -13,11 +12,8 @@ class H2OAutoMLOutput(H2OAutoMLBaseMixin, Keyed):
         self._key = state['json']['automl_id']['name']
         self._leader = state['leader']
         self._leaderboard = state['leaderboard']
-        self._event_log = el = state['event_log']
-        self._training_info = {r[0]: r[1]
-                               for r in el[el['name'] != '', ['name', 'value']]
-                                   .as_data_frame(use_pandas=False, header=False)
-                               }
+        self._event_log = state['event_log']
+        self._training_info = _training_info(self._event_log)
 
     def __getitem__(self, item):
         if (
@@ -58,5 +54,5 @@ class H2OAutoMLOutput(H2OAutoMLBaseMixin, Keyed):
 
     def detach(self):
         self._project_name = None
-        h2o.remove(self.leaderboard)
-        h2o.remove(self.event_log)
+        _remove_table(self.leaderboard)
+        _remove_table(self.event_log)
@@ -46,5 +46,6 @@ from .cluster import H2OCluster
 from .server import H2OLocalServer
 from .connection import H2OConnection
 from .connection import H2OConnectionConf
+from .stats import H2OConnectionStats
 
-__all__ = ("H2OCluster", "H2OConnection", "H2OLocalServer", "H2OConnectionConf")
+__all__ = ("H2OCluster", "H2OConnection", "H2OLocalServer", "H2OConnectionConf", "H2OConnectionStats")
@@ -17,27 +17,33 @@ from h2o.utils.compatibility import *  # NOQA
 
 import atexit
 from collections import defaultdict
+import json
 import os
 import re
 import sys
 import tempfile
+import threading
 import time
 import types
 from warnings import warn
 from weakref import ref
 
 import requests
+from requests.adapters import HTTPAdapter
 from requests.auth import AuthBase
+from requests.compat import cookielib
 
 from h2o.backend import H2OCluster, H2OLocalServer
+from h2o.backend.stats import H2OConnectionStats
 from h2o.display import print2
 from h2o.exceptions import H2OConnectionError, H2OServerError, H2OResponseError, H2OValueError
 from h2o.model.metrics import make_metrics
 from h2o.schemas import H2OMetadataV3, H2OErrorV3, H2OModelBuilderErrorV3, define_classes_from_schema
 from h2o.two_dim_table import H2OTwoDimTable
 from h2o.utils.metaclass import CallableString, backwards_compatibility, h2o_meta
-from h2o.utils.shared_utils import stringify_list, stringify_dict, as_resource
-from h2o.utils.typechecks import (assert_is_type, assert_matches, assert_satisfies, is_type, numeric)
+from h2o.utils.shared_utils import (stringify_list, stringify_dict, as_resource, FilePart, GzipStream,
+                                    is_binary_file_head)
+from h2o.utils.typechecks import (assert_is_type, assert_matches, assert_satisfies, BoundInt, is_type, numeric)
 
 __all__ = ("H2OConnection", "H2OConnectionConf", )
 
@@ -88,13 +94,16 @@ class H2OConnectionConf(object):
         self._auth = None
         self._cookies = None
         self._verbose = True
+        self._pool_size = 10
+        self._keep_alive = True
+        self._max_retries = 0
         # Fill from config if it is specified
         if config is not None:
             self._fill_from_config(config)
 
     """List of allowed property names exposed by this class"""
     allowed_properties = ["ip", "port", "https", "context_path", "verify_ssl_certificates", "cacert",
-                          "proxy", "auth", "cookies", "verbose"]
+                          "proxy", "auth", "cookies", "verbose", "pool_size", "keep_alive", "max_retries"]
 
     def _fill_from_config(self, config):
         """
@@ -201,6 +210,35 @@ class H2OConnectionConf(object):
         assert_is_type(value, bool)
         self._verbose = value
 
+    @property
+    def pool_size(self):
+        return self._pool_size
+
+    @pool_size.setter
+    def pool_size(self, value):
+        assert_is_type(value, int)
+        assert_satisfies(value, value > 0)
+        self._pool_size = value
+
+    @property
+    def keep_alive(self):
+        return self._keep_alive
+
+    @keep_alive.setter
+    def keep_alive(self, value):
+        assert_is_type(value, bool)
+        self._keep_alive = value
+
+    @property
+    def max_retries(self):
+        return self._max_retries
+
+    @max_retries.setter
+    def max_retries(self, value):
+        assert_is_type(value, int)
+        assert_satisfies(value, value >= 0)
+        self._max_retries = value
+
     @property
     def url(self):
         if self.https:
@@ -270,6 +308,14 @@ class H2OConnection(h2o_meta()):
             hc.info().pprint()
 
     Once the connection is established, you can send REST API requests to the server using :meth:`request`.
+
+    A connection is thread-safe: the same instance can be shared by several threads (for example the workers of a
+    ``ThreadPoolExecutor``) issuing requests concurrently. The session id is issued only once even if several threads
+    request it at the same time, and the requests counter and the log remain consistent. Requests are sent through
+    a pool of HTTP connections (see ``pool_size``), which should be at least as large as the number of threads.
+    If different threads (or asyncio tasks) need to talk to different clusters, use
+    :func:`h2o.utils.threading.local_context` to bind a connection to the current context, as described
+    in :func:`h2o.connection`.
     """
 
     """
@@ -280,7 +326,8 @@ class H2OConnection(h2o_meta()):
     @staticmethod
     def open(server=None, url=None, ip=None, port=None, name=None, https=None, auth=None,
              verify_ssl_certificates=True, cacert=None,
-             proxy=None, cookies=None, verbose=True, msgs=None, strict_version_check=True):
+             proxy=None, cookies=None, verbose=True, msgs=None, strict_version_check=True,
+             pool_size=None, keep_alive=None, max_retries=None):
         r"""
         Establish connection to an existing H2O server.
 
@@ -321,6 +368,13 @@ class H2OConnection(h2o_meta()):
         :param strict_version_check: If True, an error will be raised if the client and server versions don't match.
         :param msgs: custom messages to display during connection. This is a tuple (initial message, success message,
             failure message).
+        :param pool_size: maximum number of pooled HTTP connections kept open to the server (default 10). Concurrent
+            requests beyond this number will open additional short-lived connections.
+        :param keep_alive: if True (default), then connections to the server are kept alive and reused by subsequent
+            requests, which also avoids repeating the TLS handshake for https connections. If False, then every request
+            opens a new connection.
+        :param max_retries: number of times a request is retried if the connection to the server cannot be
+            established (default 0).
 
         :returns: A new :class:`H2OConnection` instance.
         :raises H2OConnectionError: if the server cannot be reached.
@@ -369,6 +423,14 @@ class H2OConnection(h2o_meta()):
         assert_is_type(auth, AuthBase, (str, str), None)
         assert_is_type(cookies, str, [str], None)
         assert_is_type(msgs, None, (str, str, str))
+        if pool_size is None: pool_size = 10
+        if keep_alive is None: keep_alive = True
+        if max_retries is None: max_retries = 0
+        assert_is_type(pool_size, int)
+        assert_satisfies(pool_size, pool_size > 0)
+        assert_is_type(keep_alive, bool)
+        assert_is_type(max_retries, int)
+        assert_satisfies(max_retries, max_retries >= 0)
 
         conn = H2OConnection()
         conn._verbose = bool(verbose)
@@ -378,7 +440,8 @@ class H2OConnection(h2o_meta()):
         conn._verify_ssl_cert = bool(verify_ssl_certificates)
         conn._cacert = cacert
         conn._auth = auth
-        conn._cookies = cookies
+        conn._cookies = ";".join(cookies) if isinstance(cookies, list) else cookies
+        conn._session = H2OConnection._create_session(pool_size, keep_alive, max_retries)
         conn._proxies = None
         if proxy and proxy != "(default)":
             conn._proxies = {scheme: proxy}
@@ -423,6 +486,7 @@ class H2OConnection(h2o_meta()):
         except Exception:
             # Reset _session_id so that we know the connection was not initialized properly.
             conn._stage = 0
+            conn._session.close()
             raise
         
         conn._cluster.check_version(strict=strict_version_check)
@@ -436,7 +500,8 @@ class H2OConnection(h2o_meta()):
         :param data: data payload for POST (and sometimes GET) requests. This should be a dictionary of simple
             key/value pairs (values can also be arrays), which will be sent over in x-www-form-encoded format.
         :param json: also data payload, but it will be sent as a JSON body. Cannot be used together with `data`.
-        :param filename: file to upload to the server. Cannot be used with `data` or `json`.
+        :param filename: file to upload to the server (or a :class:`FilePart` to upload only a part of a file).
+            Cannot be used with `data` or `json`.
         :param save_to: if provided, will write the response to that file (additionally, the response will be
             streamed, so large files can be downloaded seamlessly). This parameter can be either a file name,
             or a folder name. If the folder doesn't exist, it will be created automatically.
@@ -459,7 +524,7 @@ class H2OConnection(h2o_meta()):
 
         # Prepare data
         if filename is not None:
-            assert_is_type(filename, str)
+            assert_is_type(filename, str, FilePart)
             assert_is_type(json, None, "Argument `json` should be None when `filename` is used.")
             assert_is_type(data, None, "Argument `data` should be None when `filename` is used.")
             assert_satisfies(method, method == "POST",
@@ -471,32 +536,36 @@ class H2OConnection(h2o_meta()):
             assert_is_type(json, dict)
 
         request_data = self._prepare_data_payload(data) if filename is None else self._prepare_file_payload(filename)
+        if filename is not None and self._should_compress_upload(filename):
+            request_data = GzipStream(request_data, level=self._upload_compression_level)
 
         params = None
         if (method == "GET" or method == "DELETE") and data:
             params = request_data
             request_data = None
 
-        stream = False
         if save_to is not None:
             assert_is_type(save_to, str, types.FunctionType)
-            stream = True   
-
-        if self._cookies is not None and isinstance(self._cookies, list):
-            self._cookies = ";".join(self._cookies)
 
         # Make the request
         with as_resource(request_data) as rd:
             start_time = time.time()
+            resp = None
+            failed = True
             try:
                 self._log_start_transaction(endpoint, rd, json, filename, params)
                 args = self._request_args()
-                resp = requests.request(method=method, url=url, data=rd, json=json, params=params,
-                                        stream=stream, **args)
-                if isinstance(save_to, types.FunctionType):
-                    save_to = save_to(resp)
-                self._log_end_transaction(start_time, resp)
-                return self._process_response(resp, save_to)
+                # The response is always streamed: its body is read only once, by _process_response
+                resp = self._session.request(method=method, url=url, data=rd, json=json, params=params,
+                                             stream=True, **args)
+                try:
+                    if isinstance(save_to, types.FunctionType):
+                        save_to = save_to(resp)
+                    result = self._process_response(resp, save_to, start_time)
+                    failed = False
+                    return result
+                finally:
+                    resp.close()
 
             except (requests.exceptions.ConnectionError, requests.exceptions.HTTPError) as e:
                 if self._local_server and not self._local_server.is_running():
@@ -515,6 +584,28 @@ class H2OConnection(h2o_meta()):
                     err.endpoint = endpoint
                     err.payload = (rd, json, filename, params)
                 raise
+            finally:
+                self._record_stats(endpoint, start_time, resp, failed)
+
+    def _record_stats(self, endpoint, start_time, response, failed):
+        """Record the metrics of a request (see :meth:`stats`)."""
+        request_bytes = response_bytes = retries = 0
+        if response is not None:
+            body = response.request.body
+            if hasattr(body, "fileno"):
+                request_bytes = os.fstat(body.fileno()).st_size
+            elif hasattr(body, "__len__"):
+                request_bytes = len(body)
+            elif hasattr(body, "tell"):
+                request_bytes = body.tell()  # streamed body, e.g. a compressed upload
+            try:
+                response_bytes = response.raw.tell()  # bytes read from the wire, i.e. compressed
+            except Exception:
+                response_bytes = int(response.headers.get("Content-Length", 0))
+            history = getattr(getattr(response.raw, "retries", None), "history", None)
+            retries = len(history) if history else 0
+        self._stats.record(endpoint, time.time() - start_time, request_bytes=request_bytes,
+                           response_bytes=response_bytes, error=failed, retries=retries)
 
     def _request_args(self):
         headers = {"User-Agent": "H2O Python client/" + sys.version.replace("\n", ""),
@@ -529,6 +620,24 @@ class H2OConnection(h2o_meta()):
             'proxies': self._proxies
         }
 
+    @staticmethod
+    def _create_session(pool_size, keep_alive, max_retries):
+        """
+        Create the HTTP session through which all the requests of this connection are sent.
+
+        The session maintains a pool of connections to the server, so that consecutive requests don't need to go
+        through the TCP (and TLS) handshake again. Cookies sent by the server are deliberately ignored: the session
+        only carries the cookies explicitly provided by the user, the same way as individual requests would.
+        """
+        session = requests.Session()
+        session.cookies.set_policy(cookielib.DefaultCookiePolicy(allowed_domains=[]))
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=max_retries)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        if not keep_alive:
+            session.headers["Connection"] = "close"
+        return session
+
     @staticmethod
     def save_to_detect(resp):
         disposition = resp.headers['Content-Disposition']
@@ -552,6 +661,9 @@ class H2OConnection(h2o_meta()):
                 self._print("H2O session %s was not closed properly." % self._session_id)
                 self._log_end_exception(e)
             self._session_id = None
+        if self._session is not None:
+            self._session.close()
+            self._session = None
         self._stage = -1
         apply_session_hooks('close')
 
@@ -569,8 +681,10 @@ class H2OConnection(h2o_meta()):
         issued, the session id will stay the same until the connection is closed.
         """
         if self._session_id is None:
-            req = self.request("POST /4/sessions")
-            self._session_id = req.get("session_key") or req.get("session_id")
+            with self._session_lock:
+                if self._session_id is None:
+                    req = self.request("POST /4/sessions")
+                    self._session_id = req.get("session_key") or req.get("session_id")
         return CallableString(self._session_id)
 
     @property
@@ -602,6 +716,24 @@ class H2OConnection(h2o_meta()):
         """Total number of request requests made since the connection was opened (used for debug purposes)."""
         return self._requests_counter
 
+    def stats(self):
+        """
+        Get the metrics of the requests made through this connection: per-endpoint number of calls, errors and
+        retries, request and response sizes, and latency histograms.
+
+        The metrics are collected since the connection was opened (or since they were last reset).
+
+        :returns: the :class:`H2OConnectionStats` of the connection.
+
+        :examples:
+
+        >>> stats = h2o.connection().stats()
+        >>> stats.as_dict()
+        >>> print(stats.to_prometheus())
+        >>> stats.reset()
+        """
+        return self._stats
+
     @property
     def timeout_interval(self):
         """Timeout length for each request, in seconds."""
@@ -612,6 +744,37 @@ class H2OConnection(h2o_meta()):
         assert_is_type(v, numeric, None)
         self._timeout = v
 
+    @property
+    def upload_compression_level(self):
+        """
+        Level (from 1 = fastest to 9 = smallest) of the gzip compression of the uploaded files, or None (default) if
+        the files are uploaded uncompressed.
+
+        The files (e.g. from :func:`h2o.upload_file`, or the data of the frames created from python objects) are
+        compressed on the fly while they are sent, and the server parses them as any gzip-compressed file. Files
+        which are already compressed or binary, or smaller than :attr:`upload_compression_threshold`, are sent as-is.
+
+        :examples:
+
+        >>> h2o.connection().upload_compression_level = 1
+        """
+        return self._upload_compression_level
+
+    @upload_compression_level.setter
+    def upload_compression_level(self, v):
+        assert_is_type(v, None, BoundInt(1, 9))
+        self._upload_compression_level = v
+
+    @property
+    def upload_compression_threshold(self):
+        """Minimum size (in bytes) of the files compressed when uploaded, see :attr:`upload_compression_level`."""
+        return self._upload_compression_threshold
+
+    @upload_compression_threshold.setter
+    def upload_compression_threshold(self, v):
+        assert_is_type(v, BoundInt(0))
+        self._upload_compression_threshold = v
+
     def start_logging(self, dest=None):
         """
         Start logging all API requests to the provided destination.
@@ -623,14 +786,16 @@ class H2OConnection(h2o_meta()):
         if dest is None:
             dest = os.path.join(tempfile.mkdtemp(), "h2o-connection.log")
         self._print("Now logging all API requests to file %r" % dest)
-        self._is_logging = True
-        self._logging_dest = dest
+        with self._lock:
+            self._logging_dest = dest
+            self._is_logging = True
 
     def stop_logging(self):
         """Stop logging API requests."""
         if self._is_logging:
             self._print("Logging stopped.")
-            self._is_logging = False
+            with self._lock:
+                self._is_logging = False
 
     # ------------------------------------------------------------------------------------------------------------------
     # PRIVATE
@@ -649,13 +814,19 @@ class H2OConnection(h2o_meta()):
         self._proxies = None        # `proxies` dictionary in the format required by the requests module
         self._cluster_id = None
         self._cookies = None
+        self._session = None        # requests.Session holding the pool of HTTP connections to the server
         self._cluster = None        # H2OCluster object
         self._verbose = None        # Print detailed information about connection status
         self._requests_counter = 0  # how many API requests were made
+        self._stats = H2OConnectionStats()  # per-endpoint metrics of the requests
+        self._upload_compression_level = None   # gzip level of the uploaded files (None = not compressed)
+        self._upload_compression_threshold = 1 << 20  # size (in bytes) of the smallest files compressed for upload
         self._timeout = None        # timeout for a single request (in seconds)
         self._is_logging = False    # when True, log every request
         self._logging_dest = None   # where the log messages will be written, either filename or open file handle
         self._local_server = None   # H2OLocalServer instance to which we are connected (if known)
+        self._lock = threading.RLock()          # guards the requests counter and the log destination
+        self._session_lock = threading.Lock()   # guards the lazy issuance of the session id
         # self.start_logging(sys.stdout)
 
     def _test_connection(self, max_retries=5, messages=None):
@@ -737,6 +908,20 @@ class H2OConnection(h2o_meta()):
             res[key] = value
         return res
 
+    def _should_compress_upload(self, filename):
+        """Whether the file (path or :class:`FilePart`) should be compressed when uploaded."""
+        if self._upload_compression_level is None:
+            return False
+        if isinstance(filename, FilePart):
+            path, offset, size = filename.path, filename.offset, filename.length
+        else:
+            path, offset, size = filename, 0, os.path.getsize(filename)
+        if size < self._upload_compression_threshold:
+            return False
+        with open(path, "rb") as f:
+            f.seek(offset)
+            return not is_binary_file_head(f.read(min(size, 1 << 12)))
+
     @staticmethod
     def _prepare_file_payload(filename):
         """
@@ -745,6 +930,7 @@ class H2OConnection(h2o_meta()):
         The "preparation" consists of creating a data structure suitable
         for passing to requests.request().
         """
+        if isinstance(filename, FilePart): return filename
         if not filename: return None
         absfilename = os.path.abspath(filename)
         if not os.path.exists(absfilename):
@@ -755,9 +941,11 @@ class H2OConnection(h2o_meta()):
         """Log the beginning of an API request."""
         # TODO: add information about the caller, i.e. which module + line of code called the .request() method
         #       This can be done by fetching current traceback and then traversing it until we find the request function
-        self._requests_counter += 1
+        with self._lock:
+            self._requests_counter += 1
+            request_num = self._requests_counter
         if not self._is_logging: return
-        msg = "\n---- %d --------------------------------------------------------\n" % self._requests_counter
+        msg = "\n---- %d --------------------------------------------------------\n" % request_num
         msg += "[%s] %s\n" % (time.strftime("%H:%M:%S"), endpoint)
         if params is not None: msg += "     params: {%s}\n" % ", ".join("%s:%s" % item for item in viewitems(params))
         if json is not None:
@@ -769,14 +957,14 @@ class H2OConnection(h2o_meta()):
             msg += "     body: {%s}\n" % ", ".join("%s:%s" % item for item in viewitems(data))
         self._log_message(msg + "\n")
 
-    def _log_end_transaction(self, start_time, response):
-        """Log response from an API request."""
+    def _log_end_transaction(self, start_time, response, body):
+        """Log response from an API request, `body` being the already decoded body of the response."""
         if not self._is_logging: return
         elapsed_time = int((time.time() - start_time) * 1000)
         msg = "<<< HTTP %d %s   (%d ms)\n" % (response.status_code, response.reason, elapsed_time)
         if "Content-Type" in response.headers:
             msg += "    Content-Type: %s\n" % response.headers["Content-Type"]
-        msg += response.text
+        msg += body
         self._log_message(msg + "\n\n")
 
     def _log_end_exception(self, exception):
@@ -792,20 +980,24 @@ class H2OConnection(h2o_meta()):
         immediately. If the destination is an open file handle, then we simply write the message there and do not
         attempt to close it.
         """
-        if is_type(self._logging_dest, str):
-            with open(self._logging_dest, "at", encoding="utf-8") as f:
-                f.write(msg)
-        else:
-            self._logging_dest.write(msg)
+        with self._lock:
+            if is_type(self._logging_dest, str):
+                with open(self._logging_dest, "at", encoding="utf-8") as f:
+                    f.write(msg)
+            else:
+                self._logging_dest.write(msg)
 
-    @staticmethod
-    def _process_response(response, save_to):
+    def _process_response(self, response, save_to, start_time):
         """
-        Given a response object, prepare it to be handed over to the external caller.
+        Given a (streamed) response object, prepare it to be handed over to the external caller.
 
         Preparation steps include:
            * detect if the response has error status, and convert it to an appropriate exception;
            * detect Content-Type, and based on that either parse the response as JSON or return as plain text.
+
+        The body of a JSON response is read as bytes, decoded, and then parsed, each representation being released
+        once the next one is built: the bytes are never held in memory together with the parsed tree (as they were
+        with ``response.json()``, which keeps the content in the response).
         """
         status_code = response.status_code
         if status_code == 200 and save_to:
@@ -825,6 +1017,7 @@ class H2OConnection(h2o_meta()):
                             f.write(chunk)
             except OSError as e:
                 raise H2OValueError("Cannot write to file %s: %s" % (fullname, e))
+            self._log_end_transaction(start_time, response, "(saved to %s)" % fullname)
             return fullname
 
         content_type = response.headers.get("Content-Type", "")
@@ -837,11 +1030,18 @@ class H2OConnection(h2o_meta()):
         # Auto-detect response type by its content-type. Decode JSON, all other responses pass as-is.
         if content_type == "application/json":
             try:
-                data = response.json(object_pairs_hook=H2OResponse)
-            except (JSONDecodeError, requests.exceptions.ContentDecodingError) as e:
-                raise H2OServerError("Malformed JSON from server (%s):\n%s" % (str(e), response.text))
+                text = H2OConnection._read_text(response)
+            except requests.exceptions.ContentDecodingError as e:
+                raise H2OServerError("Malformed JSON from server (%s)" % e)
+            self._log_end_transaction(start_time, response, text)
+            try:
+                data = json.loads(text, object_pairs_hook=H2OResponse)
+            except ValueError as e:
+                raise H2OServerError("Malformed JSON from server (%s):\n%s" % (str(e), text))
+            del text  # only the parsed tree is kept from now on
         else:
             data = response.text
+            self._log_end_transaction(start_time, response, data)
 
         # Success (200 = "Ok", 201 = "Created", 202 = "Accepted", 204 = "No Content")
         if status_code in {200, 201, 202, 204}:
@@ -857,6 +1057,22 @@ class H2OConnection(h2o_meta()):
         # did not provide the correct status code.
         raise H2OServerError("HTTP %d %s:\n%s" % (status_code, response.reason, data))
 
+    @staticmethod
+    def _read_text(response):
+        """
+        Read the body of a streamed response as text.
+
+        The bytes (decompressed if needed) are accumulated in a single buffer, decoded at once, and the buffer is then
+        released: the body is held at most twice in memory, as bytes and as text.
+        """
+        body = bytearray()
+        for chunk in response.iter_content(chunk_size=65536):
+            body += chunk
+        try:
+            return body.decode(response.encoding or "utf-8", "replace")
+        except LookupError:
+            return body.decode("utf-8", "replace")
+
     @staticmethod
     def _find_file_name(response):
         cd = response.headers.get("Content-Disposition", "")
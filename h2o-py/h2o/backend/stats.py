@@ -0,0 +1,209 @@
+# -*- encoding: utf-8 -*-
+"""
+Metrics of the REST requests sent by an H2O connection.
+
+:copyright: (c) 2016 H2O.ai
+:license:   Apache License Version 2.0 (see LICENSE for details)
+"""
+from __future__ import absolute_import, division, print_function, unicode_literals
+from h2o.utils.compatibility import *  # NOQA
+
+import re
+import threading
+
+__all__ = ("H2OConnectionStats", )
+
+
+class H2OConnectionStats(object):
+    """
+    Per-endpoint metrics of the requests sent through an :class:`H2OConnection`.
+
+    For each endpoint template (e.g. ``GET /3/Frames/{}/summary``, the keys of frames, models, jobs... being replaced
+    by ``{}``), the following metrics are recorded:
+
+        - the number of calls, of errors (failed requests, or responses with an HTTP error status) and of retries;
+        - the numbers of bytes sent and received (as sent over the wire, i.e. compressed if the response is);
+        - the histogram of the latencies (in seconds, including the decoding of the response), from which the
+          percentiles p50, p95 and p99 are estimated.
+
+    The metrics are always collected, and are available from ``h2o.connection().stats()``::
+
+        >>> stats = h2o.connection().stats()
+        >>> stats.as_dict()["GET /3/Frames/{}"]["p95"]
+        >>> print(stats.to_prometheus())
+        >>> stats.reset()
+    """
+
+    # Upper bounds (in seconds) of the buckets of the latency histograms, the last bucket being unbounded.
+    LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0,
+                       120.0, 300.0)
+
+    # Segments of the REST paths which name a collection (and not a key) when they follow a key: e.g. "models" and
+    # "frames" in "/3/Predictions/models/{}/frames/{}".
+    _COLLECTION_SEGMENTS = {"models", "frames", "columns", "schemas", "endpoints", "schemaclasses"}
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._endpoints = {}  # endpoint template -> _EndpointStats
+
+    def record(self, endpoint, latency, request_bytes=0, response_bytes=0, error=False, retries=0):
+        """
+        Record a request.
+
+        :param endpoint: the endpoint of the request, e.g. "GET /3/Frames/iris.hex" (recorded under its template).
+        :param latency: the duration of the request, in seconds.
+        :param request_bytes: the size of the body of the request.
+        :param response_bytes: the size of the body of the response.
+        :param error: True if the request failed.
+        :param retries: the number of times the request was retried.
+        """
+        template = self.endpoint_template(endpoint)
+        with self._lock:
+            stats = self._endpoints.get(template)
+            if stats is None:
+                stats = self._endpoints[template] = _EndpointStats(len(self.LATENCY_BUCKETS) + 1)
+            stats.calls += 1
+            stats.errors += bool(error)
+            stats.retries += retries
+            stats.request_bytes += request_bytes
+            stats.response_bytes += response_bytes
+            stats.latency_sum += latency
+            stats.latency_max = max(stats.latency_max, latency)
+            stats.buckets[self._bucket_index(latency)] += 1
+
+    def reset(self):
+        """Discard all the metrics recorded so far."""
+        with self._lock:
+            self._endpoints.clear()
+
+    def as_dict(self):
+        """
+        Get the recorded metrics.
+
+        :returns: a dictionary endpoint template -> dictionary of metrics, with keys ``calls``, ``errors``,
+            ``retries``, ``request_bytes``, ``response_bytes``, ``latency_sum``, ``latency_max``, ``p50``, ``p95``,
+            ``p99`` (the latencies being in seconds) and ``histogram`` (the list of pairs (upper bound of the bucket,
+            number of requests in the bucket), the last bound being ``inf``).
+        """
+        bounds = self.LATENCY_BUCKETS + (float("inf"),)
+        res = {}
+        with self._lock:
+            for template, stats in viewitems(self._endpoints):
+                res[template] = dict(calls=stats.calls, errors=stats.errors, retries=stats.retries,
+                                     request_bytes=stats.request_bytes, response_bytes=stats.response_bytes,
+                                     latency_sum=stats.latency_sum, latency_max=stats.latency_max,
+                                     p50=self._percentile(stats, 0.50), p95=self._percentile(stats, 0.95),
+                                     p99=self._percentile(stats, 0.99),
+                                     histogram=list(zip(bounds, stats.buckets)))
+        return res
+
+    def to_prometheus(self, prefix="h2o_client"):
+        """
+        Export the recorded metrics in the Prometheus text exposition format.
+
+        :param prefix: prefix of the names of the metrics.
+        :returns: the metrics as a string.
+        """
+        metrics = self.as_dict()
+        lines = []
+
+        def add_metric(name, kind, help_text, field):
+            lines.append("# HELP %s_%s %s" % (prefix, name, help_text))
+            lines.append("# TYPE %s_%s %s" % (prefix, name, kind))
+            for template in sorted(metrics):
+                lines.append("%s_%s{%s} %s" % (prefix, name, _labels(template), _number(metrics[template][field])))
+
+        add_metric("requests_total", "counter", "Number of REST requests.", "calls")
+        add_metric("request_errors_total", "counter", "Number of failed REST requests.", "errors")
+        add_metric("request_retries_total", "counter", "Number of retries of REST requests.", "retries")
+        add_metric("request_bytes_total", "counter", "Size of the bodies of the REST requests.", "request_bytes")
+        add_metric("response_bytes_total", "counter", "Size of the bodies of the REST responses.", "response_bytes")
+        name = "%s_request_duration_seconds" % prefix
+        lines.append("# HELP %s Latency of REST requests." % name)
+        lines.append("# TYPE %s histogram" % name)
+        for template in sorted(metrics):
+            labels = _labels(template)
+            count = 0
+            for bound, n in metrics[template]["histogram"]:
+                count += n
+                le = "+Inf" if bound == float("inf") else _number(bound)
+                lines.append('%s_bucket{%s,le="%s"} %d' % (name, labels, le, count))
+            lines.append("%s_sum{%s} %s" % (name, labels, _number(metrics[template]["latency_sum"])))
+            lines.append("%s_count{%s} %d" % (name, labels, metrics[template]["calls"]))
+        return "\n".join(lines) + "\n"
+
+    @classmethod
+    def endpoint_template(cls, endpoint):
+        """
+        Get the template of an endpoint, in which the keys are replaced with ``{}``.
+
+        The REST paths of H2O are of the form ``/<version>/<Resource>[/<key>[/<sub-resource>[/<key>...]]]``, so the
+        segments following the resource are alternatively keys and names of sub-resources. The query is dropped.
+
+        :examples:
+
+        >>> H2OConnectionStats.endpoint_template("GET /3/Frames/iris.hex/summary?row_count=10")
+        'GET /3/Frames/{}/summary'
+        """
+        method, _, path = endpoint.partition(" ")
+        path = path.split("?", 1)[0]
+        segments = path.split("/")
+        res = segments[:3]  # "", version and resource
+        expect_key = True
+        for segment in segments[3:]:
+            if expect_key and segment not in cls._COLLECTION_SEGMENTS:
+                res.append("{}")
+                expect_key = False
+            else:
+                res.append(segment)
+                expect_key = True
+        return "%s %s" % (method, "/".join(res))
+
+    @classmethod
+    def _bucket_index(cls, latency):
+        for i, bound in enumerate(cls.LATENCY_BUCKETS):
+            if latency <= bound:
+                return i
+        return len(cls.LATENCY_BUCKETS)
+
+    @classmethod
+    def _percentile(cls, stats, q):
+        """Estimate a percentile of the latencies, interpolating linearly inside the bucket it falls in."""
+        rank = q * stats.calls
+        count = 0
+        for i, n in enumerate(stats.buckets):
+            if n and count + n >= rank:
+                lower = cls.LATENCY_BUCKETS[i - 1] if i > 0 else 0.0
+                upper = cls.LATENCY_BUCKETS[i] if i < len(cls.LATENCY_BUCKETS) else stats.latency_max
+                return min(lower + (upper - lower) * (rank - count) / n, stats.latency_max)
+            count += n
+        return 0.0
+
+    def __repr__(self):
+        with self._lock:
+            return "<H2OConnectionStats: %d requests to %d endpoints>" % (
+                sum(s.calls for s in viewvalues(self._endpoints)), len(self._endpoints))
+
+
+class _EndpointStats(object):
+    __slots__ = ("calls", "errors", "retries", "request_bytes", "response_bytes", "latency_sum", "latency_max",
+                 "buckets")
+
+    def __init__(self, n_buckets):
+        self.calls = 0
+        self.errors = 0
+        self.retries = 0
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.latency_sum = 0.0
+        self.latency_max = 0.0
+        self.buckets = [0] * n_buckets
+
+
+def _labels(template):
+    method, _, path = template.partition(" ")
+    return 'method="%s",endpoint="%s"' % (method, re.sub(r'(["\\])', r"\\\1", path))
+
+
+def _number(x):
+    return repr(float(x)) if isinstance(x, float) else str(x)
@@ -108,6 +108,28 @@ class H2OEstimator(ModelBase):
         self._train(parms, verbose=verbose)
         return self
 
+    def train_async(self, x=None, y=None, training_frame=None, offset_column=None, fold_column=None,
+                    weights_column=None, validation_frame=None, max_runtime_secs=None, ignored_columns=None,
+                    model_id=None):
+        """
+        Train the H2O model asynchronously using asyncio (requires Python 3.5+).
+
+        This method accepts the same parameters as :meth:`train`, but instead of blocking until the model is built,
+        it returns a coroutine that needs to be awaited: this allows to train many models concurrently from
+        a single event loop.
+
+        :returns: a coroutine resolving to this estimator once trained.
+
+        :examples:
+
+        >>> gbms = [H2OGradientBoostingEstimator(seed=s) for s in range(10)]
+        >>> await asyncio.gather(*[gbm.train_async(x, y, training_frame=train) for gbm in gbms])
+        """
+        from h2o.aio import train
+        return train(self, x=x, y=y, training_frame=training_frame, offset_column=offset_column,
+                     fold_column=fold_column, weights_column=weights_column, validation_frame=validation_frame,
+                     max_runtime_secs=max_runtime_secs, ignored_columns=ignored_columns, model_id=model_id)
+
     def train_segments(self, x=None, y=None, training_frame=None, offset_column=None, fold_column=None,
                        weights_column=None, validation_frame=None, max_runtime_secs=None, ignored_columns=None,
                        segments=None, segment_models_id=None, parallelism=1, verbose=False):
@@ -371,23 +393,21 @@ class H2OEstimator(ModelBase):
         m._options_ = self._options_
 
         if model_id is not None and model_json is not None and metrics_class is not None:
-            # build Metric objects out of each metrics
-            for metric in ["training_metrics", "validation_metrics", "cross_validation_metrics"]:
-                metrics = model_json["output"].get(metric, None)
-                if metrics is not None:
-                    if metric == "cross_validation_metrics":
-                        m._is_xvalidated = True
-                    mc = metrics_class_valid if metric == "validation_metrics" else metrics_class  
-                    # fixme: never ever ever modify the original payload!!! put the metric object somewhere else
-                    model_json["output"][metric] = mc(metrics, metric, model_json["algo"])
-            # if m._is_xvalidated:
-            if m._is_xvalidated and model_json["output"]["cross_validation_models"] is not None:
-                m._xval_keys = [i["name"] for i in model_json["output"]["cross_validation_models"]]
-
-            # build a useful dict of the params
-            for p in m._model_json["parameters"]:
-                m.parms[p["name"]] = p
-                
+            # Metric objects are built out of each metrics only when accessed
+            # fixme: never ever ever modify the original payload!!! put the metric object somewhere else
+            output = model_json["output"] = _ModelOutput(model_json["output"], model_json["algo"], dict(
+                training_metrics=metrics_class,
+                validation_metrics=metrics_class_valid,
+                cross_validation_metrics=metrics_class
+            ))
+            m._is_xvalidated = output.get("cross_validation_metrics", None, convert=False) is not None
+            if m._is_xvalidated and output["cross_validation_models"] is not None:
+                m._xval_keys = [i["name"] for i in output["cross_validation_models"]]
+
+            # the useful dict of the params is built from these only when accessed
+            m._parms_json = m._model_json["parameters"]
+
+
         extensions = [load_ext(ext) for ext in self._options_.get('model_extensions', [])]
         mixin(self._model, model_class, *extensions)
         assign(self._model, m)
@@ -528,3 +548,32 @@ class H2OEstimator(ModelBase):
         if cls.__default_params is None:
             cls.__default_params = cls()
         return getattr(cls.__default_params, param_name)
+
+
+class _ModelOutput(dict):
+    """
+    Output section of a model JSON, in which each metrics is turned into a metrics object when first accessed.
+
+    Only the accesses by key (``output[key]`` and ``output.get(key)``) return the metrics objects: iterating over the
+    values or the items of the output may still return the raw metrics.
+    """
+
+    def __init__(self, output, algo, metrics_classes):
+        super(_ModelOutput, self).__init__(output)
+        self._algo = algo
+        self._metrics_classes = metrics_classes  # metrics key -> metrics class, for the metrics not converted yet
+
+    def __getitem__(self, key):
+        value = super(_ModelOutput, self).__getitem__(key)
+        metrics_class = self._metrics_classes.get(key)
+        if metrics_class is not None:
+            if value is not None:
+                value = metrics_class(value, key, self._algo)
+                self[key] = value
+            self._metrics_classes.pop(key, None)
+        return value
+
+    def get(self, key, default=None, convert=True):
+        if key not in self:
+            return default
+        return self[key] if convert else super(_ModelOutput, self).__getitem__(key)
@@ -1868,6 +1868,18 @@ def _get_models_from_automl_or_leaderboard(automl_or_leaderboard, filter_=lambda
     return (model for model in models if filter_(model))
 
 
+def _fetch_models_from_automl_or_leaderboard(automl_or_leaderboard, filter_=lambda _: True):
+    # type: (object) -> List[h2o.model.ModelBase]
+    """
+    Get all the models from H2OAutoML object or leaderboard, fetched concurrently
+    :param automl_or_leaderboard: AutoML
+    :param filter_: a predicate used to filter models. Signature of the filter is (model) -> bool.
+    :return: List[h2o.model.ModelBase]
+    """
+    models = h2o.get_models(_get_model_ids_from_automl_or_leaderboard(automl_or_leaderboard))
+    return [model for model in models if filter_(model)]
+
+
 def _get_xy(model):
     # type: (h2o.model.ModelBase) -> Tuple[List[str], str]
     """
@@ -2131,7 +2143,7 @@ def varimp(
         :returns: either pandas DataFrame (if use_pandas == True) or a triple (varimps, model_ids, variable_names)
     """
     if _is_automl_or_leaderboard(models):
-        models = list(_get_models_from_automl_or_leaderboard(models, filter_=_has_varimp))
+        models = _fetch_models_from_automl_or_leaderboard(models, filter_=_has_varimp)
     else:
         # Filter out models that don't have varimp
         models = [model for model in models if _has_varimp(model)]
@@ -2276,7 +2288,7 @@ def model_correlation(
     :returns: either pandas DataFrame (if use_pandas == True) or a tuple (correlation_matrix, model_ids)
     """
     if _is_automl_or_leaderboard(models):
-        models = list(_get_models_from_automl_or_leaderboard(models))
+        models = _fetch_models_from_automl_or_leaderboard(models)
     is_classification = frame[models[0].actual_params["response_column"]].isfactor()[0]
     predictions = []
     with no_progress():
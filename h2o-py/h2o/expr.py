@@ -8,21 +8,24 @@ Rapids expressions. These are helper classes for H2OFrame.
 from __future__ import division, print_function, absolute_import, unicode_literals
 from h2o.utils.compatibility import *  # NOQA
 
-from collections import OrderedDict
+from collections import OrderedDict, deque
 import copy
-import gc
-import inspect
 import math
+import threading
 import time
 import numbers
+import warnings
+import weakref
 
 import tabulate
 
 import h2o
 from h2o.backend.connection import H2OConnectionError
+from h2o.exceptions import H2OResponseError, H2OServerError
 from h2o.utils.shared_utils import _is_fr, _py_tmp_key
+from h2o.utils.threading import local_context
 from h2o.model.model_base import ModelBase
-from h2o.expr_optimizer import optimize
+from h2o.expr_optimizer import eliminate_common_subexpressions, is_deterministic, optimize
 
 
 class ExprNode(object):
@@ -41,8 +44,9 @@ class ExprNode(object):
       ----------------------
         An expression is declared top-level if it
           A) Computes and returns an H2OFrame to some on-demand call from somewhere
-          B) An H2OFrame instance has more referrers than the 4 needed for the usual flow
-             of python execution (see MAGIC_REF_COUNT below for more details).
+          B) Is referred to by more than one H2OFrame instance or parent expression, in which case
+             it is computed once into a temporary frame instead of being recomputed by each referrer.
+             Each ExprNode tracks (weakly) the frames and parent nodes referring to it for that purpose.
 
       Sane Amount of State
       --------------------
@@ -78,6 +82,7 @@ class ExprNode(object):
     def __init__(self, op="", *args):      
         # assert isinstance(op, str), op
         self._op = op  # Base opcode string
+        self._referrers = weakref.WeakValueDictionary()  # frames and parent nodes referring to this node, by id
         self._children = tuple(
             a._ex if _is_fr(a) else a for a in args)  # ast children; if not None and _cache._id is not None then tmp
         self._cache = H2OCache()  # ncols, nrows, names, types
@@ -85,6 +90,38 @@ class ExprNode(object):
         if self.__ENABLE_EXPR_OPTIMIZATIONS__:
             self._optimize()
 
+    @property
+    def _children(self):
+        return self._args
+
+    @_children.setter
+    def _children(self, children):
+        self._args = children
+        for child in children or ():
+            if isinstance(child, ExprNode):
+                child._add_referrer(self)
+
+    def _add_referrer(self, referrer):
+        """Register a frame or a parent node referring to this node (see `_ref_count`)."""
+        self._referrers[id(referrer)] = referrer
+
+    def _ref_count(self):
+        """
+        Number of references to this node from frames and parent nodes (a parent using this node as several of its
+        arguments, e.g. after common subexpression elimination, counts for as many references).
+
+        Referrers are registered when they start to refer to this node, and dropped automatically when they are
+        garbage-collected; those which stopped referring to this node since (frame assigned to another expression,
+        node rewritten by the optimizer or evaluated) are ignored.
+        """
+        count = 0
+        for ref in list(self._referrers.values()):
+            if isinstance(ref, ExprNode):
+                count += sum(child is self for child in ref._children or ())
+            else:
+                count += ref._ex is self
+        return count
+
     def _eager_frame(self):
         if not self._cache.is_empty(): return
         if self._cache._id is not None: return  # Data already computed under ID, but not cached locally
@@ -95,9 +132,15 @@ class ExprNode(object):
             assert self._cache.is_scalar()
             return self
         assert self._cache._id is None
+        key = ScalarResultCache.key(self)
+        cached = ScalarResultCache.get(key)
+        if cached is not None:
+            self._cache._data = cached
+            return cached
         self._eval_driver('scalar')
         assert self._cache._id is None
         assert self._cache.is_scalar()
+        ScalarResultCache.put(key, self._cache._data)
         return self._cache._data
 
     def _eager_map_frame(self):  # returns a scalar (or a list of scalars)
@@ -111,6 +154,8 @@ class ExprNode(object):
             or None if no object creation is expected.
         :return: self expr
         """
+        if self.__ENABLE_EXPR_OPTIMIZATIONS__:
+            eliminate_common_subexpressions(self)
         exec_str = self._get_ast_str(top)
         res = ExprNode.rapids(exec_str)
         if 'scalar' in res:
@@ -136,42 +181,61 @@ class ExprNode(object):
             else:
                 break
 
-    # Recursively build a rapids execution string.
+    def _copy(self, *args):
+        """
+        A new node with the same operator as this one, and the given children.
+        The node is not optimized: this is meant to copy nodes already optimized, e.g. cached translations of lambdas.
+        """
+        node = ExprNode.__new__(ExprNode)
+        node._op = self._op
+        node._referrers = weakref.WeakValueDictionary()
+        node._children = args
+        node._cache = H2OCache()
+        return node
+
+    # Build a rapids execution string.
     # Any object with more than 1 referrer node will be cached as a temp until the next client GC cycle - consuming memory.
     # Do Not Call This except when you need to do some other cluster operation on the evaluated object.
     # Examples might be: lazy dataset time parse vs changing the global timezone.
     # Global timezone change is eager, so the time parse as to occur in the correct order relative to
     # the timezone change, so cannot be lazy.
     #
+    # The DAG is traversed with an explicit stack (expressions built iteratively can be thousands of levels deep),
+    # and the string fragments are appended to a single buffer joined at the end.
+    # A shared subtree is emitted only once: as a `tmp=` binding the first time, then as a reference to its id.
+    #
     def _get_ast_str(self, top=None):
-        if not self._cache.is_empty():  # Data already computed and cached; could a "false-like" cached value
-            return str(self._cache._data) if self._cache.is_scalar() else self._cache._id
-        if self._cache._id is not None:
-            return self._cache._id  # Data already computed under ID, but not cached
-        assert isinstance(self._children,tuple)
-        exec_str = "({} {})".format(self._op, " ".join([ExprNode._arg_to_expr(ast) for ast in self._children]))
-
-        def is_ast_expr(ref):
-            return isinstance(ref, list) and any(map(lambda r: isinstance(r, ASTId), ref))
-
-        def is_debug_ref(ref):
-            # if ref is a dict, then it is a `locals` scope: most of those are added in debug mode.
-            # However, keeping it if this scope refers to an H2OFrame (has `_ex` entry)
-            return isinstance(ref, dict) and '_ex' not in ref
-
-        referrers = gc.get_referrers(self)
-        # removing frames from the referrers to get a consistent behaviour accross Py versions
-        #  as stack frames don't appear in the referrers from Py 3.7.
-        # also removing the AST expressions built in astfun.py
-        #  as they keep a reference to self if the lambda itself is using a free variable.
-        proper_ref = [r for r in referrers if not (inspect.isframe(r) or is_ast_expr(r) or is_debug_ref(r))]
-        ref_cnt = len(proper_ref)
-        del referrers, proper_ref
-        # if this self node is referenced by at least one other node (nested expr), then create a tmp frame
-        if top == 'frame' or (not top and ref_cnt > 1):
-            self._cache._id = _py_tmp_key(append=h2o.connection().session_id)
-            exec_str = "(tmp= {} {})".format(self._cache._id, exec_str)
-        return exec_str
+        buf = []
+        stack = [(self, top)]  # (node, top) to serialize, (node, top, tmp_slot) to close, or text to append
+        while stack:
+            item = stack.pop()
+            if not isinstance(item, tuple):
+                buf.append(item)
+                continue
+            node, node_top = item[0], item[1]
+            if len(item) == 3:  # all the children of node have been serialized
+                buf.append(")")
+                # if this node is referenced by at least one other node (nested expr), then create a tmp frame
+                if node_top == 'frame' or (not node_top and node._ref_count() > 1):
+                    node._cache._id = _py_tmp_key(append=h2o.connection().session_id)
+                    buf[item[2]] = "(tmp= %s " % node._cache._id
+                    buf.append(")")
+                continue
+            if not node._cache.is_empty():  # Data already computed and cached; could a "false-like" cached value
+                buf.append(str(node._cache._data) if node._cache.is_scalar() else node._cache._id)
+                continue
+            if node._cache._id is not None:
+                buf.append(node._cache._id)  # Data already computed under ID, but not cached
+                continue
+            assert isinstance(node._children, tuple)
+            stack.append((node, node_top, len(buf)))
+            buf.append("")  # slot for the `tmp=` binding, known only once the children are serialized
+            buf.append("(%s " % node._op)
+            for i, child in enumerate(reversed(node._children)):
+                if i > 0:
+                    stack.append(" ")
+                stack.append((child, None) if isinstance(child, ExprNode) else ExprNode._arg_to_expr(child))
+        return "".join(buf)
 
     @staticmethod
     def _arg_to_expr(arg):
@@ -202,7 +266,7 @@ class ExprNode(object):
     def __del__(self):
         try:
             if self._cache._id is not None and self._children is not None:
-                ExprNode.rapids("(rm {})".format(self._cache._id))
+                TmpRemovals.add(self._cache._id)
         except (AttributeError, H2OConnectionError):
             pass
 
@@ -226,18 +290,23 @@ class ExprNode(object):
         return ' '.join(["(" + self._op] + [ExprNode._arg_to_expr(a) for a in self._children] + [")"])
 
     def _2_string(self, depth=0, sb=None):
-        sb += ['\n', " " * depth, "(" + self._op, " "]
-        if self._children is not None:
-            for child in self._children:
+        stack = [(self, depth)]  # nodes to print, or closing strings
+        while stack:
+            node, depth = stack.pop()
+            if not isinstance(node, ExprNode):
+                sb += node
+                continue
+            sb += ['\n', " " * depth, "(" + node._op, " "]
+            stack.append((['\n', ' ' * depth + ") "] + ['\n'] * (depth == 0), depth))  # add a \n if depth == 0
+            for child in reversed(node._children or ()):
                 if _is_fr(child) and child._ex._cache._id is None:
-                    child._ex._2_string(depth + 2, sb)
+                    stack.append((child._ex, depth + 2))
                 elif _is_fr(child):
-                    sb += ['\n', ' ' * (depth + 2), child._ex._cache._id]
+                    stack.append((['\n', ' ' * (depth + 2), child._ex._cache._id], depth))
                 elif isinstance(child, ExprNode):
-                    child._2_string(depth + 2, sb)
+                    stack.append((child, depth + 2))
                 else:
-                    sb += ['\n', ' ' * (depth + 2), str(child)]
-        sb += ['\n', ' ' * depth + ") "] + ['\n'] * (depth == 0)  # add a \n if depth == 0
+                    stack.append((['\n', ' ' * (depth + 2), str(child)], depth))
         return sb
 
     def __repr__(self):
@@ -256,9 +325,240 @@ class ExprNode(object):
 
         :returns: The JSON response (as a python dictionary) of the Rapids execution
         """
+        if TmpRemovals.is_due():
+            TmpRemovals.flush()
         return h2o.api("POST /99/Rapids", data={"ast": expr, "session_id": h2o.connection().session_id})
 
 
+class ExprBatch(object):
+    """
+    Collects the lazy frames created or modified in a ``with h2o.batch():`` block, to evaluate them all
+    with a single Rapids request when the block exits.
+
+    The frames still alive (and not evaluated yet) at the end of the block are evaluated in the order of their
+    last modification, which guarantees that a frame used in the expression of another one is evaluated first,
+    as a sequence of `tmp=` bindings: `(, (tmp= py_1 ...) (tmp= py_2 ...) ...)`.
+    """
+
+    def __init__(self):
+        self._frames = OrderedDict()  # id(frame) -> weakref to frame, by order of last modification
+
+    def add(self, frame):
+        key = id(frame)
+        self._frames.pop(key, None)
+        self._frames[key] = weakref.ref(frame)
+
+    def execute(self):
+        """Evaluate the frames collected so far, with a single Rapids request."""
+        frames = [ref() for ref in self._frames.values()]
+        self._frames.clear()
+        roots = []
+        for frame in frames:
+            node = frame._ex if frame is not None else None
+            if node is not None and node._children is not None and node not in roots:
+                roots.append(node)
+        pending = list(_walk_lazy_nodes(roots))
+        if not pending:
+            return
+        asts = []
+        try:
+            for node in roots:
+                if not node._cache.is_empty() or node._cache._id is not None:
+                    continue  # already evaluated, possibly as part of a previous frame
+                if ExprNode.__ENABLE_EXPR_OPTIMIZATIONS__:
+                    eliminate_common_subexpressions(node)
+                asts.append(node._get_ast_str('frame'))
+                last = node
+            res = ExprNode.rapids(asts[0] if len(asts) == 1 else "(, %s)" % " ".join(asts))
+        except Exception:
+            for node in pending:  # nothing was computed: the expressions remain lazy
+                node._cache._id = None
+            raise
+        # only the last frame is described in the response, the others will be described on demand
+        if 'key' in res:
+            last._cache.nrows = res['num_rows']
+            last._cache.ncols = res['num_cols']
+
+
+def _walk_lazy_nodes(roots):
+    """Iterate over the nodes not evaluated yet in the DAGs of the given expressions."""
+    seen = set()
+    stack = list(roots)
+    while stack:
+        node = stack.pop()
+        if node in seen or not node._cache.is_empty() or node._cache._id is not None or node._children is None:
+            continue
+        seen.add(node)
+        yield node
+        stack.extend(child for child in node._children if isinstance(child, ExprNode))
+
+
+class TmpRemovals(object):
+    """
+    Deferred removal of the temporary frames that are no longer referenced on the client side.
+
+    Instead of sending a blocking `(rm key)` request from the garbage collector (i.e. at unpredictable times)
+    for each temporary frame, the keys are queued and removed in batches, with a single Rapids request per batch.
+    The queue is flushed at the next Rapids request once it holds `batch_size` keys, or once its oldest key has
+    been waiting for more than `max_delay` seconds, or explicitly with :func:`h2o.flush_tmp_removals`.
+
+    Deferred removal can be disabled with :func:`h2o.enable_deferred_tmp_removal`, each temporary frame being then
+    removed immediately.
+    """
+
+    enabled = True
+    batch_size = 100
+    max_delay = 5.0  # seconds
+
+    # (connection, key) pairs. No lock is used: `add` is called by the garbage collector, i.e. at any allocation,
+    # including while the queue is being flushed, and the operations on a deque are atomic.
+    _pending = deque()
+    _since = None  # time when the oldest pending key was queued
+
+    @classmethod
+    def add(cls, key):
+        conn = h2o.connection()
+        if conn is None:
+            return
+        if not cls.enabled:
+            cls._remove_all([key], conn)
+            return
+        if not cls._pending:
+            cls._since = time.time()
+        cls._pending.append((conn, key))
+
+    @classmethod
+    def is_due(cls):
+        pending = cls._pending
+        return bool(pending) and (len(pending) >= cls.batch_size or time.time() - cls._since >= cls.max_delay)
+
+    @classmethod
+    def flush(cls):
+        by_conn = OrderedDict()
+        while True:
+            try:
+                conn, key = cls._pending.popleft()
+            except IndexError:
+                break
+            by_conn.setdefault(conn, []).append(key)
+        for conn, keys in by_conn.items():
+            cls._remove_all(keys, conn)
+
+    @classmethod
+    def _remove_all(cls, keys, conn):
+        # the removals are flushed during unrelated requests, so they must not fail those
+        try:
+            cls._remove(keys, conn)
+        except H2OConnectionError:
+            pass  # the backend is gone, and its temporary frames with it
+        except (H2OResponseError, H2OServerError) as e:
+            if len(keys) > 1:  # removed one by one, so that a failing removal doesn't prevent the others
+                for key in keys:
+                    cls._remove_all([key], conn)
+            else:
+                warnings.warn("Failed to remove the temporary frame %s: %s" % (keys[0], e))
+
+    @staticmethod
+    def _remove(keys, conn):
+        ast = "(rm %s)" % keys[0] if len(keys) == 1 else "(, %s)" % " ".join("(rm %s)" % k for k in keys)
+        with local_context(connection=conn):
+            h2o.api("POST /99/Rapids", data={"ast": ast, "session_id": conn.session_id})
+
+
+class ScalarResultCache(object):
+    """
+    Client-side cache (LRU) of the results of the expressions evaluated to scalars (or lists of scalars), e.g. the
+    summaries of a frame like `fr.mean()`, `fr.nacnt()` or `fr.min()`, so that they are not computed again by the
+    backend as long as the frames they are computed from are not modified.
+
+    The results are identified by the Rapids representation of their expression, in which the frames already
+    evaluated are identified by their key and mutation epoch: the epoch of a key is incremented each time the frame
+    is modified in place, or when the key is reassigned or removed. Expressions with non-deterministic operations
+    (e.g. random numbers) are never cached.
+
+    The cache is disabled by default, see :func:`h2o.enable_scalar_result_cache`. Only the changes made through this
+    client are tracked: the cache must not be enabled if the frames are modified by other clients.
+    """
+
+    enabled = False
+    max_size = 1000
+
+    hits = 0
+    misses = 0
+
+    _lock = threading.Lock()
+    _entries = OrderedDict()  # key -> result
+    _epochs = {}  # frame key -> number of modifications of the frame
+
+    @classmethod
+    def key(cls, expr):
+        """The cache key of the expression, or None if the cache is disabled or the result cannot be cached."""
+        if not cls.enabled:
+            return None
+        reprs = {}  # node -> Rapids representation of the node
+        stack = [(expr, False)]
+        while stack:
+            node, expanded = stack.pop()
+            if node in reprs:
+                continue
+            if node._cache._id is not None:
+                reprs[node] = "%s@%d" % (node._cache._id, cls._epochs.get(node._cache._id, 0))
+            elif not node._cache.is_empty():
+                reprs[node] = str(node._cache._data)
+            elif node._children is None or not is_deterministic(node._op):
+                return None
+            elif not expanded:
+                stack.append((node, True))
+                stack.extend((child, False) for child in node._children if isinstance(child, ExprNode))
+            else:
+                args = [reprs[child] if isinstance(child, ExprNode) else ExprNode._arg_to_expr(child)
+                        for child in node._children]
+                reprs[node] = "(%s %s)" % (node._op, " ".join(args))
+        conn = h2o.connection()
+        return None if conn is None else (conn.session_id, reprs[expr])
+
+    @classmethod
+    def get(cls, key):
+        if key is None:
+            return None
+        with cls._lock:
+            result = cls._entries.pop(key, None)
+            if result is None:
+                cls.misses += 1
+                return None
+            cls._entries[key] = result  # most recently used
+            cls.hits += 1
+        return copy.deepcopy(result)
+
+    @classmethod
+    def put(cls, key, result):
+        if key is None or result is None:
+            return
+        with cls._lock:
+            cls._entries[key] = copy.deepcopy(result)
+            while len(cls._entries) > cls.max_size:
+                cls._entries.popitem(last=False)
+
+    @classmethod
+    def invalidate(cls, frame_key):
+        """Discard the results computed from the frame with the given key, as it is modified."""
+        if not cls.enabled or frame_key is None:
+            return
+        with cls._lock:
+            cls._epochs[frame_key] = cls._epochs.get(frame_key, 0) + 1
+
+    @classmethod
+    def clear(cls):
+        with cls._lock:
+            cls._entries.clear()
+            cls._epochs.clear()
+
+    @classmethod
+    def stats(cls):
+        with cls._lock:
+            return dict(hits=cls.hits, misses=cls.misses, size=len(cls._entries))
+
+
 class ASTId:
     def __init__(self, name=None):
         if name is None:
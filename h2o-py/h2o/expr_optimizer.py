@@ -6,8 +6,15 @@ Rapids expression optimizer.
 :license:   Apache License Version 2.0 (see LICENSE for details)
 """
 from __future__ import absolute_import, division, print_function, unicode_literals
+from h2o.utils.compatibility import *  # NOQA
+
+import math
+import numbers
+import operator
 
 import h2o.expr
+from h2o.utils.shared_utils import slice_is_normalized
+from h2o.utils.typechecks import is_type
 
 
 class ExprOptimization(object):
@@ -113,6 +120,321 @@ class SkipExprOptimization(ExprOptimization):
         return foptimizer
 
 
+class SliceFusionOptimization(ExprOptimization):
+    """
+    Slice fusion: a column (resp. row) selection of a column (resp. row)
+    selection is replaced by a single selection of the source.
+
+    For example:
+      (cols_py (cols_py fr [1 3 4 5]) [1:2]) is transformed to (cols_py fr [3 4])
+      (rows (rows fr [10:90]) [0:10]) is transformed to (rows fr [10:10])
+
+    Only selections by position (or by name for columns) are fused: a row
+    selection by a boolean frame depends on the data, and is left as is.
+    Row positions are fused only if they are sorted, as the backend
+    returns the selected rows in the order of the source frame.
+
+    Objective:
+      - a single slice is computed instead of 2, saving a temporary frame
+    """
+
+    def __init__(self):
+        super(self.__class__, self).__init__(["cols_py", "rows"])
+
+    def is_applicable(self, expr):
+        assert isinstance(expr, h2o.expr.ExprNode)
+        return self._fused_selection(expr) is not None
+
+    def get_optimizer(self, expr):
+        def foptimizer(ctx):
+            selection = self._fused_selection(expr)
+            expr._children = (expr.arg(0).arg(0), selection)
+            return expr
+
+        return foptimizer
+
+    @staticmethod
+    def _fused_selection(expr):
+        """The selection of the source equivalent to the 2 nested selections, or None if they cannot be fused."""
+        if expr.narg() != 2 or not _is_lazy(expr.arg(0)):
+            return None
+        inner_expr = expr.arg(0)
+        if inner_expr._op != expr._op or inner_expr.narg() != 2:
+            return None
+        by_name = expr._op == "cols_py"
+        positions = _selected_positions(inner_expr.arg(1), by_name)
+        if positions is None or not by_name and not _is_sorted(positions):
+            return None
+        selection = expr.arg(1)
+        n = len(positions)
+        if is_type(selection, int):
+            return positions[selection] if 0 <= selection < n else None
+        if by_name and is_type(selection, str):
+            return selection if selection in positions else None
+        if isinstance(selection, slice):
+            if not slice_is_normalized(selection) or selection.stop > n or selection.start >= selection.stop:
+                return None
+            fused = positions[selection]
+        elif isinstance(selection, list) and selection and all(is_type(i, int) and 0 <= i < n for i in selection):
+            fused = [positions[i] for i in selection]
+        elif by_name and isinstance(selection, list) and selection and all(is_type(c, str) for c in selection):
+            fused = selection if all(c in positions for c in selection) else None
+        else:
+            return None
+        if fused is None or not by_name and not _is_sorted(fused):
+            return None
+        return slice(fused.start, fused.stop, fused.step) if isinstance(fused, range) else fused
+
+
+class FilterPushdownOptimization(ExprOptimization):
+    """
+    Filter push-down: a column projection of a row selection is transformed
+    into the same row selection of the column projection.
+
+    For example:
+      (cols_py (rows fr (> (cols_py fr 0) 0)) [1 2]) is transformed to
+      (rows (cols_py fr [1 2]) (> (cols_py fr 0) 0))
+
+    Objective:
+      - the rows are selected (a full pass over the data for a boolean filter)
+        and copied from the projected columns only
+    """
+
+    def __init__(self):
+        super(self.__class__, self).__init__(["cols_py", "cols"])
+
+    def is_applicable(self, expr):
+        assert isinstance(expr, h2o.expr.ExprNode)
+        if expr.narg() == 2 and _is_lazy(expr.arg(0)):
+            rows_expr = expr.arg(0)
+            return rows_expr._op == "rows" and rows_expr.narg() == 2
+        return False
+
+    def get_optimizer(self, expr):
+        def foptimizer(ctx):
+            rows_expr = expr.arg(0)
+            projection = h2o.expr.ExprNode(expr._op, rows_expr.arg(0), expr.arg(1))
+            expr._op = "rows"
+            expr._children = (projection, rows_expr.arg(1))
+            return expr
+
+        return foptimizer
+
+
+class UnaryChainOptimization(ExprOptimization):
+    """
+    Unary chain optimization: a unary operator which is a no-op on the result
+    of the nested unary operator is removed.
+
+    For example:
+      (abs (abs fr)) is transformed to (abs fr)
+      (floor (ceiling fr)) is transformed to (ceiling fr)
+
+    Objective:
+      - the chain is computed in a single pass, saving a temporary frame
+    """
+
+    # operators f such that f(f(x)) == f(x)
+    _idempotent_ops = {"abs", "sign", "floor", "ceiling", "trunc"}
+    # operators which are a no-op on integers, and operators returning integers
+    _integer_noop_ops = {"floor", "ceiling", "trunc"}
+    _integral_ops = {"floor", "ceiling", "trunc", "sign"}
+
+    def __init__(self):
+        super(self.__class__, self).__init__(self._idempotent_ops)
+
+    def is_applicable(self, expr):
+        assert isinstance(expr, h2o.expr.ExprNode)
+        if expr.narg() == 1 and _is_lazy(expr.arg(0)) and expr.arg(0).narg() == 1:
+            nested_op = expr.arg(0)._op
+            return nested_op == expr._op or (expr._op in self._integer_noop_ops and nested_op in self._integral_ops)
+        return False
+
+    def get_optimizer(self, expr):
+        def foptimizer(ctx):
+            nested_expr = expr.arg(0)
+            expr._op = nested_expr._op
+            expr._children = nested_expr._children
+            return expr
+
+        return foptimizer
+
+
+class ConstantFoldingOptimization(ExprOptimization):
+    """
+    Constant folding: the arguments of an operator which are arithmetic
+    operations over numeric constants are replaced by their value,
+    computed client-side.
+
+    For example:
+      (* fr (+ 1 (/ 1 4))) is transformed to (* fr 1.25)
+
+    Only the operations computed exactly like in the backend (double precision
+    arithmetic and comparisons) are folded, and only if their arguments
+    and result are finite numbers.
+
+    Objective:
+      - the constants are not computed by the backend, each one in its own temporary
+    """
+
+    _folds = {"+": operator.add, "-": operator.sub, "*": operator.mul, "/": operator.truediv,
+              "==": operator.eq, "!=": operator.ne, "<": operator.lt, "<=": operator.le,
+              ">": operator.gt, ">=": operator.ge}
+
+    def __init__(self):
+        super(self.__class__, self).__init__(list(self._folds))
+
+    def supports(self, op):
+        # constants can be arguments of any operator
+        return True
+
+    def is_applicable(self, expr):
+        assert isinstance(expr, h2o.expr.ExprNode)
+        return any(self._value(arg) is not None for arg in expr._children or ())
+
+    def get_optimizer(self, expr):
+        def foptimizer(ctx):
+            values = [self._value(arg) for arg in expr._children]
+            expr._children = tuple(arg if value is None else value for arg, value in zip(expr._children, values))
+            return expr
+
+        return foptimizer
+
+    def _value(self, expr):
+        """Value of the given argument if it is a foldable operation over constants, otherwise None."""
+        if not _is_lazy(expr) or expr._op not in self._supported_ops or expr.narg() != 2:
+            return None
+        if not all(_is_finite_number(arg) for arg in expr._children):
+            return None
+        lhs, rhs = (float(arg) for arg in expr._children)
+        if expr._op == "/" and rhs == 0:
+            return None
+        value = float(self._folds[expr._op](lhs, rhs))
+        return value if _is_finite_number(value) else None
+
+
+def _is_lazy(expr):
+    """Is the given argument an expression not evaluated yet (thus which can be rewritten without any recomputation)."""
+    return (isinstance(expr, h2o.expr.ExprNode) and expr._children is not None and
+            expr._cache.is_empty() and expr._cache._id is None)
+
+
+def _is_finite_number(x):
+    return isinstance(x, numbers.Real) and not isinstance(x, bool) and not math.isinf(x) and not math.isnan(x)
+
+
+def _is_sorted(positions):
+    if isinstance(positions, range):
+        return positions.step > 0
+    return all(a < b for a, b in zip(positions, positions[1:]))
+
+
+def _selected_positions(selection, by_name):
+    """
+    The columns/rows selected by a selector, as a sequence of positions (or of names),
+    or None if they cannot be known client-side.
+    """
+    if is_type(selection, int):
+        return [selection] if selection >= 0 else None
+    if by_name and is_type(selection, str):
+        return [selection]
+    if isinstance(selection, slice):
+        return range(selection.start, selection.stop, selection.step) if slice_is_normalized(selection) else None
+    if isinstance(selection, list) and selection:
+        if all(is_type(i, int) and i >= 0 for i in selection):
+            return selection
+        if by_name and all(is_type(c, str) for c in selection):
+            return selection
+    return None
+
+
+# operations whose result may differ between two identical calls (random seeds, time zone),
+# or with side effects
+_non_deterministic_ops = {"h2o.runif", "h2o.random_stratified_split", "kfold_column", "stratified_kfold_column",
+                          "h2o.impute", "assign", "tmp=", "rm", "ls", "setTimeZone", "getTimeZone"}
+
+
+def is_deterministic(op):
+    """
+    Whether the given operator always gives the same result for the same arguments, without side effect.
+    """
+    return op not in _non_deterministic_ops
+
+
+class CommonSubexprElimination(object):
+    """
+    Common subexpression elimination: structurally identical subtrees
+    of an expression DAG are replaced by a single node.
+
+    For example:
+      (/ (- (cols_py fr "a") 1) (sd (cols_py fr "a") TRUE)) is transformed to
+      (/ (- (tmp= py_1 (cols_py fr "a")) 1) (sd py_1 TRUE))
+
+    As the shared node is then referred to by several parents, it is serialized
+    as a single `tmp=` binding that the other occurrences refer to by id
+    (see `ExprNode._get_ast_str`), so Rapids evaluates it only once per request.
+
+    Contrary to the other optimizations, which are applied to each new node,
+    this pass is applied to the whole DAG just before it is sent to the backend.
+    """
+
+    def __call__(self, expr):
+        assert isinstance(expr, h2o.expr.ExprNode)
+        canonical = {}  # node -> canonical node of the structural equivalence class of node
+        by_key = {}  # structural key -> canonical node
+        stack = [(expr, False)]
+        while stack:  # iterative post-order traversal, as the DAGs can be very deep
+            node, expanded = stack.pop()
+            if node in canonical:
+                continue
+            if not node._cache.is_empty() or node._cache._id is not None:
+                # already computed: its children won't be serialized, it is identified by its id (or value)
+                canonical[node] = by_key.setdefault(node._get_ast_str(), node)
+                continue
+            if node._children is None:
+                canonical[node] = node
+                continue
+            if not expanded:
+                stack.append((node, True))
+                stack.extend((child, False) for child in self._subexpressions(node) if child not in canonical)
+                continue
+            # the nodes of a lambda body are not in `canonical`: they are kept, and identified by the node itself
+            children = tuple(canonical.get(child, child) if isinstance(child, h2o.expr.ExprNode) else child
+                             for child in node._children)
+            if any(new is not old for new, old in zip(children, node._children)):
+                node._children = children
+            if not is_deterministic(node._op):  # never merged
+                key = node
+            else:
+                # children are identified by their canonical node, leaves by their Rapids representation
+                key = (node._op,) + tuple(child if isinstance(child, h2o.expr.ExprNode)
+                                          else h2o.expr.ExprNode._arg_to_expr(child) for child in children)
+            canonical[node] = by_key.setdefault(key, node)
+        return expr
+
+    @staticmethod
+    def _subexpressions(expr):
+        """
+        The children of a node which are expressions, except the ones in the body of a lambda (e.g. arguments of
+        `apply`): they refer to the lambda parameters, and cannot be computed on their own.
+        """
+        for child in expr._children:
+            if isinstance(child, h2o.expr.ASTId) and child.name == "{":
+                break
+            if isinstance(child, h2o.expr.ExprNode):
+                yield child
+
+
+def eliminate_common_subexpressions(expr):
+    """
+    Merge the structurally identical subtrees of the given expression DAG.
+
+    :param expr:  root of the expression DAG, about to be evaluated
+    :return:  the same expression, with common subexpressions shared
+    """
+    return __CSE__(expr)
+
+
 def optimize(expr):
     assert isinstance(expr, h2o.expr.ExprNode)
     all_optimizers = get_optimization(expr._op)
@@ -147,5 +469,11 @@ def id(expr):
 #
 __REGISTERED_EXPR_OPTIMIZATIONS__ = [
     FoldExprOptimization(),
-    SkipExprOptimization()
+    SkipExprOptimization(),
+    SliceFusionOptimization(),
+    FilterPushdownOptimization(),
+    UnaryChainOptimization(),
+    ConstantFoldingOptimization()
 ]
+
+__CSE__ = CommonSubexprElimination()
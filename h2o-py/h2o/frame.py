@@ -11,10 +11,15 @@ from h2o.utils.compatibility import *  # NOQA
 import csv
 import datetime
 import functools
+import math
 from io import StringIO
 import os
+import shutil
+import socket
 import sys
 import tempfile
+import threading
+import time
 import traceback
 from types import FunctionType
 import warnings
@@ -22,18 +27,19 @@ import warnings
 import h2o
 from h2o.base import Keyed
 from h2o.display import H2ODisplay, H2ODisplayWrapper, H2OItemsDisplay, H2OTableDisplay, display, in_ipy, in_zep, repr_def
-from h2o.exceptions import H2OTypeError, H2OValueError, H2ODeprecationWarning
-from h2o.expr import ExprNode
+from h2o.exceptions import (H2OConnectionError, H2OServerError, H2OTypeError, H2OValueError,
+                            H2ODeprecationWarning)
+from h2o.expr import ExprNode, H2OCache, ScalarResultCache
 from h2o.group_by import GroupBy
 from h2o.job import H2OJob
 from h2o.plot import get_matplotlib_pyplot, decorate_plot_result, RAISE_ON_FIGURE_ACCESS
 from h2o.utils.config import get_config_value
 from h2o.utils.metaclass import deprecated_fn
-from h2o.utils.shared_utils import (_handle_numpy_array, _handle_pandas_data_frame, _handle_python_dicts,
-                                    _handle_python_lists, _is_list, _is_str_list, _py_tmp_key, _quoted,
-                                    can_use_pandas, can_use_numpy, quote, normalize_slice, slice_is_normalized, 
-                                    check_frame_id)
-from h2o.utils.threading import local_context, local_env
+from h2o.utils.shared_utils import (_handle_numpy_array, _handle_python_dicts,
+                                    _handle_python_lists, _gen_header, _is_list, _is_str_list, _py_tmp_key, _quoted,
+                                    can_use_pandas, can_use_numpy, can_use_pyarrow, quote, normalize_slice,
+                                    slice_is_normalized, check_frame_id, FilePart, is_binary_file_head)
+from h2o.utils.threading import local_context, local_env, map_concurrently
 from h2o.utils.typechecks import (assert_is_type, assert_satisfies, Enum, I, is_type, numeric, numpy_ndarray,
                                   numpy_datetime, pandas_dataframe, pandas_timestamp, scipy_sparse, U)
 
@@ -88,6 +94,10 @@ class H2OFrame(Keyed, H2ODisplay):
     __LOCAL_EXPANSION_ON_SINGLE_IMPORT__ = True
     __fdopen_kwargs = {} if PY2 else {'encoding': 'utf-8'}
 
+    # Number of threads uploading concurrently the parts of a local file (see `part_size` in `h2o.upload_file`)
+    __UPLOAD_THREADS__ = 4
+    __UPLOAD_RETRIES__ = 3  # number of times the upload of a part is retried
+
     # ------------------------------------------------------------------------------------------------------------------
     # Construction
     # ------------------------------------------------------------------------------------------------------------------
@@ -113,6 +123,25 @@ class H2OFrame(Keyed, H2ODisplay):
             self._upload_python_object(python_obj, destination_frame, header, separator,
                                        column_names, column_types, na_strings, skipped_columns)
 
+    @property
+    def _ex(self):
+        try:
+            return self.__dict__["_ex"]
+        except KeyError:
+            raise AttributeError("_ex")
+
+    @_ex.setter
+    def _ex(self, expr):
+        previous = self.__dict__.get("_ex")
+        if previous is not None and previous is not expr:
+            ScalarResultCache.invalidate(previous._cache._id)  # the frame is modified (or detached)
+        self.__dict__["_ex"] = expr
+        if expr is not None:
+            expr._add_referrer(self)  # used by the expression to decide whether it needs to be computed as a tmp
+            batch = local_env('expr_batch')
+            if batch is not None:
+                batch.add(self)
+
     @staticmethod
     def _expr(expr, cache=None):
         # TODO: merge this method with `__init__`
@@ -128,9 +157,14 @@ class H2OFrame(Keyed, H2ODisplay):
         if is_type(python_obj, scipy_sparse):
             self._upload_sparse_matrix(python_obj, destination_frame=destination_frame)
             return
+        if is_type(python_obj, pandas_dataframe) or (is_type(python_obj, numpy_ndarray) and python_obj.ndim <= 2
+                                                      and header != 1 and can_use_pandas()):
+            self._upload_data_frame(python_obj, destination_frame=destination_frame, separator=separator,
+                                    column_names=column_names, column_types=column_types, na_strings=na_strings,
+                                    skipped_columns=skipped_columns)
+            return
         # TODO: all these _handlers should really belong to this class, not to shared_utils.
-        processor = (_handle_pandas_data_frame if is_type(python_obj, pandas_dataframe) else
-                     _handle_numpy_array if is_type(python_obj, numpy_ndarray) else
+        processor = (_handle_numpy_array if is_type(python_obj, numpy_ndarray) else
                      _handle_python_dicts if is_type(python_obj, dict) else
                      _handle_python_lists)
         col_header, data_to_write = processor(python_obj, header)
@@ -154,45 +188,52 @@ class H2OFrame(Keyed, H2ODisplay):
         self._upload_parse(tmp_path, destination_frame, 1, separator, column_names, column_types, na_strings, skipped_columns)
         os.remove(tmp_path)  # delete the tmp file
 
+    def _upload_data_frame(self, data, destination_frame=None, separator=",", column_names=None, column_types=None,
+                           na_strings=None, skipped_columns=None):
+        # pandas writes the csv column by column in chunks, without converting the whole frame to python objects
+        import pandas
+        df = data if is_type(data, pandas_dataframe) else pandas.DataFrame(data)
+        if df.shape[1] == 0:
+            raise H2OValueError("No data to write")
+        if not column_names:
+            column_names = (list(str(c) for c in df.columns) if is_type(data, pandas_dataframe)
+                            else _gen_header(df.shape[1]))
+        # the types known from the dtypes are passed to the parser, unless specified explicitly
+        known_types = _pandas_column_types(df, column_names)
+        if column_types is None:
+            column_types = known_types or None
+        elif isinstance(column_types, dict):
+            column_types = dict(known_types, **column_types)
+
+        tmp_handle, tmp_path = tempfile.mkstemp(suffix=".csv")
+        try:
+            with os.fdopen(tmp_handle, 'w', **H2OFrame.__fdopen_kwargs) as tmp_file:
+                df.to_csv(tmp_file, sep=separator, header=column_names, index=False, na_rep="")
+            self._upload_parse(tmp_path, destination_frame, 1, separator, column_names, column_types, na_strings,
+                               skipped_columns)
+        finally:
+            os.remove(tmp_path)
+
     def _upload_sparse_matrix(self, matrix, destination_frame=None):
         import scipy.sparse as sp
         if not sp.issparse(matrix):
             raise H2OValueError("A sparse matrix expected, got %s" % type(matrix))
 
         tmp_handle, tmp_path = tempfile.mkstemp(suffix=".svmlight")
-        out = os.fdopen(tmp_handle, 'wt', **H2OFrame.__fdopen_kwargs)
         if destination_frame is None:
             destination_frame = _py_tmp_key(h2o.connection().session_id)
-
-        # sp.find(matrix) returns (row indices, column indices, values) of the non-zero elements of A. Unfortunately
-        # there is no guarantee that those elements are returned in the correct order, so need to sort
-        data = zip(*sp.find(matrix))
-        if not isinstance(data, list): data = list(data)  # possibly convert from iterator to a list
-        data.sort()
-        idata = 0  # index of the next element to be consumed from `data`
-        for irow in range(matrix.shape[0]):
-            if idata < len(data) and data[idata][0] == irow and data[idata][1] == 0:
-                y = data[idata][2]
-                idata += 1
-            else:
-                y = 0
-            out.write(str(y))
-            while idata < len(data) and data[idata][0] == irow:
-                out.write(" ")
-                out.write(str(data[idata][1]))
-                out.write(":")
-                out.write(str(data[idata][2]))
-                idata += 1
-            out.write("\n")
-        out.close()
-
-        ret = h2o.api("POST /3/PostFile", filename=tmp_path)
-        os.remove(tmp_path)
+        try:
+            with os.fdopen(tmp_handle, 'wt', **H2OFrame.__fdopen_kwargs) as out:
+                _write_svmlight(matrix, out)
+            ret = h2o.api("POST /3/PostFile", filename=tmp_path)
+        finally:
+            os.remove(tmp_path)
         rawkey = ret["destination_frame"]
 
         p = {"source_frames": [rawkey], "destination_frame": destination_frame}
         H2OJob(h2o.api("POST /3/ParseSVMLight", data=p), "Parse").poll()
         self._ex._cache._id = destination_frame
+        ScalarResultCache.invalidate(destination_frame)
         self._ex._cache.fill()
 
     @staticmethod
@@ -263,6 +304,19 @@ class H2OFrame(Keyed, H2ODisplay):
         self._ex._cache.flush()
         self._frame(fill_cache=True)
 
+    def refresh_async(self):
+        """
+        Reload frame information from the backend H2O server asynchronously using asyncio (requires Python 3.5+).
+
+        :returns: a coroutine resolving to this frame once refreshed.
+
+        :examples:
+
+        >>> await frame.refresh_async()
+        """
+        from h2o.aio import refresh
+        return refresh(self)
+
     # ------------------------------------------------------------------------------------------------------------------
     # Frame properties
     # ------------------------------------------------------------------------------------------------------------------
@@ -414,6 +468,8 @@ class H2OFrame(Keyed, H2ODisplay):
             oldname = self.frame_id
             self._ex._cache._id = newid
             h2o.rapids("(rename \"{}\" \"{}\")".format(oldname, newid))
+            ScalarResultCache.invalidate(oldname)
+            ScalarResultCache.invalidate(newid)
 
     def type(self, col):
         """
@@ -452,13 +508,54 @@ class H2OFrame(Keyed, H2ODisplay):
         return self
 
     def _upload_parse(self, path, destination_frame, header, sep, column_names, column_types, na_strings, skipped_columns=None,
-                      quotechar=None, escapechar=None):
-        ret = h2o.api("POST /3/PostFile", filename=path)
-        rawkey = ret["destination_frame"]
-        self._parse(rawkey, destination_frame, header, sep, column_names, column_types, na_strings, skipped_columns,
+                      quotechar=None, escapechar=None, part_size=None):
+        # escaped quotes can't be told apart from the quotes delimiting the values: such files are never split
+        rawkeys = H2OFrame._upload_raw(path, part_size=None if escapechar else part_size, quotechar=quotechar)
+        self._parse(rawkeys, destination_frame, header, sep, column_names, column_types, na_strings, skipped_columns,
                     quotechar=quotechar, escapechar=escapechar)
         return self
 
+    @staticmethod
+    def _upload_raw(path, part_size=None, quotechar=None):
+        """
+        Upload the local file `path`, and return the key(s) of the raw frame(s) holding its content.
+
+        If `part_size` is given, a text file larger than `part_size` bytes is split on the line boundaries that are not
+        within quoted values, and the parts are uploaded concurrently as separate raw frames (each part being retried
+        on failure), to be parsed together.
+        """
+        parts = None
+        if part_size and os.path.isfile(path) and os.path.getsize(path) > part_size and _is_splittable(path):
+            parts = _line_aligned_parts(path, part_size, quotechar or '"')
+        if not parts or len(parts) == 1:
+            return h2o.api("POST /3/PostFile", filename=path)["destination_frame"]
+
+        # The keys of the parts are chosen by the client: a part retried after a failure (e.g. a timeout once the part
+        # was stored) replaces the previous attempt, and all the parts can be removed if the upload fails.
+        prefix = _py_tmp_key(append=h2o.connection().session_id)
+        rawkeys = ["%s_part%d" % (prefix, i) for i in range(len(parts))]
+
+        def upload_part(i):
+            offset, length = parts[i]
+            for attempt in range(H2OFrame.__UPLOAD_RETRIES__ + 1):
+                try:
+                    return h2o.api("POST /3/PostFile?destination_frame=%s" % rawkeys[i],
+                                   filename=FilePart(path, offset, length))["destination_frame"]
+                except (H2OConnectionError, H2OServerError):
+                    if attempt == H2OFrame.__UPLOAD_RETRIES__:
+                        raise
+                    time.sleep(2 ** attempt)
+
+        try:
+            return map_concurrently(upload_part, range(len(parts)), H2OFrame.__UPLOAD_THREADS__)
+        except Exception:
+            for rawkey in rawkeys:
+                try:
+                    h2o.remove(rawkey)
+                except Exception:
+                    pass
+            raise
+
     def _parse(self, rawkey, destination_frame="", header=None, separator=None, column_names=None, column_types=None,
                na_strings=None, skipped_columns=None, custom_non_data_line_markers=None, partition_by=None, quotechar=None,
                escapechar=None):
@@ -496,6 +593,7 @@ class H2OFrame(Keyed, H2ODisplay):
         # Need to return a Frame here for nearly all callers
         # ... but job stats returns only a dest_key, requiring another REST call to get nrow/ncol
         self._ex._cache._id = p["destination_frame"]
+        ScalarResultCache.invalidate(p["destination_frame"])
         self._ex._cache.fill()
 
     def filter_na_cols(self, frac=0.2):
@@ -1423,7 +1521,12 @@ class H2OFrame(Keyed, H2ODisplay):
         ...                         column_types=['enum', 'enum'])
         >>> h2oframe.levels()
         """
-        lol = H2OFrame._expr(expr=ExprNode("levels", self)).as_data_frame(False)
+        expr = ExprNode("levels", self)
+        key = ScalarResultCache.key(expr)
+        lol = ScalarResultCache.get(key)
+        if lol is None:
+            lol = H2OFrame._expr(expr=expr).as_data_frame(False)
+            ScalarResultCache.put(key, lol)
         lol.pop(0)  # Remove column headers
         lol = list(zip(*lol))
         return [[ll for ll in l if ll != ''] for l in lol]
@@ -1932,7 +2035,7 @@ class H2OFrame(Keyed, H2ODisplay):
             else:
                 print("num {}".format(" ".join(it[0] if it else "nan" for it in h2o.as_list(self[:10, i], False)[1:])))
 
-    def as_data_frame(self, use_pandas=True, header=True):
+    def as_data_frame(self, use_pandas=True, header=True, transfer_format="csv", transfer_dir=None):
         """
         Obtain the dataset as a python-local object.
 
@@ -1940,6 +2043,16 @@ class H2OFrame(Keyed, H2ODisplay):
             ``pandas`` library was installed). If False, then return the contents of the H2OFrame as plain nested
             list, in a row-wise order.
         :param bool header: If True (default), then column names will be appended as the first row in list
+        :param str transfer_format: How the data is transferred from the server: ``"csv"`` (default) downloads the
+            frame as CSV text that is parsed locally. ``"parquet"`` lets the server export the frame in the columnar
+            Parquet format, which is then read locally using the ``pyarrow`` library: this requires much less memory
+            and CPU for large frames, and preserves the column types (categorical columns are returned as pandas
+            ``Categorical``, time columns as ``datetime64``). The exported files must be accessible from the client,
+            see ``transfer_dir``. Only applicable when returning a pandas DataFrame.
+        :param str transfer_dir: Directory where the Parquet files are temporarily exported when
+            ``transfer_format="parquet"``. It must be accessible under the same path from both the H2O server and
+            the client (e.g. a shared network file system). Defaults to the system's temporary directory, which is
+            only suitable when the H2O server runs on the same machine as the client: it is required otherwise.
 
         :returns: A python object (a list of lists of strings, each list is a row, if ``use_pandas=False``, otherwise
             a pandas DataFrame) containing this H2OFrame instance's data.
@@ -1954,16 +2067,129 @@ class H2OFrame(Keyed, H2ODisplay):
         >>> airlines['FlightNum'] = airlines['FlightNum'].asfactor()
         >>> df = airlines.as_data_frame()
         >>> df
+        >>> df = airlines.as_data_frame(transfer_format="parquet")
         """ 
+        assert_is_type(transfer_format, Enum("csv", "parquet"))
+        assert_is_type(transfer_dir, str, None)
         if can_use_pandas() and use_pandas:
+            if transfer_format == "parquet":
+                return self._as_data_frame_from_parquet(transfer_dir)
             import pandas
             return pandas.read_csv(StringIO(self.get_frame_data()), low_memory=False, skip_blank_lines=False)
+        if transfer_format == "parquet":
+            raise H2OValueError("Parquet transfer format is only supported when returning a pandas DataFrame.")
         from h2o.utils.csv.readers import reader
         frame = [row for row in reader(StringIO(self.get_frame_data()))]
         if not header:
             frame.pop(0)
         return frame
 
+    def _as_data_frame_from_parquet(self, transfer_dir=None):
+        if not can_use_pyarrow():
+            raise H2OValueError("Parquet transfer format requires the pyarrow library to be installed.")
+        import pandas
+        import pyarrow
+        import pyarrow.parquet as pq
+
+        conn = h2o.connection()
+        if transfer_dir is None and conn.local_server is None and not _is_local_host(conn.ip):
+            # checked before the export: the files exported to a directory of the server that is not accessible from
+            # the client could not be removed.
+            raise H2OValueError("The H2O server is not running on this machine: please use `transfer_dir` to provide "
+                                "a directory shared by the server and the client.")
+        tmp_dir = tempfile.mkdtemp(prefix="h2o_frame_", dir=transfer_dir)
+        export_dir = os.path.join(tmp_dir, "parquet")
+        try:
+            h2o.export_file(self, export_dir, format="parquet")
+            if not os.path.isdir(export_dir):
+                raise H2OValueError("The frame was exported by the H2O server to %s, but this directory is not "
+                                    "accessible from the client: please use `transfer_dir` to provide a directory "
+                                    "shared by the server and the client." % export_dir)
+            # Parts are named after the chunks they were written from, their lexicographic order is the rows order.
+            parts = sorted(f for f in os.listdir(export_dir) if f.startswith("part-"))
+            tables = [pq.read_table(os.path.join(export_dir, part)) for part in parts]
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+        names, types = self.names, self.types
+        if tables:
+            df = pyarrow.concat_tables(tables).to_pandas()
+        else:
+            df = pandas.DataFrame(columns=names)
+        enum_cols = [i for i, name in enumerate(names) if types[name] == "enum"]
+        levels = self.levels() if enum_cols else []
+        for i in enum_cols:
+            # NAs are exported as empty strings and they become NaN since they are not part of the categories.
+            df[names[i]] = pandas.Categorical(df[names[i]], categories=levels[i])
+        for name in names:
+            if types[name] == "time":
+                df[name] = pandas.to_datetime(df[name])
+            elif types[name] == "int" and len(df) and not df[name].isnull().any():
+                df[name] = df[name].astype("int64")
+        return df
+
+    def iter_batches(self, batch_rows=10000, columns=None, as_="pandas", prefetch=True):
+        """
+        Iterate over the rows of the frame in batches, fetching them lazily from the server.
+
+        Contrary to :meth:`as_data_frame`, only one batch of rows (two if ``prefetch`` is enabled) is held in memory
+        at any time, so this allows processing frames that are larger than the client memory.
+
+        :param int batch_rows: maximum number of rows per batch.
+        :param columns: list of column names or indices to fetch (all the columns by default).
+        :param str as_: type of the batches:
+
+            - ``"pandas"`` (default): a pandas DataFrame, with categorical columns as pandas ``Categorical`` and
+              time columns as ``datetime64``.
+            - ``"numpy"``: a 2D numpy array, of float type if all the columns are numeric, of object type otherwise.
+            - ``"list"``: a list of rows, each row being a list of values (``None`` for missing values).
+
+        :param bool prefetch: if True (default), the next batch is fetched in the background while the current one
+            is being processed.
+        :returns: a generator of batches.
+
+        :examples:
+
+        >>> airlines = h2o.import_file("https://s3.amazonaws.com/h2o-public-test-data/smalldata/airlines/allyears2k_headers.zip")
+        >>> for batch in airlines.iter_batches(batch_rows=5000, columns=["Year", "Origin", "Dest"]):
+        ...     print(batch.shape)
+        """
+        assert_is_type(batch_rows, I(int, lambda n: n > 0))
+        assert_is_type(columns, None, [str, int])
+        assert_is_type(as_, Enum("pandas", "numpy", "list"))
+        assert_is_type(prefetch, bool)
+        if as_ == "pandas" and not can_use_pandas():
+            raise H2OValueError("Batches of type 'pandas' require the pandas library to be installed.")
+        if as_ == "numpy" and not can_use_numpy():
+            raise H2OValueError("Batches of type 'numpy' require the numpy library to be installed.")
+
+        fr, cols_offset, cols = self, 0, -1
+        if columns is not None:
+            indices = [self.names.index(c) if is_type(c, str) else c for c in columns]
+            if indices and indices == list(range(indices[0], indices[0] + len(indices))):
+                cols_offset, cols = indices[0], len(indices)  # contiguous columns are fetched directly by offset
+            else:
+                fr = self[:, indices]  # otherwise, fetch from a (temporary) projection of the requested columns
+        frame_id, nrows = fr.frame_id, fr.nrows
+        conn = h2o.connection()
+
+        def fetch(offset):
+            cache = H2OCache()
+            cache._id = frame_id
+            with local_context(connection=conn):  # background fetch must use the connection of the caller
+                cache.fill(rows=min(batch_rows, nrows - offset), rows_offset=offset, cols=cols,
+                           cols_offset=cols_offset, light=True, force=True)
+            return cache
+
+        offsets = list(range(0, nrows, batch_rows))
+        prefetched = None
+        for i, offset in enumerate(offsets):
+            cache = prefetched.result() if prefetched else fetch(offset)
+            prefetched = None
+            if prefetch and i + 1 < len(offsets):
+                prefetched = _BackgroundCall(fetch, offsets[i + 1])
+            yield _cache_to_batch(cache, as_)
+
     def save_to_hive(self, jdbc_url, table_name, format="csv", table_path=None, tmp_path=None):
         """
         Save contents of this data frame into a Hive table.
@@ -2766,6 +2992,7 @@ class H2OFrame(Keyed, H2ODisplay):
                            values)._eager_scalar()
 
         self._ex._cache.flush()
+        ScalarResultCache.invalidate(self.frame_id)  # imputed in place
         self._ex._cache.fill(10)
         return res
 
@@ -2892,6 +3119,7 @@ class H2OFrame(Keyed, H2ODisplay):
         job['job'] = h2o.api("POST /3/MissingInserter", data=kwargs)
         H2OJob(job, job_type=("Insert Missing Values")).poll()
         self._ex._cache.flush()
+        ScalarResultCache.invalidate(self.frame_id)  # modified in place
         return self
 
     def min(self):
@@ -3011,11 +3239,13 @@ class H2OFrame(Keyed, H2ODisplay):
         if kwargs:
             raise H2OValueError("Unknown parameters %r" % list(kwargs))
 
-        new_frame = H2OFrame._expr(ExprNode("mean", self, skipna, axis))
         if return_frame:
-            return new_frame
+            return H2OFrame._expr(ExprNode("mean", self, skipna, axis))
+        elif axis == 0:
+            # the column means form a single row: fetched in one request (and cacheable, see ScalarResultCache)
+            return ExprNode("getrow", ExprNode("mean", self, skipna, axis))._eager_scalar()
         else:
-            return new_frame.getrow()
+            return H2OFrame._expr(ExprNode("mean", self, skipna, axis)).getrow()
 
     def skewness(self, na_rm=False):
         """
@@ -5122,6 +5352,167 @@ def _binop(lhs, op, rhs, rtype=None):
         res._ex._cache._types = {name: rtype for name in res._ex._cache._names}
     return res
 
+class _BackgroundCall(object):
+    """Call a function in a background thread, the result being available through :meth:`result`."""
+
+    def __init__(self, fn, *args):
+        self._result = None
+        self._error = None
+        self._thread = threading.Thread(target=self._run, args=(fn,) + args)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def _run(self, fn, *args):
+        try:
+            self._result = fn(*args)
+        except Exception as e:
+            self._error = e
+
+    def result(self):
+        self._thread.join()
+        if self._error is not None:
+            raise self._error
+        return self._result
+
+
+def _is_splittable(path):
+    """Whether the file can be split on line boundaries into parts parsed as one dataset (i.e. a text file)."""
+    if path.lower().endswith(".arff"):
+        return False  # its header declares the columns, it must stay in the first part only
+    with open(path, "rb") as f:
+        head = f.read(1 << 12)
+    return not is_binary_file_head(head) and not head.startswith((b"@", b"%"))
+
+
+def _line_aligned_parts(path, part_size, quotechar='"'):
+    """
+    Split the file into parts (offset, length) of about `part_size` bytes, each ending at the end of a line which is
+    not within a quoted value: the whole file is read, to track the quotes.
+    """
+    quote = quotechar.encode("ascii")
+    size = os.path.getsize(path)
+    boundaries = [0]
+    in_quotes = False
+    pos = 0  # offset of the current block in the file
+    with open(path, "rb") as f:
+        while True:
+            block = f.read(1 << 16)
+            if not block:
+                break
+            start = 0  # the quotes before this offset of the block are already counted
+            target = boundaries[-1] + part_size - pos  # offset of the block after which the next part may end
+            while target < len(block):
+                eol = block.find(b"\n", max(target, start))
+                if eol < 0:
+                    break
+                in_quotes ^= block.count(quote, start, eol + 1) % 2 == 1
+                start = eol + 1
+                if not in_quotes:
+                    boundaries.append(pos + start)
+                target = boundaries[-1] + part_size - pos
+            in_quotes ^= block.count(quote, start) % 2 == 1
+            pos += len(block)
+    if boundaries[-1] >= size:
+        boundaries.pop()
+    boundaries.append(size)
+    return [(start, end - start) for start, end in zip(boundaries, boundaries[1:])]
+
+
+def _is_local_host(host):
+    """True if the host is this machine."""
+    if host in ("localhost", "::1"):
+        return True
+    try:
+        address = socket.gethostbyname(host)
+        return address.startswith("127.") or address in socket.gethostbyname_ex(socket.gethostname())[2]
+    except (socket.error, TypeError, UnicodeError):
+        return False
+
+
+def _write_svmlight(matrix, out, block_rows=10000):
+    """
+    Write the scipy sparse `matrix` to `out` in SVMLight format, its first column being used as the label.
+
+    The matrix is converted to CSR, whose `indptr`/`indices`/`data` arrays are then walked in blocks of `block_rows`
+    rows: no global sort is needed and only one block of formatted values is held in memory at a time.
+    """
+    import numpy as np
+    csr = matrix.tocsr(copy=True)
+    csr.sum_duplicates()  # also sorts the column indices of each row
+    csr.eliminate_zeros()
+    indptr, indices, data = csr.indptr, csr.indices, csr.data
+    for start in range(0, csr.shape[0], block_rows):
+        end = min(start + block_rows, csr.shape[0])
+        offset = indptr[start]
+        row_starts = indptr[start:end] - offset
+        row_ends = indptr[start + 1:end + 1] - offset
+        block_indices = indices[offset:indptr[end]]
+        block_data = data[offset:indptr[end]]
+        # python's float formatting is much faster than numpy's, and identical for double values
+        values = (list(map(str, block_data.tolist())) if block_data.dtype.kind in "iu" or block_data.dtype == np.float64
+                  else block_data.astype(str).tolist())
+        tokens = list(map("%d:%s".__mod__, zip(block_indices.tolist(), values)))
+        # the value in column 0, if present, is the first one of its row: it is the label instead of a feature
+        has_label = row_starts < row_ends
+        has_label[has_label] = block_indices[row_starts[has_label]] == 0
+        labels = ["0"] * (end - start)
+        for i in np.flatnonzero(has_label).tolist():
+            labels[i] = values[row_starts[i]]
+        feature_starts = (row_starts + has_label).tolist()
+        out.write("\n".join(" ".join([label] + tokens[s:e])
+                            for label, s, e in zip(labels, feature_starts, row_ends.tolist())))
+        out.write("\n")
+
+
+def _pandas_column_types(df, column_names):
+    """H2O types of the columns of the pandas DataFrame `df` that can be derived from their dtype."""
+    import pandas
+    import pandas.api.types as pdt
+    types = {}
+    for name, (_, col) in zip(column_names, df.items()):
+        if pdt.is_bool_dtype(col) or isinstance(col.dtype, pandas.CategoricalDtype):
+            types[name] = "enum"
+        elif pdt.is_numeric_dtype(col) and not pdt.is_complex_dtype(col):
+            types[name] = "numeric"
+        elif pdt.is_datetime64_dtype(col):  # timezone-aware timestamps are left to the parser
+            types[name] = "time"
+    return types
+
+
+def _cache_to_batch(cache, as_):
+    """Convert the rows filled in an H2OCache into a batch of type `as_` ("pandas", "numpy" or "list")."""
+    names = cache.names
+    columns = []
+    for name in names:
+        col = cache._data.get(name, {}) if cache._data else {}
+        data = col.get("data") or []
+        col_type = cache.types[name]
+        if col_type == "enum" and as_ != "pandas":
+            domain = col["domain"]
+            data = [None if x is None or math.isnan(x) else domain[int(x)] for x in data]
+        elif col_type in ("int", "real", "time") and as_ == "list":
+            data = [None if x is None or math.isnan(x) else x for x in data]
+        columns.append((name, col_type, col.get("domain"), data))
+
+    if as_ == "list":
+        return [list(row) for row in zip(*[data for _, _, _, data in columns])]
+    if as_ == "numpy":
+        import numpy
+        numeric = all(col_type in ("int", "real", "time") for _, col_type, _, _ in columns)
+        return numpy.array([data for _, _, _, data in columns], dtype=float if numeric else object).T
+    import pandas
+    df = pandas.DataFrame(index=range(len(columns[0][3]) if columns else 0))
+    for name, col_type, domain, data in columns:
+        if col_type == "enum":
+            codes = [-1 if math.isnan(x) else int(x) for x in data]
+            df[name] = pandas.Categorical.from_codes(codes, categories=domain)
+        elif col_type == "time":
+            df[name] = pandas.to_datetime(data, unit="ms")
+        else:
+            df[name] = data
+    return df
+
+
 def generatePandaEnumCols(pandaFtrain, cname, nrows, domainL):
     """
     For an H2O Enum column, we perform one-hot-encoding here and add one more column, "missing(NA)" to it.
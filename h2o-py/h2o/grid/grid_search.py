@@ -445,15 +445,18 @@ class H2OGridSearch(h2o_meta(Keyed, H2ODisplay)):
                     failure_messages_stacks += error_message+'\n'
                 error_index += 1
 
-        self.models = [h2o.get_model(key['name']) for key in grid_json['model_ids']]
+        self.models = h2o.get_models([key['name'] for key in grid_json['model_ids']])
         for model in self.models:
             model._estimator_type = self.model._estimator_type
 
         # get first model returned in list of models from grid search to get model class (binomial, multinomial, etc)
         # sometimes no model is returned due to bad parameter values provided by the user.
         if len(grid_json['model_ids']) > 0:
-            first_model_json = h2o.api("GET /%d/Models/%s" %
-                                       (rest_ver or 3, grid_json['model_ids'][0]['name']))['models'][0]
+            if rest_ver is None or rest_ver == 3:
+                first_model_json = self.models[0]._model_json
+            else:
+                first_model_json = h2o.api("GET /%d/Models/%s" %
+                                           (rest_ver, grid_json['model_ids'][0]['name']))['models'][0]
             self._resolve_grid(grid.dest_key, grid_json, first_model_json)
         else:
             if len(failure_messages_stacks)>0:
@@ -1488,7 +1491,7 @@ class H2OGridSearch(h2o_meta(Keyed, H2ODisplay)):
             raise NotImplementedError(model_type)
         return model_class
 
-    def get_grid(self, sort_by=None, decreasing=None):
+    def get_grid(self, sort_by=None, decreasing=None, lazy=False):
         """
         Retrieve an H2OGridSearch instance.
 
@@ -1503,6 +1506,8 @@ class H2OGridSearch(h2o_meta(Keyed, H2ODisplay)):
             ``"f1"``, etc.
         :param bool decreasing: Sort the models in decreasing order of metric if true, otherwise sort in increasing
             order (default).
+        :param bool lazy: If True, the models of the new grid which are not already models of this grid are loaded
+            only when first used (see :class:`~h2o.model.H2OLazyModel`).
 
         :returns: A new H2OGridSearch instance optionally sorted on the specified metric.
 
@@ -1524,7 +1529,12 @@ class H2OGridSearch(h2o_meta(Keyed, H2ODisplay)):
 
         grid_json = h2o.api("GET /99/Grids/%s" % self._id, data={"sort_by": sort_by, "decreasing": decreasing})
         grid = H2OGridSearch(self.model, self.hyper_params, self._id)
-        grid.models = [h2o.get_model(key['name']) for key in grid_json['model_ids']]  # reordered
+        # reordered: the models already loaded by this grid are reused, only the others (if any) are fetched
+        models = {model.model_id: model for model in self.models or []}
+        model_ids = [key['name'] for key in grid_json['model_ids']]
+        missing_ids = [model_id for model_id in model_ids if model_id not in models]
+        models.update(zip(missing_ids, h2o.get_models(missing_ids, lazy=lazy)))
+        grid.models = [models[model_id] for model_id in model_ids]
         first_model_json = h2o.api("GET /99/Models/%s" % grid_json['model_ids'][0]['name'])['models'][0]
         model_class = H2OGridSearch._metrics_class(first_model_json)
         m = model_class()
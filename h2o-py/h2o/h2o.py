@@ -7,6 +7,8 @@ h2o -- module for using H2O services.
 """
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+from collections import OrderedDict
+from contextlib import contextmanager
 import os
 import subprocess
 import tempfile
@@ -27,15 +29,18 @@ from .estimators.infogram import H2OInfogram
 from .estimators.deeplearning import H2OAutoEncoderEstimator, H2ODeepLearningEstimator
 from .estimators.extended_isolation_forest import H2OExtendedIsolationForestEstimator
 from .exceptions import H2OConnectionError, H2OValueError
-from .expr import ExprNode
+from .expr import ExprBatch, ExprNode, ScalarResultCache, TmpRemovals
 from .frame import H2OFrame
 from .grid.grid_search import H2OGridSearch
 from .job import H2OJob
+from .model.lazy_model import H2OLazyModel
 from .model.model_base import ModelBase
+from .model.model_cache import ModelJsonCache
 from .utils.compatibility import *  # NOQA
 from .utils.config import H2OConfigReader
 from .utils.metaclass import deprecated_fn
 from .utils.shared_utils import check_frame_id, gen_header, py_tmp_key, quoted
+from .utils.threading import local_context, local_env, map_concurrently
 from .utils.typechecks import assert_is_type, assert_satisfies, BoundInt, BoundNumeric, I, is_type, numeric, U
 
 # enable h2o deprecation warnings by default to ensure that users get notified in interactive mode, without being too annoying
@@ -48,7 +53,8 @@ h2oconn = None  # type: H2OConnection
 
 def connect(server=None, url=None, ip=None, port=None,
             https=None, verify_ssl_certificates=None, cacert=None,
-            auth=None, proxy=None, cookies=None, verbose=True, config=None, strict_version_check=False):
+            auth=None, proxy=None, cookies=None, verbose=True, config=None, strict_version_check=False,
+            pool_size=None, keep_alive=None, max_retries=None):
     """
     Connect to an existing H2O server, remote or local.
 
@@ -69,6 +75,9 @@ def connect(server=None, url=None, ip=None, port=None,
     :param verbose: Set to False to disable printing connection status messages.
     :param config: Connection configuration object encapsulating connection parameters.
     :param strict_version_check: If True, an error will be raised if the client and server versions don't match.
+    :param pool_size: Maximum number of pooled HTTP connections kept open to the server (default 10).
+    :param keep_alive: Set to False to open a new HTTP connection for every request instead of reusing pooled ones.
+    :param max_retries: Number of times a request is retried if the connection to the server fails (default 0).
     :returns: the new :class:`H2OConnection` object.
 
     :examples:
@@ -93,7 +102,8 @@ def connect(server=None, url=None, ip=None, port=None,
         h2oconn = H2OConnection.open(server=server, url=url, ip=ip, port=port, https=https,
                                      auth=auth, verify_ssl_certificates=verify_ssl_certificates, cacert=cacert,
                                      proxy=proxy, cookies=cookies,
-                                     verbose=verbose, strict_version_check=svc)
+                                     verbose=verbose, strict_version_check=svc,
+                                     pool_size=pool_size, keep_alive=keep_alive, max_retries=max_retries)
         if verbose:
             h2oconn.cluster.show_status()
     return h2oconn
@@ -121,24 +131,35 @@ def api(endpoint, data=None, json=None, filename=None, save_to=None):
     """
     # type checks are performed in H2OConnection class
     _check_connection()
-    return h2oconn.request(endpoint, data=data, json=json, filename=filename, save_to=save_to)
+    return connection().request(endpoint, data=data, json=json, filename=filename, save_to=save_to)
 
 
 def connection():
     """Return the current :class:`H2OConnection` handler.
 
+    This is the connection established by the latest call to :func:`connect` or :func:`init`, unless another
+    connection was bound to the current thread (or asyncio task) using the ``connection`` key of
+    :func:`h2o.utils.threading.local_context`, in which case that one is returned. All the module functions
+    (:func:`api`, frame and model operations, ...) use the connection returned by this function, so this allows
+    several threads to work with different clusters (or different sessions) at the same time.
+
     :examples:
 
     >>> temp = h2o.connection()
     >>> temp
+    >>> from h2o.utils.threading import local_context
+    >>> other = h2o.connect(url="http://otherhost:54321")
+    >>> with local_context(connection=other):
+    ...     h2o.ls()  # uses `other` connection for the current thread only
     """
-    return h2oconn
+    return local_env('connection', h2oconn, use_default_if_none=True)
 
 
 def init(url=None, ip=None, port=None, name=None, https=None, cacert=None, insecure=None, username=None, password=None,
          cookies=None, proxy=None, start_h2o=True, nthreads=-1, ice_root=None, log_dir=None, log_level=None,
          max_log_file_size=None, enable_assertions=True, max_mem_size=None, min_mem_size=None, strict_version_check=None, 
-         ignore_config=False, extra_classpath=None, jvm_custom_args=None, bind_to_localhost=True, **kwargs):
+         ignore_config=False, extra_classpath=None, jvm_custom_args=None, bind_to_localhost=True,
+         pool_size=None, keep_alive=None, max_retries=None, **kwargs):
     """
     Attempt to connect to a local server, or if not successful start a new server and connect to it.
 
@@ -181,6 +202,9 @@ def init(url=None, ip=None, port=None, name=None, https=None, cacert=None, insec
     :param kwargs: (all other deprecated attributes)
     :param jvm_custom_args: Customer, user-defined argument's for the JVM H2O is instantiated in. Ignored if there is an instance of H2O already running and the client connects to it.
     :param bind_to_localhost: A flag indicating whether access to the H2O instance should be restricted to the local machine (default) or if it can be reached from other computers on the network.
+    :param pool_size: Maximum number of pooled HTTP connections kept open to the server (default 10).
+    :param keep_alive: Set to False to open a new HTTP connection for every request instead of reusing pooled ones.
+    :param max_retries: Number of times a request is retried if the connection to the server fails (default 0).
 
 
     :examples:
@@ -213,6 +237,9 @@ def init(url=None, ip=None, port=None, name=None, https=None, cacert=None, insec
     assert_is_type(extra_classpath, [str], None)
     assert_is_type(jvm_custom_args, [str], None)
     assert_is_type(bind_to_localhost, bool)
+    assert_is_type(pool_size, int, None)
+    assert_is_type(keep_alive, bool, None)
+    assert_is_type(max_retries, int, None)
     assert_is_type(kwargs, {"proxies": {str: str}, "max_mem_size_GB": int, "min_mem_size_GB": int,
                             "force_connect": bool, "as_port": bool})
 
@@ -272,7 +299,8 @@ def init(url=None, ip=None, port=None, name=None, https=None, cacert=None, insec
                                      auth=auth, proxy=proxy, cookies=cookies, verbose=True,
                                      msgs=("Checking whether there is an H2O instance running at {url} ",
                                            "connected.", "not found."),
-                                     strict_version_check=svc)
+                                     strict_version_check=svc,
+                                     pool_size=pool_size, keep_alive=keep_alive, max_retries=max_retries)
     except H2OConnectionError:
         # Backward compatibility: in init() port parameter really meant "baseport" when starting a local server...
         if port and not str(port).endswith("+") and not kwargs.get("as_port", False):
@@ -291,7 +319,8 @@ def init(url=None, ip=None, port=None, name=None, https=None, cacert=None, insec
                                   bind_to_localhost=bind_to_localhost)
         h2oconn = H2OConnection.open(server=hs, https=https, verify_ssl_certificates=verify_ssl_certificates,
                                      cacert=cacert, auth=auth, proxy=proxy, cookies=cookies, verbose=True,
-                                     strict_version_check=svc)
+                                     strict_version_check=svc,
+                                     pool_size=pool_size, keep_alive=keep_alive, max_retries=max_retries)
     h2oconn.cluster.timezone = "UTC"
     h2oconn.cluster.show_status()
 
@@ -339,11 +368,13 @@ def _import_multi(paths, pattern):
 
 
 def upload_file(path, destination_frame=None, header=0, sep=None, col_names=None, col_types=None,
-                na_strings=None, skipped_columns=None, quotechar=None, escapechar=None):
+                na_strings=None, skipped_columns=None, quotechar=None, escapechar=None, part_size=None):
     """
     Upload a dataset from the provided local path to the H2O cluster.
 
-    Does a single-threaded push to H2O. Also see :meth:`import_file`.
+    Pushes the file to H2O. A large text file can be split into parts that are uploaded concurrently, and then
+    parsed together, see ``part_size``. The file can also be compressed on the fly while it is sent, see
+    :attr:`H2OConnection.upload_compression_level`. Also see :meth:`import_file`.
 
     :param path: A path specifying the location of the data to upload.
     :param destination_frame:  The unique hex key assigned to the imported file. If none is given, a key will
@@ -382,12 +413,17 @@ def upload_file(path, destination_frame=None, header=0, sep=None, col_names=None
     :param skipped_columns: an integer lists of column indices to skip and not parsed into the final frame from the import file.
     :param quotechar: A hint for the parser which character to expect as quoting character. Only single quote, double quote or None (default) are allowed. None means automatic detection.
     :param escapechar: (Optional) One ASCII character used to escape other characters.
+    :param part_size: (Optional) If given, a text file larger than this size (in bytes) is split into parts of
+        about this size, which are uploaded concurrently. The parts end at line boundaries which are not within
+        quoted values (the file is read once more to find them). Files using an ``escapechar`` are never split.
+        By default, the file is uploaded in a single request.
 
     :returns: a new :class:`H2OFrame` instance.
 
     :examples:
     
     >>> iris_df = h2o.upload_file("~/Desktop/repos/h2o-3/smalldata/iris/iris.csv")
+    >>> large_df = h2o.upload_file("/path/to/large.csv", part_size=128 << 20)
     """
     coltype = U(None, "unknown", "uuid", "string", "float", "real", "double", "int", "numeric",
                 "categorical", "factor", "enum", "time")
@@ -403,12 +439,13 @@ def upload_file(path, destination_frame=None, header=0, sep=None, col_names=None
     assert (skipped_columns==None) or isinstance(skipped_columns, list), \
         "The skipped_columns should be an list of column names!"
     assert_is_type(escapechar, None, I(str, lambda s: len(s) == 1))
+    assert_is_type(part_size, None, I(int, lambda s: s > 0))
 
     check_frame_id(destination_frame)
     if path.startswith("~"):
         path = os.path.expanduser(path)
     return H2OFrame()._upload_parse(path, destination_frame, header, sep, col_names, col_types, na_strings, skipped_columns,
-                                    quotechar, escapechar)
+                                    quotechar, escapechar, part_size)
 
 
 def import_file(path=None, destination_frame=None, parse=True, header=0, sep=None, col_names=None, col_types=None,
@@ -465,6 +502,10 @@ def import_file(path=None, destination_frame=None, parse=True, header=0, sep=Non
     :param custom_non_data_line_markers: If a line in imported file starts with any character in given string it will NOT be imported. Empty string means all lines are imported, None means that default behaviour for given format will be used
     :param quotechar: A hint for the parser which character to expect as quoting character. Only single quote, double quote or None (default) are allowed. None means automatic detection.
     :param escapechar: (Optional) One ASCII character used to escape other characters.
+    :param part_size: (Optional) If given, a text file larger than this size (in bytes) is split into parts of
+        about this size, which are uploaded concurrently. The parts end at line boundaries which are not within
+        quoted values (the file is read once more to find them). Files using an ``escapechar`` are never split.
+        By default, the file is uploaded in a single request.
 
     :returns: a new :class:`H2OFrame` instance.
 
@@ -1008,6 +1049,7 @@ def assign(data, xid):
     data._ex = ExprNode("assign", xid, data)._eval_driver(None)
     data._ex._cache._id = xid
     data._ex._children = None
+    ScalarResultCache.invalidate(xid)
     return data
 
 
@@ -1034,6 +1076,7 @@ def deep_copy(data, xid):
     duplicate._ex = ExprNode("assign", xid, duplicate)._eval_driver(None)
     duplicate._ex._cache._id = xid
     duplicate._ex._children = None
+    ScalarResultCache.invalidate(xid)
     return duplicate
 
 
@@ -1055,18 +1098,21 @@ def models():
     >>> model1.train(y=response, training_frame=airlines)
     >>> model2 = H2OXGBoostEstimator(family="binomial")
     >>> model2.train(y=response, training_frame=airlines)
-    >>> model_list = h2o.get_models()
+    >>> model_list = h2o.models()
     """
     return [json["model_id"]["name"] for json in api("GET /3/Models")["models"]]
 
 
-def get_model(model_id):
+def get_model(model_id, lazy=False):
     """
     Load a model from the server.
 
     :param model_id: The model identification in H2O
+    :param lazy: If True, the model is loaded only when first used: a :class:`~h2o.model.H2OLazyModel` is returned,
+        which turns itself into the model when any of its attributes other than ``model_id`` is accessed.
+        Note that the existence of the model is not checked until then.
 
-    :returns: Model object, a subclass of H2OEstimator
+    :returns: Model object, a subclass of H2OEstimator (or an :class:`~h2o.model.H2OLazyModel` if ``lazy``)
 
     :examples:
 
@@ -1086,9 +1132,49 @@ def get_model(model_id):
     ...             y=response,
     ...             training_frame=airlines)
     >>> model2 = h2o.get_model(model.model_id)
+    >>> model3 = h2o.get_model(model.model_id, lazy=True)
     """
     assert_is_type(model_id, str)
-    model_json = api("GET /3/Models/%s" % model_id)["models"][0]
+    assert_is_type(lazy, bool)
+    if lazy:
+        return H2OLazyModel(model_id)
+    model_json = ModelJsonCache.fetch(model_id)
+    return _model_from_json(model_id, model_json)
+
+
+def get_models(model_ids, max_workers=10, lazy=False):
+    """
+    Load several models from the server, fetching them concurrently.
+
+    Each model is fetched only once, even if its id is repeated.
+
+    :param model_ids: The list of the model identifications in H2O.
+    :param max_workers: The maximum number of models fetched at the same time. It should not be larger than the
+        ``pool_size`` of the connection (10 by default).
+    :param lazy: If True, no model is fetched here: handles (:class:`~h2o.model.H2OLazyModel`) loading each model
+        only when first used are returned instead (see :func:`get_model`).
+
+    :returns: The list of the models (subclasses of :class:`H2OEstimator`), in the order of ``model_ids``.
+
+    :examples:
+
+    >>> aml = H2OAutoML(max_models=10)
+    >>> aml.train(y=response, training_frame=train)
+    >>> models = h2o.get_models([r[0] for r in aml.leaderboard["model_id"].as_data_frame(use_pandas=False, header=False)])
+    """
+    assert_is_type(model_ids, [str])
+    assert_is_type(max_workers, BoundInt(1))
+    assert_is_type(lazy, bool)
+    unique_ids = list(OrderedDict.fromkeys(model_ids))
+    if lazy:
+        models = {model_id: H2OLazyModel(model_id) for model_id in unique_ids}
+        return [models[model_id] for model_id in model_ids]
+    models_json = map_concurrently(ModelJsonCache.fetch, unique_ids, max_workers)
+    models = {model_id: _model_from_json(model_id, model_json) for model_id, model_json in zip(unique_ids, models_json)}
+    return [models[model_id] for model_id in model_ids]
+
+
+def _model_from_json(model_id, model_json):
     algo = model_json["algo"]
     # still some special handling for AutoEncoder: would be cleaner if we could get rid of this
     if algo == 'deeplearning' and model_json["output"]["model_category"] == "AutoEncoder":
@@ -1133,11 +1219,10 @@ def get_grid(grid_id):
     """
     assert_is_type(grid_id, str)
     grid_json = api("GET /99/Grids/%s" % grid_id)
-    models = [get_model(key["name"]) for key in grid_json["model_ids"]]
-    # get first model returned in list of models from grid search to get model class (binomial, multinomial, etc)
-    first_model_json = api("GET /3/Models/%s" % grid_json["model_ids"][0]["name"])["models"][0]
+    models = get_models([key["name"] for key in grid_json["model_ids"]])
     gs = H2OGridSearch(None, {}, grid_id)
-    gs._resolve_grid(grid_id, grid_json, first_model_json)
+    # the first model returned in the list of models from grid search gives the model class (binomial, etc)
+    gs._resolve_grid(grid_id, grid_json, models[0]._model_json)
     gs.models = models
     hyper_params = {param: set() for param in gs.hyper_names}
     for param in gs.hyper_names:
@@ -1231,6 +1316,182 @@ def is_expr_optimizations_enabled():
     return ExprNode.__ENABLE_EXPR_OPTIMIZATIONS__
 
 
+@contextmanager
+def batch():
+    """
+    Evaluate the lazy frame operations of a block with a single request to the backend.
+
+    Inside the ``with h2o.batch():`` block, frame operations are kept lazy; when the block exits without error, all
+    the frames created or modified in the block, and still referenced, are evaluated together as a single Rapids
+    program, instead of one request per frame when each of them is used.
+    Values needed inside the block (e.g. a frame's dimensions, or a scalar result) are still evaluated immediately.
+
+    Nested blocks are merged with the outermost one.
+
+    :examples:
+
+    >>> iris = h2o.import_file("http://h2o-public-test-data.s3.amazonaws.com/smalldata/iris/iris_wheader.csv")
+    >>> with h2o.batch():
+    ...     sepal_area = iris["sepal_len"] * iris["sepal_wid"]
+    ...     petal_area = iris["petal_len"] * iris["petal_wid"]
+    ...     log_ratio = (iris["sepal_len"] / iris["petal_len"]).log()
+    """
+    current = local_env('expr_batch')
+    if current is not None:
+        yield current
+        return
+    expr_batch = ExprBatch()
+    with local_context(expr_batch=expr_batch):
+        yield expr_batch
+    expr_batch.execute()
+
+
+def enable_deferred_tmp_removal(flag, batch_size=None, max_delay=None):
+    """
+    Enable the deferred removal of the temporary frames created by lazy frame operations.
+
+    When enabled (default), the temporary frames that are no longer referenced on the client side are not removed
+    one by one as soon as they are garbage-collected, but queued and removed in batches, with a single request per
+    batch. The queue is flushed at the next Rapids request once it holds ``batch_size`` keys or once its oldest key
+    has been waiting for ``max_delay`` seconds, or explicitly with :func:`flush_tmp_removals`.
+
+    :param bool flag: if False, each temporary frame is removed immediately when it is garbage-collected.
+    :param int batch_size: number of queued keys triggering a removal request (100 by default).
+    :param float max_delay: maximum time (in seconds) a key can be queued before triggering a removal request
+        (5 by default).
+
+    :examples:
+
+    >>> h2o.enable_deferred_tmp_removal(True, batch_size=1000)
+    """
+    assert_is_type(flag, bool)
+    assert_is_type(batch_size, None, BoundInt(1))
+    assert_is_type(max_delay, None, BoundNumeric(0))
+    if batch_size is not None:
+        TmpRemovals.batch_size = batch_size
+    if max_delay is not None:
+        TmpRemovals.max_delay = max_delay
+    TmpRemovals.enabled = flag
+    if not flag:
+        TmpRemovals.flush()
+
+
+def flush_tmp_removals():
+    """
+    Remove immediately the temporary frames queued for removal (see :func:`enable_deferred_tmp_removal`).
+
+    :examples:
+
+    >>> h2o.flush_tmp_removals()
+    """
+    TmpRemovals.flush()
+
+
+def enable_scalar_result_cache(flag, max_size=None):
+    """
+    Enable the client-side cache of the results of frame summaries (and other expressions evaluated to scalars).
+
+    When enabled, the results of calls like ``fr["x"].mean()``, ``fr.nacnt()``, ``fr.min()`` or ``fr.levels()``
+    are memoized, and the same call on a frame which was not modified since returns the cached result without
+    any request to the backend. The results are discarded when the frame is modified through this client
+    (e.g. with ``fr[...] = ...`` or :meth:`H2OFrame.set_names`), or when its key is reassigned or removed:
+    the cache must not be enabled if the frames are modified by other clients.
+
+    :param bool flag: True to enable the cache, False to disable it (default) and discard the cached results.
+    :param int max_size: maximum number of results kept in the cache, the least recently used ones being
+        discarded first (1000 by default).
+
+    :examples:
+
+    >>> h2o.enable_scalar_result_cache(True)
+    >>> iris = h2o.import_file("http://h2o-public-test-data.s3.amazonaws.com/smalldata/iris/iris_wheader.csv")
+    >>> iris["sepal_len"].mean()
+    >>> iris["sepal_len"].mean()  # no request sent
+    >>> h2o.scalar_result_cache_stats()
+    {'hits': 1, 'misses': 1, 'size': 1}
+    """
+    assert_is_type(flag, bool)
+    assert_is_type(max_size, None, BoundInt(1))
+    if max_size is not None:
+        ScalarResultCache.max_size = max_size
+    ScalarResultCache.enabled = flag
+    if not flag:
+        ScalarResultCache.clear()
+
+
+def scalar_result_cache_stats():
+    """
+    Get the statistics of the cache of frame summaries (see :func:`enable_scalar_result_cache`).
+
+    :returns: a dictionary with the number of cache ``hits`` and ``misses``, and the ``size`` of the cache
+        (number of cached results).
+
+    :examples:
+
+    >>> h2o.scalar_result_cache_stats()
+    {'hits': 0, 'misses': 0, 'size': 0}
+    """
+    return ScalarResultCache.stats()
+
+
+def enable_model_cache(flag, directory=None, max_size=None):
+    """
+    Enable the on-disk cache of the models JSON.
+
+    When enabled, the JSON of the finished models loaded with :func:`get_model`, :func:`get_models`,
+    :func:`get_grid`... is stored in a local directory, and reused by the next sessions (e.g. after reconnecting
+    to the same cluster) instead of being downloaded again. Before using a cached JSON, its model's checksum and
+    completion time are checked against the backend (with a small request): the entries of the models which
+    changed, e.g. were rebuilt under the same id, are fetched again.
+
+    :param bool flag: True to enable the cache, False to disable it (default). The entries are kept on disk when
+        the cache is disabled, see :func:`clear_model_cache`.
+    :param str directory: the directory of the cache (``~/.h2o_model_cache`` by default).
+    :param int max_size: maximum size (in bytes) of the cache, the least recently used models being discarded
+        first (1GB by default).
+
+    :examples:
+
+    >>> h2o.enable_model_cache(True, directory="/tmp/h2o_models", max_size=200 << 20)
+    >>> model = h2o.get_model("my_gbm")
+    >>> h2o.model_cache_stats()
+    """
+    assert_is_type(flag, bool)
+    assert_is_type(directory, None, str)
+    assert_is_type(max_size, None, BoundInt(1))
+    if directory is not None:
+        ModelJsonCache.directory = os.path.abspath(os.path.expanduser(directory))
+    if max_size is not None:
+        ModelJsonCache.max_size = max_size
+    ModelJsonCache.enabled = flag
+
+
+def model_cache_stats():
+    """
+    Get the statistics of the cache of the models JSON (see :func:`enable_model_cache`).
+
+    :returns: a dictionary with the number of cache ``hits`` and ``misses`` in this session, and the ``size`` of
+        the cache (number of cached models) and its size in ``bytes``.
+
+    :examples:
+
+    >>> h2o.model_cache_stats()
+    {'hits': 0, 'misses': 0, 'size': 0, 'bytes': 0}
+    """
+    return ModelJsonCache.stats()
+
+
+def clear_model_cache():
+    """
+    Remove all the models from the on-disk cache of the models JSON (see :func:`enable_model_cache`).
+
+    :examples:
+
+    >>> h2o.clear_model_cache()
+    """
+    ModelJsonCache.clear()
+
+
 def log_and_echo(message=""):
     """
     Log a message on the server-side logs.
@@ -1278,6 +1539,7 @@ def remove(x, cascade=True):
             api("DELETE /3/DKV/%s" % xi.key, data=dict(cascade=cascade))
             xi.detach()
         else:
+            ScalarResultCache.invalidate(xi)
             # string may be a Frame key name part of a rapids session... need to call rm thru rapids here
             try:
                 rapids("(rm {})".format(xi))
@@ -1307,6 +1569,7 @@ def remove_all(retained=None):
 
     params = {"retained_keys": retained}
     api(endpoint="DELETE /3/DKV", data=params)
+    ScalarResultCache.clear()
 
 
 def rapids(expr):
@@ -1459,7 +1722,7 @@ def download_all_logs(dirname=".", filename=None, container=None):
     type = "/%s" % container if container else ""
 
     def save_to(resp):
-        path = os.path.join(dirname, filename if filename else h2oconn.save_to_detect(resp))
+        path = os.path.join(dirname, filename if filename else H2OConnection.save_to_detect(resp))
         print("Writing H2O logs to " + path)
         return path
 
@@ -1669,7 +1932,8 @@ def cluster():
     >>> h2o.init()
     >>> h2o.cluster()
     """
-    return h2oconn.cluster if h2oconn else None
+    conn = connection()
+    return conn.cluster if conn else None
 
 
 def create_frame(frame_id=None, rows=10000, cols=10, randomize=True,
@@ -1809,7 +2073,7 @@ def create_frame(frame_id=None, rows=10000, cols=10, randomize=True,
             frcs[i] = 0
     real_fraction, categorical_fraction, integer_fraction, binary_fraction, time_fraction, string_fraction = frcs
 
-    parms = {"dest": frame_id if frame_id else py_tmp_key(append=h2oconn.session_id),
+    parms = {"dest": frame_id if frame_id else py_tmp_key(append=connection().session_id),
              "rows": rows,
              "cols": cols,
              "randomize": randomize,
@@ -1881,7 +2145,7 @@ def interaction(data, factors, pairwise, max_factors, min_occurrence, destinatio
     assert_is_type(min_occurrence, int)
     assert_is_type(destination_frame, str, None)
     factors = [data.names[n] if is_type(n, int) else n for n in factors]
-    parms = {"dest": py_tmp_key(append=h2oconn.session_id) if destination_frame is None else destination_frame,
+    parms = {"dest": py_tmp_key(append=connection().session_id) if destination_frame is None else destination_frame,
              "source_frame": data.frame_id,
              "factor_columns": [quoted(f) for f in factors],
              "pairwise": pairwise,
@@ -2509,7 +2773,8 @@ def _connect_with_conf(conn_conf, **kwargs):
         conf = H2OConnectionConf(config=conn_conf)
     assert_is_type(conf, H2OConnectionConf)
     return connect(url=conf.url, verify_ssl_certificates=conf.verify_ssl_certificates, cacert=conf.cacert,
-                   auth=conf.auth, proxy=conf.proxy, cookies=conf.cookies, verbose=conf.verbose, **kwargs)
+                   auth=conf.auth, proxy=conf.proxy, cookies=conf.cookies, verbose=conf.verbose,
+                   pool_size=conf.pool_size, keep_alive=conf.keep_alive, max_retries=conf.max_retries, **kwargs)
 
 
 # ----------------------------------------------------------------------------------------------------------------------
@@ -15,6 +15,7 @@ import h2o
 from h2o.exceptions import H2OJobCancelled, H2OConnectionError, H2OResponseError, H2OServerError
 from h2o.utils.progressbar import ProgressBar, PBWString, PBWBar, PBWPercentage
 from h2o.utils.shared_utils import clamp
+from h2o.utils.typechecks import assert_is_type, assert_satisfies
 
 
 class _DefaultJobProgressWidgetFactory(object):
@@ -32,6 +33,7 @@ class H2OJob(object):
 
     __PROGRESS_BAR__ = True  # display & update progress bar while polling
     __PROGRESS_WIDGETS__ = _DefaultJobProgressWidgetFactory()
+    _RUNNING_STATES = {"CREATED", "RUNNING"}
     
     def __init__(self, jobs, job_type):
         """Initialize new H2OJob object."""
@@ -76,6 +78,28 @@ class H2OJob(object):
                 self.cancel()
             # Potentially we may want to re-raise the exception here
 
+        return self._finish()
+
+    def wait(self):
+        """
+        Wait asynchronously until the job finishes (requires Python 3.5+).
+
+        This is the asyncio counterpart of :meth:`poll`: it returns a coroutine that polls the job status without
+        blocking the event loop, so that many jobs can be awaited concurrently, e.g. using ``asyncio.gather``.
+        No progress bar is displayed. Cancelling the awaiting task also cancels the job on the server.
+
+        :returns: a coroutine resolving to this job once it is done.
+
+        :examples:
+
+        >>> job = H2OJob(h2o.api("POST /3/ModelBuilders/gbm", data=params), "GBM Model Build")
+        >>> await job.wait()
+        """
+        from h2o.aio import wait
+        return wait(self)
+
+    def _finish(self):
+        """Report the warnings of a completed job, and raise an error if the job didn't complete successfully."""
         assert self.status in {"DONE", "CANCELLED", "FAILED"} or self._poll_count <= 0, \
             "Polling finished while the job has status %s" % self.status
         if self.warnings:
@@ -94,6 +118,85 @@ class H2OJob(object):
 
         return self
 
+    @staticmethod
+    def wait_all(jobs, return_when="ALL_COMPLETED", on_completion=None):
+        """
+        Wait until the given jobs finish.
+
+        Instead of polling each job separately (as :meth:`poll` would do), the status of all the outstanding jobs is
+        retrieved with a single request per polling iteration, and the polling interval adapts to the progress of the
+        jobs. A single progress bar shows the aggregated progress of the jobs.
+
+        Contrary to :meth:`poll`, this method doesn't raise an error if some of the jobs fail or get cancelled:
+        those jobs are simply returned among the completed jobs, and their ``status`` should be checked.
+
+        :param jobs: the list of jobs to wait for.
+        :param return_when: indicates when this method should return:
+
+            - "ALL_COMPLETED" (default): when all the jobs have completed.
+            - "FIRST_COMPLETED": as soon as any of the jobs completes.
+            - "FIRST_EXCEPTION": as soon as any of the jobs fails or is cancelled, or when all the jobs have completed.
+
+        :param on_completion: a callback function called with the job as single argument as soon as a job completes
+            (successfully or not).
+        :returns: a tuple ``(done, not_done)`` of lists of jobs: ``done`` contains the completed jobs in the order of
+            completion, ``not_done`` the jobs that are still running.
+
+        :examples:
+
+        >>> for model in models:
+        ...     model.start(x, y, training_frame=train)
+        >>> done, not_done = H2OJob.wait_all([model._job for model in models])
+        """
+        assert_is_type(jobs, [H2OJob])
+        assert_is_type(return_when, "ALL_COMPLETED", "FIRST_COMPLETED", "FIRST_EXCEPTION")
+        assert_satisfies(on_completion, on_completion is None or callable(on_completion))
+        pending = [job for job in jobs if job.status in H2OJob._RUNNING_STATES]
+        done = [job for job in jobs if job.status not in H2OJob._RUNNING_STATES]
+
+        def completed():
+            if return_when == "FIRST_COMPLETED" and done:
+                return True
+            if return_when == "FIRST_EXCEPTION" and any(job.status in {"FAILED", "CANCELLED"} for job in done):
+                return True
+            return not pending
+
+        def refresh_jobs_status():
+            if len(pending) == 1:
+                statuses = {}
+            else:
+                # Single listing of all the cluster jobs instead of one request per outstanding job.
+                statuses = {j["key"]["name"]: j for j in pending[0]._query_job_status_safe("GET /3/Jobs")["jobs"]}
+            for job in list(pending):
+                if job.job_key in statuses:
+                    job._update_status(statuses[job.job_key])
+                else:
+                    job._refresh_job_status_quietly()
+                if job.status not in H2OJob._RUNNING_STATES:
+                    pending.remove(job)
+                    done.append(job)
+                    for w in job.warnings or []:
+                        warnings.warn(w)
+                    if on_completion is not None:
+                        on_completion(job)
+            if completed():
+                return 1
+            if return_when == "FIRST_COMPLETED":
+                return max(job.progress for job in pending)
+            return (len(done) + sum(job.progress for job in pending)) / len(jobs)
+
+        if not completed():
+            job_types = {job._job_type for job in jobs}
+            title = "%s progress (%d jobs):" % (job_types.pop() if len(job_types) == 1 else "Jobs", len(jobs))
+            pb = ProgressBar(widgets=[PBWString(title), PBWBar(), PBWPercentage()], hidden=not H2OJob.__PROGRESS_BAR__)
+            try:
+                pb.execute(refresh_jobs_status)
+            except StopIteration as e:
+                if str(e) == "cancelled":
+                    for job in pending:
+                        job.cancel()
+        return done, pending
+
     # TODO: this is not multi-client safe:
     def poll_once(self):
         """Query the job status and show the progress bar, but then cancel immediately."""
@@ -106,14 +209,16 @@ class H2OJob(object):
         h2o.api("POST /3/Jobs/%s/cancel" % self.job_key)
         self.status = "CANCELLED"
     
-    def _query_job_status_safe(self):
+    def _query_job_status_safe(self, endpoint=None):
+        if endpoint is None:
+            endpoint = "GET /3/Jobs/%s" % self.job_key
         result = None
         attempts = 0
         last_err = None
         while attempts < 30:
             try:
                 attempts += 1
-                result = h2o.api("GET /3/Jobs/%s" % self.job_key)
+                result = h2o.api(endpoint)
                 self.job_poll_success = True  # only retry if there was at least one OK response
                 break
             except (H2OConnectionError, H2OResponseError, H2OServerError) as e:
@@ -136,21 +241,32 @@ class H2OJob(object):
     def _refresh_job_status(self):
         if self._poll_count <= 0: raise StopIteration("")
         jobs = self._query_job_status_safe()
-        self.job = jobs["jobs"][0] if "jobs" in jobs else jobs["job"][0]
+        self._update_status(jobs["jobs"][0] if "jobs" in jobs else jobs["job"][0])
+        self._poll_count -= 1
+        if self.status == "FAILED": raise StopIteration("failed")
+        if self.status == "CANCELLED": raise StopIteration("cancelled by the server")
+        return self.progress
+
+    def _refresh_job_status_quietly(self):
+        """Same as :meth:`_refresh_job_status` but without raising StopIteration when the job is interrupted."""
+        try:
+            self._refresh_job_status()
+        except StopIteration:
+            pass
+        return self.status
+
+    def _update_status(self, job):
+        self.job = job
         self.status = self.job["status"]
         self.progress = self.job["progress"]
         self.exception = self.job["exception"]
         self.warnings = self.job["warnings"] if "warnings" in self.job else None
-        self._poll_count -= 1
         # Sometimes the server may report the job at 100% but still having status "RUNNING" -- we work around this
         # by showing progress at 99% instead. Sometimes the server may report the job at 0% but having status "DONE",
         # in this case we set the progress to 100% manually.
         if self.status == "CREATED": self.progress = 0
         if self.status == "RUNNING": self.progress = clamp(self.progress, 0, 0.99)
         if self.status == "DONE": self.progress = 1
-        if self.status == "FAILED": raise StopIteration("failed")
-        if self.status == "CANCELLED": raise StopIteration("cancelled by the server")
-        return self.progress
 
     def __repr__(self):
         if self.status in {"CREATED", "RUNNING"}:
@@ -5,6 +5,7 @@ from h2o.utils.mixin import register_submodule
 from .confusion_matrix import ConfusionMatrix
 from .metrics_base import MetricsBase
 from .metrics import *
+from .lazy_model import H2OLazyModel
 from .model_base import ModelBase
 from .models import *
 from .segment_models import H2OSegmentModels
@@ -13,7 +14,7 @@ from .segment_models import H2OSegmentModels
 __all__ = ["ModelBase", "MetricsBase", 
            "H2OBinomialModel", "H2OMultinomialModel", "H2ORegressionModel", "H2OOrdinalModel",
            "H2OClusteringModel", "H2ODimReductionModel", "H2OAutoEncoderModel", "H2OBinomialUpliftModel",
-           "ConfusionMatrix",  "H2OSegmentModels", ]
+           "ConfusionMatrix",  "H2OSegmentModels", "H2OLazyModel", ]
 
 
 # Aliasing some submodules to 'h2o.model' for full backwards compatibility 
@@ -0,0 +1,81 @@
+# -*- encoding: utf-8 -*-
+"""
+Lazy handle to an H2O model.
+
+:copyright: (c) 2016 H2O.ai
+:license:   Apache License Version 2.0 (see LICENSE for details)
+"""
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import threading
+
+import h2o
+from h2o.base import Keyed
+from h2o.utils.compatibility import *  # NOQA
+
+__all__ = ("H2OLazyModel", )
+
+
+class H2OLazyModel(Keyed):
+    """
+    Handle to a model of the H2O server whose JSON has not been fetched yet.
+
+    Only the model id is known until any other attribute of the handle is accessed: then the model is loaded from
+    the server (as with :func:`h2o.get_model`) and the handle turns itself into that model, e.g. an
+    :class:`~h2o.estimators.H2OGradientBoostingEstimator`, so that it can be used as such afterwards.
+    This makes it cheap to get handles to many models, e.g. to the models of a large grid, when only some of them
+    are actually inspected.
+
+    Note that the model is not loaded by ``isinstance`` checks: call :meth:`materialize` first if the type of the
+    model matters.
+
+    :examples:
+
+    >>> model = h2o.get_model("my_gbm", lazy=True)  # no request sent to the server
+    >>> model.model_id
+    >>> model.auc()  # the model is loaded here
+    """
+
+    def __init__(self, model_id):
+        self.__dict__.update(_id=model_id, _lock=threading.Lock())
+
+    @property
+    def key(self):
+        return self._id
+
+    @property
+    def model_id(self):
+        """Model identifier."""
+        return self._id
+
+    def detach(self):
+        self.__dict__["_id"] = None
+
+    def materialize(self):
+        """
+        Load the model from the server, if not already done.
+
+        :returns: the model, i.e. this object which is now an instance of the class of the model.
+        """
+        lock = self.__dict__.get("_lock")
+        if lock is None:  # already materialized by another thread
+            return self
+        with lock:
+            if isinstance(self, H2OLazyModel):
+                model = h2o.get_model(self._id)
+                object.__setattr__(self, "__class__", model.__class__)
+                object.__setattr__(self, "__dict__", dict(vars(model)))
+        return self
+
+    def __getattr__(self, name):
+        # called only for the attributes not defined by the handle: special methods are looked up on the class by
+        # Python, so their lookups from the Python internals (copy, pickle...) must not load the model.
+        if name.startswith("__") and name.endswith("__"):
+            raise AttributeError(name)
+        return getattr(H2OLazyModel.materialize(self), name)
+
+    def __setattr__(self, name, value):
+        setattr(H2OLazyModel.materialize(self), name, value)
+
+    def __repr__(self):
+        return "<H2OLazyModel: %s>" % self._id
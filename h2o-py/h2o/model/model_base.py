@@ -38,7 +38,8 @@ class ModelBase(h2o_meta(Keyed, H2ODisplay)):
         self._is_xvalidated = False
         self._xval_keys = None
         self._parms = {}  # internal, for object recycle
-        self.parms = {}  # external
+        self._full_parms = {}  # external, see parms
+        self._parms_json = None  # parameters of the model JSON not indexed into _full_parms yet
         self._estimator_type = None
         self._future = False  # used by __repr__/show to query job state
         self._job = None  # used when _future is True
@@ -63,6 +64,24 @@ class ModelBase(h2o_meta(Keyed, H2ODisplay)):
         self._id = newid
         h2o.rapids("(rename '%s' '%s')" % (oldid, newid))
 
+    @property
+    def parms(self):
+        """
+        Dictionary of the full specification of all parameters, by parameter name.
+
+        It is built from the model JSON on first access.
+        """
+        if self._parms_json is not None:
+            for p in self._parms_json:
+                self._full_parms[p["name"]] = p
+            self._parms_json = None
+        return self._full_parms
+
+    @parms.setter
+    def parms(self, parms):
+        self._full_parms = parms
+        self._parms_json = None
+
     @property
     def params(self):
         """
@@ -330,7 +349,7 @@ class ModelBase(h2o_meta(Keyed, H2ODisplay)):
 
         :returns: A model or list of models.
         """
-        return h2o.get_model(key) if key is not None else [h2o.get_model(k) for k in self._xval_keys]
+        return h2o.get_model(key) if key is not None else h2o.get_models(self._xval_keys)
 
     @property
     def xvals(self):
@@ -1565,9 +1584,7 @@ class ModelBase(h2o_meta(Keyed, H2ODisplay)):
         cvmodels = self._model_json["output"]["cross_validation_models"]
         if cvmodels is None: 
             return None
-        m = []
-        for p in cvmodels: m.append(h2o.get_model(p["name"]))
-        return m
+        return h2o.get_models([p["name"] for p in cvmodels])
 
     def cross_validation_predictions(self):
         """
@@ -0,0 +1,160 @@
+# -*- encoding: utf-8 -*-
+"""
+On-disk cache of the models JSON.
+
+:copyright: (c) 2016 H2O.ai
+:license:   Apache License Version 2.0 (see LICENSE for details)
+"""
+from __future__ import absolute_import, division, print_function, unicode_literals
+from h2o.utils.compatibility import *  # NOQA
+
+import hashlib
+import io
+import json
+import os
+import threading
+
+import h2o
+from h2o.backend.connection import H2OResponse
+
+__all__ = ("ModelJsonCache", )
+
+
+class ModelJsonCache(object):
+    """
+    On-disk cache (LRU) of the JSON of the models fetched from the backend (``GET /3/Models/<model_id>``), shared
+    by all the sessions using the same cache directory, so that the JSON of a model is downloaded only once.
+
+    The entries are identified by the name of the cluster, the id of the model, and the checksum and completion
+    timestamp of the model. These last two are fetched first (the output and parameters of the model being
+    excluded from the response): an entry whose checksum or timestamp differ is stale, and is replaced by the JSON
+    fetched again. Models still being built are never cached.
+
+    The cache is disabled by default, see :func:`h2o.enable_model_cache`.
+    """
+
+    enabled = False
+    directory = os.path.join(os.path.expanduser("~"), ".h2o_model_cache")
+    max_size = 1 << 30  # in bytes
+
+    hits = 0
+    misses = 0
+
+    _lock = threading.Lock()
+    _header_excluded_fields = "models/output,models/parameters,models/compatible_frames"
+
+    @classmethod
+    def fetch(cls, model_id):
+        """
+        Get the JSON of a model, from the cache if possible.
+
+        :param model_id: the id of the model.
+        :returns: the JSON of the model, as returned by ``GET /3/Models/<model_id>``.
+        """
+        endpoint = "GET /3/Models/%s" % model_id
+        conn = h2o.connection()
+        cluster = conn.cluster if cls.enabled and conn is not None else None
+        if cluster is None:
+            return h2o.api(endpoint)["models"][0]
+        header = h2o.api(endpoint, data={"_exclude_fields": cls._header_excluded_fields})["models"][0]
+        if not header.get("timestamp"):  # still running
+            return h2o.api(endpoint)["models"][0]
+        prefix = hashlib.sha1(("%s\0%s" % (cluster.cloud_name, model_id)).encode("utf-8")).hexdigest()
+        filename = os.path.join(cls.directory, "%s-%s-%s.json" % (prefix, header.get("checksum"), header["timestamp"]))
+        model_json = cls._load(filename)
+        with cls._lock:
+            if model_json is not None:
+                cls.hits += 1
+                return model_json
+            cls.misses += 1
+        return cls._download(endpoint, filename, prefix)
+
+    @classmethod
+    def clear(cls):
+        """Remove all the entries of the cache."""
+        with cls._lock:
+            for filename in cls._entries():
+                _remove(filename)
+
+    @classmethod
+    def stats(cls):
+        with cls._lock:
+            entries = cls._entries()
+            return dict(hits=cls.hits, misses=cls.misses, size=len(entries),
+                        bytes=sum(_file_size(filename) for filename in entries))
+
+    @classmethod
+    def _load(cls, filename):
+        try:
+            with io.open(filename, "r", encoding="utf-8") as f:
+                model_json = json.load(f, object_pairs_hook=H2OResponse)["models"][0]
+        except (IOError, OSError):
+            return None
+        except (ValueError, KeyError, IndexError):  # corrupted entry
+            _remove(filename)
+            return None
+        try:
+            os.utime(filename, None)  # most recently used
+        except OSError:
+            pass
+        return model_json
+
+    @classmethod
+    def _download(cls, endpoint, filename, prefix):
+        tmp_filename = "%s.%d.%d.tmp" % (filename, os.getpid(), threading.current_thread().ident)
+        try:
+            h2o.api(endpoint, save_to=tmp_filename)
+            with io.open(tmp_filename, "r", encoding="utf-8") as f:
+                model_json = json.load(f, object_pairs_hook=H2OResponse)["models"][0]
+        except BaseException:
+            _remove(tmp_filename)
+            raise
+        with cls._lock:
+            for stale in cls._entries(prefix):
+                _remove(stale)
+            try:
+                os.rename(tmp_filename, filename)
+            except OSError:  # e.g. on Windows, if stored concurrently by another session
+                _remove(tmp_filename)
+            cls._evict()
+        return model_json
+
+    @classmethod
+    def _entries(cls, prefix=""):
+        try:
+            names = os.listdir(cls.directory)
+        except OSError:
+            return []
+        return [os.path.join(cls.directory, name) for name in names
+                if name.startswith(prefix) and name.endswith(".json")]
+
+    @classmethod
+    def _evict(cls):
+        """Remove the least recently used entries until the cache fits in ``max_size``."""
+        entries = []
+        for filename in cls._entries():
+            try:
+                stat = os.stat(filename)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, filename))
+        size = sum(e[1] for e in entries)
+        for _, entry_size, filename in sorted(entries):
+            if size <= cls.max_size:
+                break
+            _remove(filename)
+            size -= entry_size
+
+
+def _remove(filename):
+    try:
+        os.remove(filename)
+    except OSError:
+        pass
+
+
+def _file_size(filename):
+    try:
+        return os.path.getsize(filename)
+    except OSError:
+        return 0
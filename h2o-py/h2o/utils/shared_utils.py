@@ -29,7 +29,9 @@ import string
 import subprocess
 import sys
 import tempfile
+import threading
 import zipfile
+import zlib
 
 
 try:
@@ -47,9 +49,11 @@ except ImportError:
 
 from h2o.backend.server import H2OLocalServer
 from h2o.exceptions import H2OValueError
+from h2o.utils.metaclass import deprecated_fn
 from h2o.utils.typechecks import assert_is_type, is_type, numeric
 
 _id_ctr = 0
+_id_ctr_lock = threading.Lock()
 
 # The set of characters allowed in frame IDs. Since frame ids are used within REST API urls, they may
 # only contain characters allowed within the "segment" part of the URL (see RFC 3986). Additionally, we
@@ -93,8 +97,10 @@ class LookupSeq(tuple):
 
 def _py_tmp_key(append):
     global _id_ctr
-    _id_ctr += 1
-    return "py_" + str(_id_ctr) + append
+    with _id_ctr_lock:
+        _id_ctr += 1
+        ctr = _id_ctr
+    return "py_" + str(ctr) + append
 
 
 def check_frame_id(frame_id):
@@ -143,6 +149,10 @@ def can_use_numpy():
     return is_module_available('numpy')
 
 
+def can_use_pyarrow():
+    return is_module_available('pyarrow')
+
+
 _url_safe_chars = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_.~"
 _url_chars_map = [chr(i) if chr(i) in _url_safe_chars else "%%%02X" % i for i in range(256)]
 
@@ -252,6 +262,8 @@ def _handle_numpy_array(python_obj, header):
     return _handle_python_lists(python_obj.tolist(), header)
 
 
+@deprecated_fn(msg="``handle_pandas_data_frame`` is deprecated: pandas DataFrames are uploaded as CSV, "
+                   "see ``H2OFrame(pandas_df)``.")
 def _handle_pandas_data_frame(python_obj, header):
     data = _handle_python_lists(python_obj.values.tolist(), -1)[1]
     return list(str(c) for c in python_obj.columns), data
@@ -611,6 +623,113 @@ class InMemoryZipArch(object):
         self.write_to_file(self._file_name)
 
 
+class FilePart(object):
+    """
+    A contiguous part of a local file, which can be uploaded to the server like a whole file
+    (see ``H2OConnection.request(filename=...)``).
+
+    It is read as a binary file object of size `length`, starting at `offset` in the file; the file is opened at the
+    first read, and closed with :meth:`close` (or at the end of the ``with`` block).
+    """
+
+    def __init__(self, path, offset, length):
+        self.path = path
+        self.offset = offset
+        self.length = length
+        self._file = None
+        self._remaining = length
+
+    def read(self, size=-1):
+        if self._file is None:
+            self._file = open(self.path, "rb")
+            self._file.seek(self.offset)
+        if size is None or size < 0 or size > self._remaining:
+            size = self._remaining
+        data = self._file.read(size)
+        self._remaining -= len(data)
+        return data
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __len__(self):
+        return self.length
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __str__(self):
+        return "%s[%d:%d]" % (self.path, self.offset, self.offset + self.length)
+
+
+class GzipStream(object):
+    """
+    A binary file object reading the content of another one (`source`), gzip-compressed on the fly.
+
+    The content is read and compressed in chunks of `chunk_size` bytes, so that it is never held in memory as a whole.
+    The stream is also iterable over compressed chunks, and :meth:`tell` returns the number of compressed bytes read.
+    """
+
+    def __init__(self, source, level=6, chunk_size=1 << 16):
+        self._source = source
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)  # with the gzip header
+        self._chunk_size = chunk_size
+        self._buffer = b""
+        self._done = False
+        self._position = 0
+
+    def read(self, size=-1):
+        if size is None:
+            size = -1
+        while not self._done and (size < 0 or len(self._buffer) < size):
+            chunk = self._source.read(self._chunk_size)
+            if chunk:
+                self._buffer += self._compressor.compress(chunk)
+            else:
+                self._buffer += self._compressor.flush()
+                self._done = True
+        if 0 <= size < len(self._buffer):
+            data, self._buffer = self._buffer[:size], self._buffer[size:]
+        else:
+            data, self._buffer = self._buffer, b""
+        self._position += len(data)
+        return data
+
+    def __iter__(self):
+        while True:
+            data = self.read(self._chunk_size)
+            if not data:
+                return
+            yield data
+
+    def tell(self):
+        return self._position
+
+    def close(self):
+        self._source.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+# Signatures of the compressed or binary file formats: gzip, zip (and xlsx), bzip2, xz, parquet, orc, avro, xls
+_binary_file_signatures = (b"\x1f\x8b", b"PK\x03\x04", b"BZh", b"\xfd7zXZ\x00", b"PAR1", b"ORC", b"Obj\x01",
+                           b"\xd0\xcf\x11\xe0")
+
+
+def is_binary_file_head(head):
+    """Whether `head`, the first bytes of a file, are those of a compressed or binary (i.e. not text) file."""
+    return head.startswith(_binary_file_signatures) or b"\x00" in head
+
+
 @contextlib.contextmanager
 def as_resource(o):
     if isinstance(o, AbstractContextManager):
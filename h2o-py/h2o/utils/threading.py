@@ -16,6 +16,9 @@ try:
         
     def _set_local(loc):
         local.set(loc)
+
+    def _caller_context_runner():
+        return copy_context().run
 except ImportError:
     local = threading.local()
     local.context = {}
@@ -27,6 +30,14 @@ except ImportError:
     def _set_local(loc):
         local.context = loc
 
+    def _caller_context_runner():
+        context = _get_local()
+
+        def run(fn, *args):
+            _set_local(context)
+            return fn(*args)
+        return run
+
 __no_export = set(dir())  # all variables defined above this are not exported
 
 
@@ -88,4 +99,47 @@ def local_env(key, default=None, use_default_if_none=False):
     return default if use_default_if_none and value is None else value
 
 
+def map_concurrently(fn, items, max_workers):
+    """
+    Apply `fn` to each of the `items`, in at most `max_workers` threads.
+
+    Each thread runs in a copy of the local context of the caller, so that for example the calls use the same H2O
+    connection as the caller.
+
+    :param fn: the function to apply.
+    :param items: the items to which the function is applied.
+    :param max_workers: the maximum number of calls running at the same time.
+    :return: the list of the results, in the order of the items.
+    :raises Exception: the first exception raised by `fn`, once the running calls are finished (no new call is
+        started after a failure).
+    """
+    items = list(items)
+    results = [None] * len(items)
+    errors = []
+    indices = iter(range(len(items)))
+    lock = threading.Lock()
+
+    def work():
+        while not errors:
+            with lock:
+                i = next(indices, None)
+            if i is None:
+                return
+            try:
+                results[i] = fn(items[i])
+            except Exception as e:
+                errors.append(e)
+
+    threads = [threading.Thread(target=_caller_context_runner(), args=(work,))
+               for _ in range(min(max_workers, len(items)))]
+    for t in threads:
+        t.daemon = True
+        t.start()
+    for t in threads:
+        t.join()
+    if errors:
+        raise errors[0]
+    return results
+
+
 __all__ = [s for s in dir() if not s.startswith('_') and s not in __no_export]
@@ -2,7 +2,9 @@ from __future__ import print_function
 import sys, os, datetime as dt
 
 sys.path.insert(1, os.path.join("..","..",".."))
+import h2o
 from h2o.automl import H2OAutoML
+from h2o.automl._base import _fetch_events
 from tests import pyunit_utils as pu
 
 from _automl_utils import import_dataset
@@ -68,7 +70,30 @@ def test_train_verbosity():
     assert "No time limitation for" in debug.out.text
 
 
+def test_events_are_polled_incrementally():
+    ds = import_dataset()
+    h2o.connection().stats().reset()
+    with pu.capture_output() as info:
+        aml = H2OAutoML(project_name="test_events_polling", max_models=2, seed=1234, verbosity='info')
+        aml.train(y=ds.target, training_frame=ds.train)
+    stats = h2o.connection().stats().as_dict()
+    assert stats["GET /99/AutoML/{}/events"]["calls"] > 0
+    assert stats["GET /99/AutoML/{}"]["calls"] == 1, "the full state should only be fetched once the training is done"
+    assert "AutoML duration" in info.out.text
+
+    events = _fetch_events(aml.key, verbosity='info')
+    assert not events['running']
+    assert events['progress'] == 1
+    count = events['events_count']
+    assert count == len(events['event_log_table'].cell_values) > 0
+    tail = _fetch_events(aml.key, offset=count - 2, verbosity='info')
+    assert tail['events_count'] == count
+    assert tail['event_log_table'].cell_values == events['event_log_table'].cell_values[-2:]
+    assert len(_fetch_events(aml.key, offset=count, verbosity='info')['event_log_table'].cell_values) == 0
+
+
 pu.run_tests([
     test_event_log,
-    test_train_verbosity
+    test_train_verbosity,
+    test_events_are_polled_incrementally,
 ])
@@ -0,0 +1,46 @@
+from __future__ import print_function
+import os
+import sys
+
+sys.path.insert(1, os.path.join("..","..",".."))
+import h2o
+from h2o.automl import H2OAutoML
+from tests import pyunit_utils as pu
+
+from _automl_utils import import_dataset
+
+
+def _uploads():
+    return h2o.connection().stats().as_dict().get("POST /3/PostFile", {}).get("calls", 0)
+
+
+def test_leaderboard_and_event_log_are_kept_local():
+    ds = import_dataset()
+    aml = H2OAutoML(project_name="py_aml_local_tables", max_models=3, seed=1234)
+    aml.train(y=ds.target, training_frame=ds.train)
+    h2o.connection().stats().reset()
+
+    lb = aml.leaderboard
+    assert isinstance(lb, h2o.H2OFrame)
+    assert "model_id" in str(lb)
+    assert lb.columns[0] == "model_id"
+    model_ids = [r[0] for r in lb[:, "model_id"].as_data_frame(use_pandas=False, header=False)]
+    assert lb.nrows == len(model_ids) >= 3
+    assert lb[0, "model_id"] == model_ids[0] == aml.leader.model_id
+    assert aml.get_best_model().model_id == aml.leader.model_id
+    assert int(aml.training_info['stop_epoch']) >= int(aml.training_info['start_epoch'])
+    assert aml.event_log.nrows > 10
+    assert _uploads() == 0, "the leaderboard and event log should not be uploaded"
+
+    # operations on the backend upload the frame under the leaderboard key
+    sorted_lb = lb.sort(by=lb.columns[1])
+    assert _uploads() == 1
+    assert lb.frame_id == "py_aml_local_tables_leaderboard"
+    assert sorted(r[0] for r in sorted_lb[:, "model_id"].as_data_frame(use_pandas=False, header=False)) == \
+        sorted(model_ids)
+    assert [r[0] for r in h2o.get_frame(lb.frame_id).as_data_frame(use_pandas=False, header=False)] == model_ids
+
+
+pu.run_tests([
+    test_leaderboard_and_event_log_are_kept_local,
+])
@@ -0,0 +1,40 @@
+import asyncio
+
+import h2o
+from h2o.estimators import H2OGradientBoostingEstimator
+from tests import pyunit_utils
+
+
+def test_api_async():
+    async def main():
+        return await asyncio.gather(*[h2o.aio.api("GET /3/Ping") for _ in range(10)])
+
+    responses = asyncio.run(main())
+    assert len(responses) == 10
+
+
+def test_train_async():
+    train = h2o.import_file(pyunit_utils.locate("smalldata/logreg/prostate.csv"))
+    train["CAPSULE"] = train["CAPSULE"].asfactor()
+    x = ["AGE", "RACE", "PSA", "GLEASON"]
+    gbms = [H2OGradientBoostingEstimator(ntrees=5, seed=seed) for seed in range(4)]
+
+    async def main():
+        return await asyncio.gather(*[gbm.train_async(x, "CAPSULE", training_frame=train) for gbm in gbms])
+
+    trained = asyncio.run(main())
+    assert trained == gbms
+    model_ids = [gbm.model_id for gbm in gbms]
+    assert len(set(model_ids)) == 4
+    for model_id in model_ids:
+        assert h2o.get_model(model_id).auc() > 0.5
+
+
+def test_frame_refresh_async():
+    fr = h2o.H2OFrame({"A": [1, 2, 3], "B": ["a", "b", "c"]})
+
+    async def main():
+        return await fr.refresh_async()
+
+    assert asyncio.run(main()) is fr
+    assert fr.dim == [3, 2]
@@ -0,0 +1,14 @@
+import sys
+sys.path.insert(1,"../../")
+from tests import pyunit_utils as pu
+
+tests = []
+try:
+    from tests.testdir_misc.optional_aio import test_api_async, test_train_async, test_frame_refresh_async
+    if sys.version_info > (3, 7):  # we need asyncio.run
+        tests.extend([test_api_async, test_train_async, test_frame_refresh_async])
+except SyntaxError:
+    assert sys.version_info < (3,)  # no async, await primitives before that
+
+
+pu.run_tests(tests)
@@ -0,0 +1,83 @@
+import sys
+sys.path.insert(1,"../../")
+import gc
+import weakref
+import h2o
+from h2o import astfun
+from tests import pyunit_utils
+
+
+def test_lambda_translated_once():
+    fr = h2o.H2OFrame([[1, 2], [3, 4], [5, 6]])
+    calls = []
+    disassemble = astfun._disassemble_lambda
+
+    def counting_disassemble(co):
+        calls.append(co)
+        return disassemble(co)
+
+    astfun._disassemble_lambda = counting_disassemble
+    try:
+        results = [fr.apply(lambda x: (x.max() - x.min()) * x.mean()) for _ in range(10)]
+    finally:
+        astfun._disassemble_lambda = disassemble
+    assert len(calls) <= 1, calls
+    # each application gets its own copy of the lambda body
+    bodies = set(id(res._ex.arg(-2)) for res in results)
+    assert len(bodies) == len(results)
+    expected = [[12.0, 16.0]]
+    for res in results:
+        assert [[float(v) for v in row] for row in res.as_data_frame(use_pandas=False, header=False)] == expected
+
+
+def test_cache_invalidated_by_captured_variables():
+    fr = h2o.H2OFrame([[1, 2], [3, 4], [5, 6]])
+    results = []
+    for k in (1, 10):
+        res = fr.apply(lambda x: x.mean() + k)
+        results.append([[float(v) for v in row] for row in res.as_data_frame(use_pandas=False, header=False)])
+    assert results == [[[4.0, 5.0]], [[13.0, 14.0]]], results
+
+
+def test_cache_invalidated_by_captured_frame_update():
+    fr = h2o.H2OFrame([[1, 2], [3, 4], [5, 6]])
+    weights = h2o.H2OFrame([[1], [1], [1]])
+    fun = lambda x: x * weights
+    ast = astfun.lambda_to_expr(fun)
+    assert ast[-2].arg(1) is weights._ex
+    weights[0] = 2
+    weights.refresh()
+    ast = astfun.lambda_to_expr(fun)
+    assert ast[-2].arg(1) is weights._ex, "the current expression of the captured frame should be used"
+    res = fr.apply(fun)
+    assert [[float(v) for v in row] for row in res.as_data_frame(use_pandas=False, header=False)] == \
+           [[2.0, 4.0], [6.0, 8.0], [10.0, 12.0]]
+
+
+def test_same_lambda_applied_twice_in_expression():
+    fr = h2o.H2OFrame([[1, 2], [3, 4], [5, 6]])
+    fun = lambda x: x.mean() / x.mean()
+    res = fr.apply(fun).cbind(fr.apply(fun))
+    assert res.as_data_frame(use_pandas=False, header=False) == [['1', '1', '1', '1']]
+
+
+def test_captured_frames_are_not_kept_alive():
+    fr = h2o.H2OFrame([[1, 2], [3, 4], [5, 6]])
+
+    def apply_with_weights():
+        weights = h2o.H2OFrame([[1], [2], [3]])
+        fr.apply(lambda x: x * weights).as_data_frame(use_pandas=False)
+        return weakref.ref(weights)
+
+    weights_ref = apply_with_weights()
+    gc.collect()
+    assert weights_ref() is None, "the lambda cache should not keep the captured frames alive"
+
+
+pyunit_utils.run_tests([
+    test_lambda_translated_once,
+    test_cache_invalidated_by_captured_variables,
+    test_cache_invalidated_by_captured_frame_update,
+    test_same_lambda_applied_twice_in_expression,
+    test_captured_frames_are_not_kept_alive,
+])
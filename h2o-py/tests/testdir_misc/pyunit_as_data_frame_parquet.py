@@ -0,0 +1,35 @@
+import sys
+sys.path.insert(1,"../../")
+import h2o
+from tests import pyunit_utils
+
+
+def test_as_data_frame_parquet():
+    prostate = h2o.import_file(pyunit_utils.locate("smalldata/prostate/prostate_cat.csv"))
+    prostate["DATE"] = h2o.H2OFrame.mktime(year=2000, month=prostate["AGE"] % 12, day=0)
+    prostate[0:10, "DPROS"] = None
+
+    df_csv = prostate.as_data_frame()
+    df_parquet = prostate.as_data_frame(transfer_format="parquet")
+
+    assert list(df_parquet.columns) == prostate.names
+    assert df_parquet.shape == df_csv.shape
+    levels = prostate.levels()
+    for i, name in enumerate(prostate.names):
+        col_type = prostate.types[name]
+        if col_type == "enum":
+            assert str(df_parquet[name].dtype) == "category", name
+            assert list(df_parquet[name].cat.categories) == levels[i]
+            assert (df_parquet[name].isnull() == df_csv[name].isnull()).all()
+            assert (df_parquet[name].astype(object).dropna() == df_csv[name].dropna().astype(str)).all()
+        elif col_type == "time":
+            assert str(df_parquet[name].dtype).startswith("datetime64"), name
+            assert (df_parquet[name].values.astype("datetime64[ms]").astype("int64") == df_csv[name]).all()
+        else:
+            assert (df_parquet[name] == df_csv[name]).all(), name
+
+
+if __name__ == "__main__":
+    pyunit_utils.standalone_test(test_as_data_frame_parquet)
+else:
+    test_as_data_frame_parquet()
@@ -0,0 +1,49 @@
+import sys
+sys.path.insert(1,"../../")
+import h2o
+from tests import pyunit_utils
+
+
+def test_batch_evaluates_frames_with_single_request():
+    iris = h2o.import_file(pyunit_utils.locate("smalldata/iris/iris_wheader.csv"))
+    expected = (iris["sepal_len"] * iris["sepal_wid"]).as_data_frame()
+    h2o.flush_tmp_removals()
+
+    conn = h2o.connection()
+    requests_count = conn.requests_count
+    with h2o.batch():
+        sepal_len = iris["sepal_len"]
+        sepal_wid = iris["sepal_wid"]
+        petal_len = iris["petal_len"].log()
+        petal_len = petal_len + 1
+        with h2o.batch():
+            ratio = (iris["petal_wid"] / 2).abs()
+    assert conn.requests_count - requests_count == 1, "frames of the block should be evaluated in a single request"
+    for fr in [sepal_len, sepal_wid, petal_len, ratio]:
+        assert fr._ex._cache._id is not None
+
+    sepal_area = sepal_len * sepal_wid
+    assert (sepal_area.as_data_frame().values == expected.values).all()
+    assert petal_len.nrows == iris.nrows
+    assert ratio.max() == iris["petal_wid"].max() / 2
+
+
+def test_batch_not_evaluated_on_error():
+    iris = h2o.import_file(pyunit_utils.locate("smalldata/iris/iris_wheader.csv"))
+    conn = h2o.connection()
+    requests_count = conn.requests_count
+    try:
+        with h2o.batch():
+            sepal_len = iris["sepal_len"].log()
+            raise ValueError("stop")
+    except ValueError:
+        pass
+    assert conn.requests_count == requests_count
+    assert sepal_len._ex._cache._id is None
+    assert sepal_len.nrows == iris.nrows
+
+
+pyunit_utils.run_tests([
+    test_batch_evaluates_frames_with_single_request,
+    test_batch_not_evaluated_on_error,
+])
@@ -0,0 +1,57 @@
+# -*- encoding: utf-8 -*-
+import sys
+sys.path.insert(1,"../../")
+import gzip
+import io
+import os
+import tempfile
+
+import requests
+from urllib3 import HTTPResponse
+
+import h2o
+from h2o.backend import H2OConnection
+from tests import pyunit_utils
+
+
+def _streamed_response(body, encoding=None, compress=False):
+    headers = {"Content-Type": "application/json"}
+    if compress:
+        buf = io.BytesIO()
+        with gzip.GzipFile(fileobj=buf, mode="wb") as f:
+            f.write(body)
+        body = buf.getvalue()
+        headers["Content-Encoding"] = "gzip"
+    resp = requests.Response()
+    resp.raw = HTTPResponse(body=io.BytesIO(body), headers=headers, preload_content=False)
+    resp.encoding = encoding
+    return resp
+
+
+def test_response_text_is_decoded():
+    text = u'{"name": "%s"}' % (u"é中" * 100000)
+    for compress in (False, True):
+        resp = _streamed_response(text.encode("utf-8"), compress=compress)
+        assert H2OConnection._read_text(resp) == text
+    resp = _streamed_response(text.encode("utf-16"), encoding="utf-16")
+    assert H2OConnection._read_text(resp) == text
+
+
+def test_logged_response_body():
+    conn = h2o.connection()
+    log_file = os.path.join(tempfile.mkdtemp(), "rest.log")
+    conn.start_logging(log_file)
+    try:
+        cloud = h2o.api("GET /3/Cloud")
+    finally:
+        conn.stop_logging()
+    with open(log_file) as f:
+        log = f.read()
+    assert "<<< HTTP 200 OK" in log
+    assert cloud.cloud_name in log.split("<<< HTTP 200 OK")[1], log
+
+
+pyunit_utils.run_tests([
+    test_response_text_is_decoded,
+    test_logged_response_body,
+])
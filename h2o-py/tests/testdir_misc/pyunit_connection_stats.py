@@ -0,0 +1,51 @@
+import sys
+sys.path.insert(1,"../../")
+import h2o
+from h2o.backend import H2OConnectionStats
+from h2o.exceptions import H2OResponseError
+from tests import pyunit_utils
+
+
+def test_endpoint_template():
+    assert H2OConnectionStats.endpoint_template("GET /3/Frames/iris.hex/summary?row_count=10") == \
+           "GET /3/Frames/{}/summary"
+    assert H2OConnectionStats.endpoint_template("GET /3/Frames/iris.hex/columns/sepal_len/summary") == \
+           "GET /3/Frames/{}/columns/{}/summary"
+    assert H2OConnectionStats.endpoint_template("POST /3/Predictions/models/gbm/frames/iris.hex") == \
+           "POST /3/Predictions/models/{}/frames/{}"
+    assert H2OConnectionStats.endpoint_template("POST /99/Rapids") == "POST /99/Rapids"
+
+
+def test_requests_are_recorded():
+    stats = h2o.connection().stats()
+    stats.reset()
+    fr = h2o.H2OFrame([[1, 2], [3, 4]])
+    for _ in range(5):
+        h2o.api("GET /3/Frames/%s/summary" % fr.frame_id)
+    try:
+        h2o.api("GET /3/Frames/%s" % "no_such_frame")
+    except H2OResponseError:
+        pass
+    metrics = stats.as_dict()
+    summary = metrics["GET /3/Frames/{}/summary"]
+    assert summary["calls"] == 5, summary
+    assert summary["errors"] == 0, summary
+    assert summary["response_bytes"] > 0, summary
+    assert 0 < summary["p50"] <= summary["p95"] <= summary["p99"] <= summary["latency_max"], summary
+    assert sum(n for _, n in summary["histogram"]) == 5, summary
+    assert metrics["GET /3/Frames/{}"]["errors"] == 1, metrics["GET /3/Frames/{}"]
+    assert metrics["POST /3/PostFile"]["request_bytes"] > 0, metrics["POST /3/PostFile"]
+
+    prometheus = stats.to_prometheus()
+    assert 'h2o_client_requests_total{method="GET",endpoint="/3/Frames/{}/summary"} 5' in prometheus, prometheus
+    assert 'h2o_client_request_duration_seconds_bucket{method="GET",endpoint="/3/Frames/{}/summary",le="+Inf"} 5' \
+           in prometheus, prometheus
+
+    stats.reset()
+    assert stats.as_dict() == {}
+
+
+pyunit_utils.run_tests([
+    test_endpoint_template,
+    test_requests_are_recorded,
+])
@@ -0,0 +1,82 @@
+import sys
+sys.path.insert(1,"../../")
+import threading
+import time
+
+import h2o
+from h2o.backend import H2OConnection
+from h2o.utils.threading import local_context
+from tests import pyunit_utils
+
+
+N_THREADS = 16
+N_REQUESTS = 50
+
+
+def _run_in_threads(fn, n_threads=N_THREADS):
+    errors = []
+    start = threading.Event()
+
+    def worker(i):
+        start.wait()
+        try:
+            fn(i)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(n_threads)]
+    for t in threads:
+        t.start()
+    start.set()
+    for t in threads:
+        t.join()
+    assert not errors, errors
+
+
+def test_concurrent_requests_keep_counter_consistent():
+    conn = h2o.connection()
+    count_before = conn.requests_count
+    start_time = time.time()
+
+    def ping(_):
+        for _ in range(N_REQUESTS):
+            h2o.api("GET /3/Ping")
+
+    _run_in_threads(ping)
+    duration = time.time() - start_time
+    print("%d threads issued %d requests each in %.3fs" % (N_THREADS, N_REQUESTS, duration))
+    assert conn.requests_count - count_before == N_THREADS * N_REQUESTS
+
+
+def test_session_id_is_issued_once():
+    with H2OConnection.open(url=h2o.connection().base_url, verbose=False, pool_size=N_THREADS) as conn:
+        count_before = conn.requests_count
+        session_ids = []
+        _run_in_threads(lambda _: session_ids.append(conn.session_id))
+        assert len(set(session_ids)) == 1, session_ids
+        assert conn.requests_count - count_before == 1
+
+
+def test_connection_bound_to_local_context():
+    default_conn = h2o.connection()
+    conns = {}
+
+    def use_own_connection(i):
+        with H2OConnection.open(url=default_conn.base_url, verbose=False) as conn:
+            with local_context(connection=conn):
+                assert h2o.connection() is conn
+                h2o.api("GET /3/Ping")
+                conns[i] = conn
+            assert h2o.connection() is default_conn
+
+    _run_in_threads(use_own_connection, n_threads=4)
+    assert len(set(id(c) for c in conns.values())) == 4
+    assert all(c is not default_conn for c in conns.values())
+    assert h2o.connection() is default_conn
+
+
+pyunit_utils.run_tests([
+    test_concurrent_requests_keep_counter_consistent,
+    test_session_id_is_issued_once,
+    test_connection_bound_to_local_context,
+])
@@ -0,0 +1,43 @@
+import sys
+sys.path.insert(1,"../../")
+import h2o
+from tests import pyunit_utils
+
+from h2o import H2OFrame
+from h2o.expr import ExprNode
+
+
+DEPTH = 10000
+
+
+def test_deep_expression_is_serialized():
+    fr = h2o.H2OFrame([[1, 2], [3, 4]])
+    res = fr
+    for i in range(DEPTH):
+        res = H2OFrame._expr(ExprNode("+", res, i % 7))
+    assert DEPTH > sys.getrecursionlimit()
+
+    ast = res._ex._get_ast_str(None)
+    assert ast.count("(+ ") == DEPTH, ast[:100]
+    assert ast.startswith("(+ " * DEPTH + fr.frame_id + " 0) 1)"), ast[:100]
+    assert "tmp=" not in ast
+    assert res._ex._debug_print(pprint=False).count("(+") == DEPTH
+
+
+def test_deep_expression_with_shared_subtree():
+    fr = h2o.H2OFrame([[1, 2], [3, 4]])
+    shared = fr * 2
+    res = shared
+    for _ in range(DEPTH):
+        res = H2OFrame._expr(ExprNode("+", res, shared))
+    ast = res._ex._get_ast_str(None)
+    tmp_id = shared._ex._cache._id
+    assert ast.count("(tmp= %s " % tmp_id) == 1
+    assert ast.count(tmp_id) == DEPTH + 1
+    assert res._ex._debug_print(pprint=False).count("(+") == DEPTH
+
+
+pyunit_utils.run_tests([
+    test_deep_expression_is_serialized,
+    test_deep_expression_with_shared_subtree,
+])
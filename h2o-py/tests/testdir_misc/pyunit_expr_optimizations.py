@@ -147,11 +147,158 @@ def test_skip_optimization():
     assert data.dim == [w, 6]
 
 
+def test_common_subexpression_elimination():
+    data = square_matrix(3)
+
+    def get_expr():
+        # (+ (* (cols_py data 0) 2) (* (cols_py data 0) 2))
+        return ExprNode("+", ExprNode("*", ExprNode("cols_py", data, 0), 2),
+                        ExprNode("*", ExprNode("cols_py", data, 0), 2))
+
+    (opt_expr, noopt_expr) = _assert_expr_results_eq(get_expr, skip_expr_assert=True)
+
+    assert opt_expr.arg(0) is opt_expr.arg(1), "Identical subtrees should be merged"
+    assert opt_expr.arg(0)._cache._id is not None, "The shared subtree should be computed once as a tmp"
+    assert noopt_expr.arg(0) is not noopt_expr.arg(1)
+    assert H2OFrame._expr(opt_expr).as_data_frame(use_pandas=False, header=False) == [['0'], ['0'], ['0']]
+
+
+def test_common_subexpression_elimination_keeps_random_ops():
+    data = square_matrix(3)
+    expr = ExprNode("cbind", ExprNode("h2o.runif", data, -1), ExprNode("h2o.runif", data, -1))
+    fr = H2OFrame._expr(expr)
+    assert fr.dim == [3, 2]
+    assert expr.arg(0) is not expr.arg(1)
+    assert fr[0].as_data_frame(use_pandas=False, header=False) != fr[1].as_data_frame(use_pandas=False, header=False)
+
+    y = data[0].asfactor()
+    splits = ExprNode("cbind", ExprNode("h2o.random_stratified_split", y, 0.5, -1),
+                      ExprNode("h2o.random_stratified_split", y, 0.5, -1))
+    assert H2OFrame._expr(splits).dim == [3, 2]
+    assert splits.arg(0) is not splits.arg(1), "Random splits should not be merged"
+
+
+def test_slice_fusion_cols_expr():
+    data = square_matrix(6)
+
+    def get_expr():
+        return ExprNode("cols_py", ExprNode("cols_py", data, [1, 3, 4, 5]), slice(1, 3, 1))
+
+    (expr, noopt_expr) = _assert_expr_results_eq(get_expr)
+
+    assert _collect_evaluated_ops(expr) == ["cols_py"], "Nested column selections should be fused"
+    assert len(_collect_evaluated_ops(noopt_expr)) == 2
+    assert expr.arg(0) == data._ex and expr.arg(1) == [3, 4]
+
+
+def test_slice_fusion_rows_expr():
+    data = square_matrix(10)
+
+    def get_expr():
+        return ExprNode("rows", ExprNode("rows", data, slice(2, 9, 1)), [0, 3, 5])
+
+    (expr, noopt_expr) = _assert_expr_results_eq(get_expr)
+
+    assert _collect_evaluated_ops(expr) == ["rows"], "Nested row selections should be fused"
+    assert len(_collect_evaluated_ops(noopt_expr)) == 2
+    assert expr.arg(0) == data._ex and expr.arg(1) == [2, 5, 7]
+
+
+def test_slice_fusion_rows_expr_negative():
+    data = square_matrix(10)
+
+    def get_expr():
+        # rows are returned in the order of the source frame: unsorted positions cannot be fused
+        return ExprNode("rows", ExprNode("rows", data, [7, 2, 5]), 0)
+
+    (expr, _) = _assert_expr_results_eq(get_expr, skip_expr_assert=True)
+
+    assert _collect_evaluated_ops(expr) == ["rows", "rows"]
+
+
+def test_slice_fusion():
+    assert h2o.is_expr_optimizations_enabled(), "Expression optimization needs to be enabled"
+
+    data = square_matrix(6)
+    cols = data[[1, 3, 4, 5]][1:3]
+    assert cols._ex._op == "cols_py" and cols._ex.arg(0) == data._ex
+    assert cols.as_data_frame(use_pandas=False) == data[[3, 4]].as_data_frame(use_pandas=False)
+
+    rows = data[1:6, :][0:2, :]
+    assert rows._ex._op == "rows" and rows._ex.arg(0) == data._ex
+    assert rows.as_data_frame(use_pandas=False) == data[1:3, :].as_data_frame(use_pandas=False)
+
+
+def test_filter_pushdown_expr():
+    data = H2OFrame(python_obj=[[1, 1, 1], [2, 1, 1], [3, 1, 1], [4, 1, 1]])
+
+    def get_expr():
+        return ExprNode("cols_py", ExprNode("rows", data, ExprNode(">", ExprNode("cols_py", data, 0), 2)), [1, 2])
+
+    (expr, noopt_expr) = _assert_expr_results_eq(get_expr)
+
+    assert expr._op == "rows" and expr.arg(0)._op == "cols_py", "The rows should be filtered after the projection"
+    assert expr.arg(0).arg(0) == data._ex and expr.arg(0).arg(1) == [1, 2]
+    assert len(_collect_evaluated_ops(expr)) == len(_collect_evaluated_ops(noopt_expr))
+    assert H2OFrame._expr(expr).dim == [2, 2]
+
+
+def test_unary_chain_expr():
+    data = H2OFrame(python_obj=[[-1.5], [2.25], [0.5], [-0.25]])
+
+    def get_expr():
+        return ExprNode("floor", ExprNode("ceiling", ExprNode("abs", ExprNode("abs", data))))
+
+    (expr, noopt_expr) = _assert_expr_results_eq(get_expr)
+
+    assert _collect_evaluated_ops(expr) == ["ceiling", "abs"], "No-op unary operators should be removed"
+    assert len(_collect_evaluated_ops(noopt_expr)) == 4
+
+
+def test_unary_chain():
+    assert h2o.is_expr_optimizations_enabled(), "Expression optimization needs to be enabled"
+
+    data = H2OFrame(python_obj=[[-1.5], [2.25], [0.5], [-0.25]])
+    res = data.abs().abs().sign()
+    assert _collect_evaluated_ops(res._ex) == ["sign", "abs"]
+    assert res.as_data_frame(use_pandas=False) == data.abs().sign().as_data_frame(use_pandas=False)
+
+
+def test_constant_folding_expr():
+    data = square_matrix(3)
+
+    def get_expr():
+        return ExprNode("*", data, ExprNode("+", 1, ExprNode("/", 1, 4)))
+
+    (expr, noopt_expr) = _assert_expr_results_eq(get_expr)
+
+    assert _collect_evaluated_ops(expr) == ["*"], "Constant arithmetic should be computed client-side"
+    assert len(_collect_evaluated_ops(noopt_expr)) == 3
+    assert expr.arg(1) == 1.25
+
+
+def test_constant_folding_expr_negative():
+    data = square_matrix(3)
+
+    def get_expr():
+        # not computed client-side: the backend returns infinity
+        return ExprNode("*", data, ExprNode("/", 1, 0))
+
+    (expr, _) = _assert_expr_results_eq(get_expr, skip_expr_assert=True)
+
+    assert _collect_evaluated_ops(expr) == ["*", "/"]
+
+
 def _collect_all_ops(e):
     return sum([_collect_all_ops(c) for c in e.args() if isinstance(c, ExprNode)],
                [e._op]) if e.args() else [e._op]
 
 
+def _collect_evaluated_ops(e):
+    # ops of the expression, without the source frames
+    return [op for op in _collect_all_ops(e) if op]
+
+
 #
 # Test fixtures
 #
@@ -168,7 +315,13 @@ __TESTS__ = [test_fold_optimization_append_expr, test_fold_optimization_cbind_ex
              test_fold_optimization_append, test_fold_optimization_cbind,
              test_fold_optimization_rbind_expr,
              test_skip_optimization_expr, test_skip_optimization_expr_negative,
-             test_skip_optimization]
+             test_skip_optimization,
+             test_common_subexpression_elimination, test_common_subexpression_elimination_keeps_random_ops,
+             test_slice_fusion_cols_expr, test_slice_fusion_rows_expr, test_slice_fusion_rows_expr_negative,
+             test_slice_fusion,
+             test_filter_pushdown_expr,
+             test_unary_chain_expr, test_unary_chain,
+             test_constant_folding_expr, test_constant_folding_expr_negative]
 
 if __name__ == "__main__":
     for func in __TESTS__:
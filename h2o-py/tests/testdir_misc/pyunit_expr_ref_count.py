@@ -0,0 +1,46 @@
+import sys
+sys.path.insert(1,"../../")
+import h2o
+from tests import pyunit_utils
+
+from h2o import H2OFrame
+from h2o.expr import ExprNode
+
+
+def test_tmp_created_only_for_shared_subexpressions():
+    fr = h2o.H2OFrame([[1, 2], [3, 4], [5, 6]])
+
+    # intermediate expressions referred to by their parent only are inlined
+    anonymous = (fr + 1) * 2 - 3
+    assert "tmp=" not in anonymous._ex._get_ast_str(None)
+
+    # an expression also held by the user is computed once into a tmp, then referred to by id
+    shared = fr + 1
+    res = H2OFrame._expr(ExprNode("+", ExprNode("*", shared, shared), shared))
+    ast = res._ex._get_ast_str(None)
+    tmp_id = shared._ex._cache._id
+    assert ast.count("(tmp= %s " % tmp_id) == 1, ast
+    assert ast.count(tmp_id) == 3, ast
+
+    # a frame reassigned to another expression no longer refers to the previous one
+    reassigned = fr * 3
+    reassigned = reassigned + 1
+    assert "tmp=" not in reassigned._ex._get_ast_str(None)
+
+
+def test_ref_count_independent_of_heap_size():
+    fr = h2o.H2OFrame([[1, 2], [3, 4]])
+    shared = fr.abs()
+    res = H2OFrame._expr(ExprNode("+", shared.log(), shared))
+    junk = [[i] for i in range(100000)]
+    assert shared._ex._ref_count() == 3  # `shared` frame, `log` node and `+` node
+    assert res._ex._ref_count() == 1
+    del res
+    assert shared._ex._ref_count() == 1
+    del junk
+
+
+pyunit_utils.run_tests([
+    test_tmp_created_only_for_shared_subexpressions,
+    test_ref_count_independent_of_heap_size,
+])
@@ -1,6 +1,7 @@
 #!/usr/bin/env python
 # -*- encoding: utf-8 -*-
 import h2o
+import numpy as np
 import pandas as pd
 from tests import pyunit_utils
 
@@ -29,7 +30,35 @@ def test_pandas_to_h2oframe():
     compare_frames(h2odf3, pddf)
 
 
-if __name__ == "__main__":
-    pyunit_utils.standalone_test(test_pandas_to_h2oframe)
-else:
-    test_pandas_to_h2oframe()
+def test_pandas_dtypes_to_h2oframe():
+    pddf = pd.DataFrame({"int": [1, 2, 3, 4],
+                         "real": [0.5, np.nan, 1e-20, 3.0],
+                         "cat": pd.Categorical(["10", "20", None, "10"]),
+                         "bool": [True, False, True, True],
+                         "str": ["a", None, "b,c", "d"],
+                         "time": pd.to_datetime(["2020-01-01 10:00:00", "2020-01-02", None, "2020-01-04"])})
+    fr = h2o.H2OFrame(pddf)
+    assert fr.shape == pddf.shape
+    assert fr.types == {"int": "int", "real": "real", "cat": "enum", "bool": "enum", "str": "enum", "time": "time"}, \
+        fr.types
+    assert fr["real"].isna().as_data_frame()["isNA(real)"].tolist() == [0, 1, 0, 0]
+    assert fr["real"][2, 0] == 1e-20
+    assert sorted(fr["cat"].levels()[0]) == ["10", "20"]
+    assert fr["cat"].isna()[2, 0] == 1
+    assert fr["str"][2, 0] == "b,c"
+    assert fr["time"].isna().sum() == 1
+
+    fr = h2o.H2OFrame(pddf, column_types={"cat": "numeric", "str": "string"})
+    assert fr.types["cat"] == "int" and fr.types["str"] == "string", fr.types
+
+    arr = np.arange(12.).reshape(4, 3)
+    fr = h2o.H2OFrame(arr)
+    assert fr.shape == (4, 3)
+    assert fr.columns == ["C1", "C2", "C3"]
+    assert (fr.as_data_frame().values == arr).all()
+
+
+pyunit_utils.run_tests([
+    test_pandas_to_h2oframe,
+    test_pandas_dtypes_to_h2oframe,
+])
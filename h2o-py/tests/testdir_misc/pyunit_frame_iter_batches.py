@@ -0,0 +1,37 @@
+import sys
+sys.path.insert(1,"../../")
+import math
+import h2o
+from tests import pyunit_utils
+
+
+def test_iter_batches():
+    prostate = h2o.import_file(pyunit_utils.locate("smalldata/prostate/prostate_cat.csv"))
+    prostate[0:10, "DPROS"] = None
+    df = prostate.as_data_frame()
+
+    batches = list(prostate.iter_batches(batch_rows=100))
+    assert [len(b) for b in batches] == [100, 100, 100, prostate.nrows - 300]
+    for i, batch in enumerate(batches):
+        assert list(batch.columns) == prostate.names
+        assert str(batch["DPROS"].dtype) == "category"
+        expected = df.iloc[i * 100:(i + 1) * 100]
+        assert (batch["DPROS"].isnull().values == expected["DPROS"].isnull().values).all()
+        assert (batch["AGE"].values == expected["AGE"].values).all()
+
+    # non-contiguous columns, without prefetching
+    rows = [row for batch in prostate.iter_batches(batch_rows=50, columns=["PSA", 1], as_="list", prefetch=False)
+            for row in batch]
+    assert len(rows) == prostate.nrows
+    assert rows[0] == [df["PSA"][0], df["AGE"][0]]
+    assert all(not isinstance(v, float) or not math.isnan(v) for row in rows for v in row)
+
+    arrays = list(prostate.iter_batches(batch_rows=200, columns=["AGE", "PSA", "VOL"], as_="numpy"))
+    assert [a.shape for a in arrays] == [(200, 3), (prostate.nrows - 200, 3)]
+    assert arrays[0].dtype == float
+
+
+if __name__ == "__main__":
+    pyunit_utils.standalone_test(test_iter_batches)
+else:
+    test_iter_batches()
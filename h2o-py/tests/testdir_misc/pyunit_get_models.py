@@ -0,0 +1,49 @@
+import sys
+sys.path.insert(1,"../../")
+import h2o
+from tests import pyunit_utils
+from h2o.estimators.gbm import H2OGradientBoostingEstimator
+from h2o.grid import H2OGridSearch
+
+
+def _train_grid():
+    cars = h2o.import_file(path=pyunit_utils.locate("smalldata/junit/cars_20mpg.csv"))
+    predictors = ["displacement", "power", "weight", "acceleration", "year"]
+    grid = H2OGridSearch(H2OGradientBoostingEstimator(nfolds=2, seed=1), hyper_params=dict(ntrees=[1, 2, 3, 4]))
+    grid.train(x=predictors, y="economy", training_frame=cars)
+    return grid
+
+
+def test_get_models():
+    grid = _train_grid()
+    model_ids = [m.model_id for m in grid.models]
+    conn = h2o.connection()
+    conn.stats().reset()
+    models = h2o.get_models(model_ids + model_ids[:2], max_workers=3)
+    assert conn.stats().as_dict()["GET /3/Models/{}"]["calls"] == len(model_ids), "each model should be fetched once"
+    assert [m.model_id for m in models] == model_ids + model_ids[:2]
+    assert models[0] is models[-2] and models[1] is models[-1]
+    for model, expected in zip(models, grid.models):
+        assert isinstance(model, H2OGradientBoostingEstimator)
+        assert model.rmse() == expected.rmse()
+        assert model.rmse(xval=True) == expected.rmse(xval=True)
+    assert [m.model_id for m in models[0].cross_validation_models()] == models[0]._xval_keys
+
+
+def test_get_grid():
+    grid = _train_grid()
+    conn = h2o.connection()
+    conn.stats().reset()
+    fetched = h2o.get_grid(grid.grid_id)
+    assert conn.stats().as_dict()["GET /3/Models/{}"]["calls"] == len(grid.models), \
+        "the first model should not be fetched twice"
+    assert [m.model_id for m in fetched.models] == [m.model_id for m in grid.models]
+    assert sorted(fetched.hyper_params["ntrees"]) == [1, 2, 3, 4]
+    sorted_grid = grid.get_grid(sort_by="rmse")
+    assert sorted(m.model_id for m in sorted_grid.models) == sorted(m.model_id for m in grid.models)
+
+
+pyunit_utils.run_tests([
+    test_get_models,
+    test_get_grid,
+])
@@ -39,6 +39,21 @@ def test_h2oconnectionconf():
     cconf4 = H2OConnectionConf(conf4)
     assert cconf4.url == 'https://localhost:54321/cluster_4'
 
+    # Verify connection pool settings
+    cconf5 = H2OConnectionConf({'ip': 'localhost', 'port': 54321})
+    assert cconf5.pool_size == 10
+    assert cconf5.keep_alive
+    assert cconf5.max_retries == 0
+    cconf6 = H2OConnectionConf({'ip': 'localhost', 'port': 54321, 'pool_size': 32, 'keep_alive': False, 'max_retries': 3})
+    assert cconf6.pool_size == 32
+    assert not cconf6.keep_alive
+    assert cconf6.max_retries == 3
+    try:
+        H2OConnectionConf({'pool_size': 0})
+        assert False, "pool_size must be positive"
+    except H2OValueError:
+        pass
+
     # Verify URL pattern
     assert_url_pattern("http://localhost:54321", "http", "localhost", "54321", None)
     assert_url_pattern("http://localhost:54322/", "http", "localhost", "54322", None)
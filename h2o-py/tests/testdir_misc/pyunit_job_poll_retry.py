@@ -17,23 +17,23 @@ def test_job_poll_retry():
     train = df.drop("ID")
     train['CAPSULE'] = train['CAPSULE'].asfactor()
 
-    def flaky_request(method, url, **kwargs):
+    def flaky_request(session, method, url, **kwargs):
         if method == "GET" and url.find("/3/Jobs/") != -1:
             global job_request_counter
             job_request_counter += 1
             if job_request_counter == 2:
                 raise H2OConnectionError("Simulated connection failure")
-        return requests.request_orig(method, url, **kwargs)
+        return requests.Session.request_orig(session, method, url, **kwargs)
 
     try:
-        requests.request_orig = requests.request
-        requests.request = flaky_request
+        requests.Session.request_orig = requests.Session.request
+        requests.Session.request = flaky_request
 
         my_gbm = H2OGradientBoostingEstimator(ntrees=500, learn_rate=0.0001)
         my_gbm.train(x=list(range(1, train.ncol)),
                      y="CAPSULE", training_frame=train)
     finally:
-        requests.request = requests.request_orig
+        requests.Session.request = requests.Session.request_orig
 
     global job_request_counter
     assert job_request_counter > 2
@@ -0,0 +1,49 @@
+import sys
+sys.path.insert(1,"../../")
+import h2o
+from h2o.estimators import H2OGradientBoostingEstimator
+from h2o.job import H2OJob
+from tests import pyunit_utils as pu
+
+
+def _start_models(n):
+    train = h2o.import_file(pu.locate("smalldata/logreg/prostate.csv"))
+    train["CAPSULE"] = train["CAPSULE"].asfactor()
+    models = [H2OGradientBoostingEstimator(ntrees=10 * (i + 1), seed=i) for i in range(n)]
+    for model in models:
+        model.start(["AGE", "RACE", "PSA", "GLEASON"], "CAPSULE", training_frame=train)
+    return models
+
+
+def test_wait_all_jobs():
+    models = _start_models(5)
+    jobs = [model._job for model in models]
+    completed = []
+    requests_before = h2o.connection().requests_count
+    done, not_done = H2OJob.wait_all(jobs, on_completion=completed.append)
+    polling_requests = h2o.connection().requests_count - requests_before
+    assert not not_done
+    assert sorted(j.job_key for j in done) == sorted(j.job_key for j in jobs)
+    assert sorted(j.job_key for j in completed) == sorted(j.job_key for j in jobs)
+    assert all(j.status == "DONE" for j in done)
+    print("%d jobs polled with %d requests" % (len(jobs), polling_requests))
+    for model in models:
+        model.join()
+        assert model.model_id is not None
+
+
+def test_wait_first_completed():
+    models = _start_models(3)
+    jobs = [model._job for model in models]
+    done, not_done = H2OJob.wait_all(jobs, return_when="FIRST_COMPLETED")
+    assert len(done) >= 1
+    assert len(done) + len(not_done) == len(jobs)
+    assert all(j.status == "DONE" for j in done)
+    for model in models:
+        model.join()
+
+
+pu.run_tests([
+    test_wait_all_jobs,
+    test_wait_first_completed
+])
@@ -0,0 +1,76 @@
+import sys
+sys.path.insert(1,"../../")
+import h2o
+from tests import pyunit_utils
+from h2o.estimators.gbm import H2OGradientBoostingEstimator
+from h2o.grid import H2OGridSearch
+from h2o.model import H2OLazyModel, MetricsBase
+
+
+def _models_calls():
+    return h2o.connection().stats().as_dict().get("GET /3/Models/{}", {}).get("calls", 0)
+
+
+def _train_gbm():
+    prostate = h2o.import_file(path=pyunit_utils.locate("smalldata/prostate/prostate.csv"))
+    prostate["CAPSULE"] = prostate["CAPSULE"].asfactor()
+    gbm = H2OGradientBoostingEstimator(ntrees=5, nfolds=2, seed=1)
+    gbm.train(x=["AGE", "RACE", "PSA", "GLEASON"], y="CAPSULE", training_frame=prostate)
+    return gbm
+
+
+def test_lazy_model_is_loaded_on_first_access():
+    gbm = _train_gbm()
+    h2o.connection().stats().reset()
+    model = h2o.get_model(gbm.model_id, lazy=True)
+    assert isinstance(model, H2OLazyModel)
+    assert model.model_id == gbm.model_id
+    assert model.key == gbm.model_id
+    assert _models_calls() == 0, "the model should not be loaded for its id"
+    assert model.auc() == gbm.auc()
+    assert isinstance(model, H2OGradientBoostingEstimator)
+    assert model.auc(xval=True) == gbm.auc(xval=True)
+    assert model.actual_params["ntrees"] == 5
+    assert _models_calls() == 1, "the model should be loaded only once"
+
+
+def test_lazy_models():
+    gbm = _train_gbm()
+    h2o.connection().stats().reset()
+    models = h2o.get_models([gbm.model_id, gbm.model_id], lazy=True)
+    assert models[0] is models[1]
+    assert _models_calls() == 0
+    models[0].materialize()
+    assert isinstance(models[1], H2OGradientBoostingEstimator)
+    assert _models_calls() == 1
+
+
+def test_metrics_built_on_access():
+    gbm = _train_gbm()
+    model = h2o.get_model(gbm.model_id)
+    output = model._model_json["output"]
+    assert "training_metrics" in output._metrics_classes
+    metrics = output["training_metrics"]
+    assert isinstance(metrics, MetricsBase)
+    assert output["training_metrics"] is metrics, "the metrics object should be built only once"
+    assert model._is_xvalidated
+    assert model.full_parameters["ntrees"]["actual_value"] == 5
+
+
+def test_sorted_grid_with_lazy_models():
+    cars = h2o.import_file(path=pyunit_utils.locate("smalldata/junit/cars_20mpg.csv"))
+    grid = H2OGridSearch(H2OGradientBoostingEstimator(seed=1), hyper_params=dict(ntrees=[1, 2, 3]))
+    grid.train(x=["displacement", "power", "weight"], y="economy", training_frame=cars)
+    h2o.connection().stats().reset()
+    sorted_grid = grid.get_grid(sort_by="rmse", lazy=True)
+    assert _models_calls() == 0, "the models of the grid should be reused"
+    rmses = [m.rmse() for m in sorted_grid.models]
+    assert rmses == sorted(rmses)
+
+
+pyunit_utils.run_tests([
+    test_lazy_model_is_loaded_on_first_access,
+    test_lazy_models,
+    test_metrics_built_on_access,
+    test_sorted_grid_with_lazy_models,
+])
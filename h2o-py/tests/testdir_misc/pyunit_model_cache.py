@@ -0,0 +1,70 @@
+import sys
+sys.path.insert(1,"../../")
+import os
+import shutil
+import tempfile
+
+import h2o
+from tests import pyunit_utils
+from h2o.estimators.gbm import H2OGradientBoostingEstimator
+
+
+def _train_gbm(ntrees):
+    prostate = h2o.import_file(path=pyunit_utils.locate("smalldata/prostate/prostate.csv"))
+    gbm = H2OGradientBoostingEstimator(model_id="model_cache_gbm", ntrees=ntrees, seed=1)
+    gbm.train(x=["AGE", "RACE", "GLEASON"], y="PSA", training_frame=prostate)
+    return gbm
+
+
+def _with_model_cache(test):
+    def wrapped():
+        directory = tempfile.mkdtemp()
+        h2o.enable_model_cache(True, directory=directory)
+        try:
+            test(directory)
+        finally:
+            h2o.enable_model_cache(False, max_size=1 << 30)
+            shutil.rmtree(directory)
+    wrapped.__name__ = test.__name__
+    return wrapped
+
+
+@_with_model_cache
+def test_model_json_is_cached(directory):
+    gbm = _train_gbm(ntrees=3)
+    stats = h2o.model_cache_stats()
+    model = h2o.get_model(gbm.model_id)
+    assert h2o.model_cache_stats()["misses"] == stats["misses"] + 1
+    assert len(os.listdir(directory)) == 1
+    cached = h2o.get_model(gbm.model_id)
+    assert h2o.model_cache_stats()["hits"] == stats["hits"] + 1
+    assert cached.rmse() == model.rmse() == gbm.rmse()
+    assert cached.actual_params["ntrees"] == 3
+
+
+@_with_model_cache
+def test_stale_entry_is_refetched(directory):
+    _train_gbm(ntrees=3)
+    assert h2o.get_model("model_cache_gbm").actual_params["ntrees"] == 3
+    gbm = _train_gbm(ntrees=5)
+    model = h2o.get_model("model_cache_gbm")
+    assert model.actual_params["ntrees"] == 5
+    assert model.rmse() == gbm.rmse()
+    assert h2o.model_cache_stats()["size"] == 1, "the stale entry should be replaced"
+
+
+@_with_model_cache
+def test_cache_size_limit(directory):
+    _train_gbm(ntrees=3)
+    h2o.get_model("model_cache_gbm")
+    h2o.enable_model_cache(True, max_size=1)
+    h2o.clear_model_cache()
+    h2o.get_model("model_cache_gbm")
+    assert h2o.model_cache_stats()["size"] == 0, "an entry larger than the cache should be evicted"
+
+
+pyunit_utils.run_tests([
+    test_model_json_is_cached,
+    test_stale_entry_is_refetched,
+    test_cache_size_limit,
+])
@@ -0,0 +1,115 @@
+import sys
+sys.path.insert(1,"../../")
+import h2o
+from tests import pyunit_utils
+
+
+def _rapids_requests_count(fn):
+    conn = h2o.connection()
+    count_before = conn.requests_count
+    result = fn()
+    return result, conn.requests_count - count_before
+
+
+def test_summaries_are_cached():
+    h2o.enable_scalar_result_cache(True)
+    try:
+        fr = h2o.H2OFrame([[1, 2], [3, 4], [5, 6]])
+        stats_before = h2o.scalar_result_cache_stats()
+        mean, count = _rapids_requests_count(lambda: fr[0].mean()[0])
+        assert mean == 3.0 and count == 1, (mean, count)
+        mean, count = _rapids_requests_count(lambda: fr[0].mean()[0])
+        assert mean == 3.0 and count == 0, (mean, count)
+        nacnt, count = _rapids_requests_count(lambda: fr.nacnt())
+        nacnt, count = _rapids_requests_count(lambda: fr.nacnt())
+        assert nacnt == [0, 0] and count == 0, (nacnt, count)
+        stats = h2o.scalar_result_cache_stats()
+        assert stats["hits"] - stats_before["hits"] == 2, stats
+    finally:
+        h2o.enable_scalar_result_cache(False)
+
+
+def test_cache_invalidated_by_frame_update():
+    h2o.enable_scalar_result_cache(True)
+    try:
+        fr = h2o.H2OFrame([[1, 2], [3, 4], [5, 6]])
+        assert fr.max() == 6
+        fr[0, 1] = 10
+        assert fr.max() == 10
+        fr.set_names(["a", "b"])
+        assert fr["b"].max() == 10
+        fr["b"] = fr["b"] * 2
+        assert fr["b"].max() == 20
+    finally:
+        h2o.enable_scalar_result_cache(False)
+
+
+def test_cache_invalidated_by_in_place_mutators():
+    h2o.enable_scalar_result_cache(True)
+    try:
+        fr = h2o.H2OFrame([[1.0], [2.0], [3.0], [None]])
+        assert fr.nacnt() == [1]
+        fr.impute(0, method="mean")
+        assert fr.nacnt() == [0]
+        assert fr[0].mean(na_rm=True)[0] == 2.0
+        fr.insert_missing_values(fraction=1.0, seed=1)
+        assert fr.nacnt() == [4]
+        assert fr[0].mean(na_rm=True)[0] != 2.0
+    finally:
+        h2o.enable_scalar_result_cache(False)
+
+
+def test_cache_invalidated_by_key_reassignment():
+    h2o.enable_scalar_result_cache(True)
+    try:
+        fr = h2o.assign(h2o.H2OFrame([[1], [2]]), "scalar_cache_fr")
+        assert fr.sum() == 3
+        h2o.assign(h2o.H2OFrame([[5], [7]]), "scalar_cache_fr")
+        assert h2o.get_frame("scalar_cache_fr").sum() == 12
+    finally:
+        h2o.enable_scalar_result_cache(False)
+
+
+def test_levels_are_cached():
+    h2o.enable_scalar_result_cache(True)
+    try:
+        fr = h2o.H2OFrame([["a"], ["b"], ["a"]], column_types=["enum"])
+        levels, count = _rapids_requests_count(fr.levels)
+        levels_again, count_again = _rapids_requests_count(fr.levels)
+        assert levels == levels_again == [["a", "b"]], (levels, levels_again)
+        assert count > 0 and count_again == 0, (count, count_again)
+    finally:
+        h2o.enable_scalar_result_cache(False)
+
+
+def test_random_results_are_not_cached():
+    h2o.enable_scalar_result_cache(True)
+    try:
+        fr = h2o.H2OFrame([[1]] * 100)
+        stats_before = h2o.scalar_result_cache_stats()
+        means = set(fr.runif().mean()[0] for _ in range(3))
+        assert len(means) > 1, means
+        stats = h2o.scalar_result_cache_stats()
+        assert stats["hits"] == stats_before["hits"], stats
+    finally:
+        h2o.enable_scalar_result_cache(False)
+
+
+def test_cache_disabled_by_default():
+    h2o.enable_scalar_result_cache(False)
+    fr = h2o.H2OFrame([[1, 2], [3, 4]])
+    fr.mean()
+    _, count = _rapids_requests_count(fr.mean)
+    assert count == 1, count
+    assert h2o.scalar_result_cache_stats()["size"] == 0
+
+
+pyunit_utils.run_tests([
+    test_summaries_are_cached,
+    test_cache_invalidated_by_frame_update,
+    test_cache_invalidated_by_in_place_mutators,
+    test_cache_invalidated_by_key_reassignment,
+    test_levels_are_cached,
+    test_random_results_are_not_cached,
+    test_cache_disabled_by_default,
+])
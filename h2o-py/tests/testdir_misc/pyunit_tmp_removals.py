@@ -0,0 +1,62 @@
+import sys
+sys.path.insert(1,"../../")
+import gc
+import h2o
+from tests import pyunit_utils
+
+
+def _create_tmps(fr, n):
+    tmp_ids = []
+    for i in range(n):
+        tmp = fr + i
+        tmp_ids.append(tmp.frame_id)  # forces the evaluation of the expression into a tmp frame
+    del tmp
+    gc.collect()
+    return tmp_ids
+
+
+def _existing_keys():
+    return set(h2o.ls()["key"].tolist())
+
+
+def test_tmp_frames_removed_in_batches():
+    fr = h2o.H2OFrame([[1], [2], [3]])
+    try:
+        h2o.enable_deferred_tmp_removal(True, batch_size=1000, max_delay=3600)
+        tmp_ids = _create_tmps(fr, 20)
+        assert set(tmp_ids) <= _existing_keys(), "tmp frames should be kept until the next flush"
+
+        conn = h2o.connection()
+        requests_count = conn.requests_count
+        h2o.flush_tmp_removals()
+        assert conn.requests_count - requests_count == 1, "tmp frames should be removed in a single request"
+        assert not set(tmp_ids) & _existing_keys()
+    finally:
+        h2o.enable_deferred_tmp_removal(True, batch_size=100, max_delay=5)
+
+
+def test_tmp_frames_flushed_when_batch_is_full():
+    fr = h2o.H2OFrame([[1], [2], [3]])
+    try:
+        h2o.enable_deferred_tmp_removal(True, batch_size=10, max_delay=3600)
+        tmp_ids = _create_tmps(fr, 10)
+        assert not set(tmp_ids) & _existing_keys(), "tmp frames should be removed at the next Rapids request"
+    finally:
+        h2o.enable_deferred_tmp_removal(True, batch_size=100, max_delay=5)
+
+
+def test_immediate_tmp_removal():
+    fr = h2o.H2OFrame([[1], [2], [3]])
+    try:
+        h2o.enable_deferred_tmp_removal(False)
+        tmp_ids = _create_tmps(fr, 5)
+        assert not set(tmp_ids) & _existing_keys()
+    finally:
+        h2o.enable_deferred_tmp_removal(True)
+
+
+pyunit_utils.run_tests([
+    test_tmp_frames_removed_in_batches,
+    test_tmp_frames_flushed_when_batch_is_full,
+    test_immediate_tmp_removal,
+])
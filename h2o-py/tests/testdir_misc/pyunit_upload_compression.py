@@ -0,0 +1,61 @@
+import sys
+sys.path.insert(1,"../../")
+import os
+import tempfile
+
+import h2o
+from tests import pyunit_utils
+
+
+def _write_csv(n_rows):
+    path = os.path.join(tempfile.mkdtemp(), "data.csv")
+    with open(path, "w") as f:
+        f.write("id,value,category\n")
+        for i in range(n_rows):
+            f.write("%d,%.3f,c%d\n" % (i, i / 7.0, i % 13))
+    return path
+
+
+def _upload(path, level):
+    conn = h2o.connection()
+    level_before, threshold_before = conn.upload_compression_level, conn.upload_compression_threshold
+    conn.upload_compression_level = level
+    conn.upload_compression_threshold = 0
+    conn.stats().reset()
+    try:
+        fr = h2o.upload_file(path)
+    finally:
+        conn.upload_compression_level = level_before
+        conn.upload_compression_threshold = threshold_before
+    return fr, conn.stats().as_dict()["POST /3/PostFile"]["request_bytes"]
+
+
+def test_compressed_upload():
+    path = _write_csv(20000)
+    fr, sent = _upload(path, level=6)
+    expected, sent_uncompressed = _upload(path, level=None)
+    assert sent_uncompressed == os.path.getsize(path)
+    assert sent * 3 < sent_uncompressed, (sent, sent_uncompressed)
+    assert fr.names == expected.names == ["id", "value", "category"]
+    assert fr.shape == expected.shape == (20000, 3)
+    assert fr.types == expected.types
+    assert (fr["id"] == expected["id"]).all()
+
+
+def test_compressed_python_object_upload():
+    conn = h2o.connection()
+    conn.upload_compression_level = 1
+    conn.upload_compression_threshold = 0
+    try:
+        fr = h2o.H2OFrame({"a": list(range(1000)), "b": ["x%d" % (i % 7) for i in range(1000)]})
+    finally:
+        conn.upload_compression_level = None
+        conn.upload_compression_threshold = 1 << 20
+    assert fr.shape == (1000, 2)
+    assert fr["a"].sum() == sum(range(1000))
+
+
+pyunit_utils.run_tests([
+    test_compressed_upload,
+    test_compressed_python_object_upload,
+])
@@ -0,0 +1,56 @@
+import sys
+sys.path.insert(1,"../../")
+import gzip
+import os
+import shutil
+import tempfile
+
+import h2o
+from tests import pyunit_utils
+
+
+def _write_csv(n_rows, multiline_every=None):
+    path = os.path.join(tempfile.mkdtemp(), "data.csv")
+    with open(path, "w") as f:
+        f.write("id,value,category\n")
+        for i in range(n_rows):
+            if multiline_every and i % multiline_every == 0:
+                f.write('%d,%.3f,"c%d\nspanning ""several""\nlines"\n' % (i, i / 7.0, i % 13))
+            else:
+                f.write("%d,%.3f,c%d\n" % (i, i / 7.0, i % 13))
+    return path
+
+
+def test_upload_in_parts():
+    path = _write_csv(50000)
+    fr = h2o.upload_file(path, part_size=100000)
+    expected = h2o.upload_file(path)
+    assert fr.names == ["id", "value", "category"], fr.names
+    assert fr.shape == expected.shape == (50000, 3), (fr.shape, expected.shape)
+    assert fr.types == expected.types, (fr.types, expected.types)
+    assert (fr["id"] == expected["id"]).all(), "rows should keep the order of the file"
+    assert fr["value"].sum() == expected["value"].sum()
+
+
+def test_quoted_values_are_not_split():
+    path = _write_csv(20000, multiline_every=3)
+    fr = h2o.upload_file(path, part_size=10000, col_types=["int", "real", "string"])
+    expected = h2o.upload_file(path, col_types=["int", "real", "string"])
+    assert fr.shape == expected.shape == (20000, 3), (fr.shape, expected.shape)
+    assert (fr["id"] == expected["id"]).all()
+    assert fr[3, "category"] == expected[3, "category"] == 'c3\nspanning "several"\nlines'
+
+
+def test_compressed_file_uploaded_in_one_part():
+    path = _write_csv(1000)
+    with open(path, "rb") as f_in, gzip.open(path + ".gz", "wb") as f_out:
+        shutil.copyfileobj(f_in, f_out)
+    fr = h2o.upload_file(path + ".gz", part_size=100)
+    assert fr.shape == (1000, 3), fr.shape
+
+
+pyunit_utils.run_tests([
+    test_upload_in_parts,
+    test_quoted_values_are_not_split,
+    test_compressed_file_uploaded_in_one_part,
+])
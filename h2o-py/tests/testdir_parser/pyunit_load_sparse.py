@@ -36,6 +36,13 @@ def test_load_sparse():
     assert fr.as_data_frame(False) == [['C1', 'C2', 'C3', 'C4'], ['3', '0', '1', '0'], ['0', '2', '0', '0'],
                                        ['0', '0', '0', '0'], ['0', '0', '0', '1']]
 
+    C = sp.csc_matrix(B)
+    C[2, 1] = 0  # explicit zero
+    fr = h2o.H2OFrame(C)
+    assert fr.shape == (4, 4)
+    assert fr.as_data_frame(False) == [['C1', 'C2', 'C3', 'C4'], ['3', '0', '1', '0'], ['0', '2', '0', '0'],
+                                       ['0', '0', '0', '0'], ['0', '0', '0', '1']]
+
 if __name__ == "__main__":
     pyunit_utils.standalone_test(test_load_sparse)
 else: